@@ -0,0 +1,4 @@
+import os
+
+# Keep benchmark runs out of the pipeline's log file
+os.environ["SPAREROOM_LOG_PATH"] = ""
@@ -0,0 +1,110 @@
+"""Compare the memory held by a large listing history in each room representation.
+
+Builds the same synthetic rooms as a list of Room, a list of CompactRoom and a
+RoomTable, and reports the memory each holds once built. Run from the project root:
+
+    python -m benchmarks.bench_room_memory                # 500k rooms
+    python -m benchmarks.bench_room_memory --rooms 50000
+
+Strings are copied for every room, as they are when listings are scraped or
+unpickled, so interning and categorical columns get no head start. Memory comes
+from tracemalloc, which counts everything here since none of it lives in C.
+"""
+import argparse
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+from typing import Callable, Iterator
+
+from src.utils.types import Room, CompactRoom
+from src.utils.RoomTable import RoomTable
+
+AREAS = [f"Area {i}" for i in range(120)]
+STATIONS = [f"Station {i}" for i in range(300)]
+TYPES = ["Flat share", "House share"]
+POSTER_TYPES = ["Live in landlord", "Live out landlord", "Current flatmate", "Agent"]
+TERMS = ["None", "3 months", "6 months", "12 months"]
+
+
+def fresh(s: str) -> str:
+    """An equal but separate copy of `s`"""
+    return s.encode().decode()
+
+
+def synthetic_rooms(n: int, seed: int = 0) -> Iterator[Room]:
+    rng = random.Random(seed)
+    start = date(2024, 1, 1)
+    for i in range(n):
+        room_id = str(10_000_000 + i)
+        yield Room(
+            status=fresh(rng.choice(["", "", "", "FAVOURITE", "MESSAGED"])),
+            url=f"https://www.spareroom.co.uk/flatshare/flatshare_detail.pl?flatshare_id={room_id}&search_id=1",
+            id=room_id,
+            date_added=start + timedelta(days=rng.randrange(700)),
+            type=fresh(rng.choice(TYPES)),
+            area=fresh(rng.choice(AREAS)),
+            nearest_station=fresh(rng.choice(STATIONS)),
+            available_all_week=True,
+            direct_line_to_office=rng.random() < 0.3,
+            location=f"{51.3 + rng.random() * 0.4:.6f}, {-0.5 + rng.random() * 0.7:.6f}",
+            location_1=f"{rng.randrange(10, 90)} mins",
+            location_2=f"{rng.randrange(10, 90)} mins",
+            average_price=rng.randrange(500, 1200),
+            average_deposit=rng.randrange(500, 1500) + rng.choice([0, 0.5]),
+            available=fresh("Now"),
+            minimum_term=fresh(rng.choice(TERMS)),
+            maximum_term=fresh(rng.choice(TERMS)),
+            bills_included=rng.random() < 0.5,
+            broadband_included=rng.random() < 0.5,
+            furnishings=rng.random() < 0.8,
+            garden_or_patio=rng.random() < 0.4,
+            living_room=rng.random() < 0.6,
+            balcony_or_roof_terrace=fresh(rng.choice(["Yes", "No"])),
+            number_of_flatmates=rng.randrange(1, 6),
+            total_number_of_rooms=rng.randrange(2, 7),
+            room_sizes=[fresh("double"), fresh(rng.choice(["double", "single"]))],
+            score=round(rng.random() * 40, 1),
+            image_url=f"https://photos2.spareroom.co.uk/images/flatshare/listings/large/{room_id}.jpg",
+            poster_type=fresh(rng.choice(POSTER_TYPES)),
+            collective_word_count=rng.randrange(8),
+        )
+
+
+def measure(build: Callable[[Iterator[Room]], object], n: int) -> tuple[float, float]:
+    """Return (MiB held once built, seconds to build)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    started = time.perf_counter()
+    result = build(synthetic_rooms(n))
+    elapsed = time.perf_counter() - started
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del result
+    return held / 2**20, elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rooms", type=int, default=500_000)
+    args = parser.parse_args()
+
+    cases: dict[str, Callable[[Iterator[Room]], object]] = {
+        "list[Room]": list,
+        "list[CompactRoom]": lambda rooms: [CompactRoom.from_room(room) for room in rooms],
+        "RoomTable": RoomTable.from_rooms,
+    }
+
+    print(f"{args.rooms} rooms")
+    print(f"{'representation':<20} {'MiB':>9} {'bytes/room':>11} {'build s':>8}")
+    for name, build in cases.items():
+        mib, seconds = measure(build, args.rooms)
+        print(f"{name:<20} {mib:9.1f} {mib * 2**20 / args.rooms:11.0f} {seconds:8.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
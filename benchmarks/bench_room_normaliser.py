@@ -0,0 +1,92 @@
+"""Benchmark RoomNormaliser over scraped fixture listings and synthetic room data.
+
+The fixture listings in tests/fixtures are scraped once, and the synthetic rooms
+vary prices, deposits and field values the way real listings do, so the field
+name and value lookups see realistic repetition. Run from the project root:
+
+    python -m benchmarks.bench_room_normaliser
+    python -m benchmarks.bench_room_normaliser --rooms 200000
+
+Each room dict is copied before timing, since normalise updates it in place.
+"""
+import argparse
+import copy
+import logging
+import random
+import time
+from pathlib import Path
+
+from src.processing.RoomNormaliser import RoomNormaliser
+from src.scraping.LxmlRoomScraper import LxmlRoomScraper
+
+FIXTURES = Path("tests/fixtures")
+URL = "https://www.spareroom.co.uk/flatshare/flatshare_detail.pl?flatshare_id=10000001&search_id=1"
+LISTINGS = ["listing_double_room.html", "listing_part_week.html", "listing_expired.html"]
+
+YES_NO = ["Yes", "No"]
+FURNISHINGS = ["Furnished", "Unfurnished", "Part furnished"]
+
+
+def fixture_rooms() -> list[dict]:
+    return [
+        LxmlRoomScraper(page=None, url=URL, html=(FIXTURES / name).read_text()).scrape_data()
+        for name in LISTINGS
+    ]
+
+
+def synthetic_rooms(n: int, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    rooms = []
+    for i in range(n):
+        room = {"url": f"flatshare/{i}", "id": str(i), "area": f"Area {rng.randrange(120)}"}
+        for _ in range(rng.randint(1, 4)):
+            period = rng.choice(["pcm", "pw"])
+            price = rng.randrange(150, 300, 5) if period == "pw" else rng.randrange(600, 1300, 25)
+            room[f"£{price:,}_{period}"] = rng.choice(["(double)", "(single)", "(double)(NOW LET)"])
+        room["deposit"] = f"£{rng.randrange(500, 2000, 50):,}.00"
+        room["bills_included?"] = rng.choice(YES_NO + ["Some"])
+        room["furnishings"] = rng.choice(FURNISHINGS)
+        room["garden/patio"] = rng.choice(YES_NO)
+        room["balcony/roof_terrace"] = rng.choice(YES_NO)
+        room["broadband_included"] = rng.choice(YES_NO)
+        room["living_room"] = rng.choice(["shared", "No"])
+        room[rng.choice(["#_flatmates", "#_housemates"])] = str(rng.randint(1, 6))
+        room["total_#_rooms"] = str(rng.randint(2, 7))
+        rooms.append(room)
+    return rooms
+
+
+def measure(rooms: list[dict], repeats: int) -> float:
+    """Best rooms/sec over `repeats` runs of normalise_batch"""
+    best = float("inf")
+    normaliser = RoomNormaliser()
+    for _ in range(repeats):
+        batch = copy.deepcopy(rooms)
+        start = time.perf_counter()
+        normaliser.normalise_batch(batch)
+        best = min(best, time.perf_counter() - start)
+    return len(rooms) / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rooms", type=int, default=50_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    # Part-furnished rooms and the like are logged as unexpected values
+    logging.disable(logging.WARNING)
+
+    fixtures = fixture_rooms()
+    cases = {
+        "fixtures": [dict(fixtures[i % len(fixtures)]) for i in range(args.rooms)],
+        "synthetic": synthetic_rooms(args.rooms),
+    }
+
+    print(f"{'case':<10} {'rooms':>8} {'rooms/s':>10}")
+    for name, rooms in cases.items():
+        print(f"{name:<10} {len(rooms):>8} {measure(rooms, args.repeats):>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
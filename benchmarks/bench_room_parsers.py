@@ -0,0 +1,129 @@
+"""Benchmark the page parsers over the offline fixture corpus in tests/fixtures.
+
+Reports pages/sec, p50/p99 parse latency and peak allocated memory for each case.
+Run from the project root:
+
+    python -m benchmarks.bench_room_parsers                  # report only
+    python -m benchmarks.bench_room_parsers --check          # fail on regression
+    python -m benchmarks.bench_room_parsers --save-baseline  # record this machine's numbers
+
+--check exits non-zero when a case's throughput falls more than --threshold below
+benchmarks/baseline.json. Baselines only mean something on the machine they were
+recorded on, so the file isn't committed: save one locally before making a change,
+then check against it afterwards.
+
+Memory comes from tracemalloc, which only sees Python allocations, so it
+understates lxml's tree (held in C memory) but fully counts BeautifulSoup's.
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+from src.scraping.LxmlRoomScraper import ROOM_SCRAPERS
+from src.scraping.SpareRoomScraper import SpareRoomScraper
+from src.scraping.ExpiryChecker import parse_sidebar_html
+
+FIXTURES = Path("tests/fixtures")
+BASELINE = Path("benchmarks/baseline.json")
+URL = "https://www.spareroom.co.uk/flatshare/flatshare_detail.pl?flatshare_id=10000001&search_id=1"
+
+LISTINGS = ["listing_double_room.html", "listing_part_week.html", "listing_expired.html"]
+SEARCH_RESULTS = ["search_results.html"]
+
+
+def build_cases() -> dict[str, tuple[Callable[[str], object], list[str]]]:
+    """Map case name -> (parse function, HTML pages to run it over)"""
+    listings = [(FIXTURES / name).read_text() for name in LISTINGS]
+    results = [(FIXTURES / name).read_text() for name in SEARCH_RESULTS]
+
+    cases: dict[str, tuple[Callable[[str], object], list[str]]] = {}
+    for name, scraper_cls in ROOM_SCRAPERS.items():
+        cases[f"scrape_data[{name}]"] = (
+            lambda html, cls=scraper_cls: cls(page=None, url=URL, html=html).scrape_data(), listings
+        )
+        cases[f"parse_sidebar[{name}]"] = (
+            lambda html, cls=scraper_cls: cls(page=None, url=URL, html=html).parse_sidebar(), listings
+        )
+    cases["parse_sidebar[regex]"] = (parse_sidebar_html, listings)
+    cases["parse_room_urls"] = (SpareRoomScraper.parse_room_urls, results)
+    return cases
+
+
+def measure(parse: Callable[[str], object], pages: list[str], iterations: int) -> dict[str, float]:
+    # Warm up imports and caches
+    for html in pages:
+        parse(html)
+
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        for html in pages:
+            start = time.perf_counter()
+            parse(html)
+            latencies.append(time.perf_counter() - start)
+    elapsed = time.perf_counter() - started
+
+    peaks = []
+    for html in pages:
+        tracemalloc.start()
+        parse(html)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    latencies.sort()
+    p50 = statistics.median(latencies)
+    return {
+        "pages_per_sec": len(latencies) / elapsed,
+        "p50_ms": p50 * 1000,
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+        "peak_kib": max(peaks) / 1024,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--check", action="store_true")
+    parser.add_argument("--threshold", type=float, default=0.3)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args()
+
+    results = {}
+    print(f"{'case':<22} {'pages/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'peak KiB':>9}")
+    for name, (parse, pages) in build_cases().items():
+        r = results[name] = measure(parse, pages, args.iterations)
+        print(
+            f"{name:<22} {r['pages_per_sec']:9.1f} {r['p50_ms']:8.3f} {r['p99_ms']:8.3f} "
+            f"{r['peak_kib']:9.1f}"
+        )
+
+    if args.save_baseline:
+        BASELINE.write_text(json.dumps(results, indent=2))
+        print(f"Saved baseline to {BASELINE}")
+
+    if args.check:
+        if not BASELINE.exists():
+            print(f"No baseline at {BASELINE}, record one with --save-baseline first")
+            return 1
+        baseline = json.loads(BASELINE.read_text())
+        regressions = [
+            f"{name}: {results[name]['pages_per_sec']:.1f} pages/s vs baseline {base['pages_per_sec']:.1f}"
+            for name, base in baseline.items()
+            if name in results and results[name]["pages_per_sec"] < base["pages_per_sec"] * (1 - args.threshold)
+        ]
+        if regressions:
+            print("Throughput regressed by more than {:.0%}:".format(args.threshold))
+            print("\n".join(regressions))
+            return 1
+        print("No throughput regressions.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
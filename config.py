@@ -10,7 +10,41 @@ CONFIG = {
     "favourite_ids_path": "data/favourite_ids.json",
     "messaged_ids_path": "data/messaged_ids.json",
     "domain": "https://www.spareroom.co.uk",
-    "update_database_only": False 
+    "update_database_only": False,
+    "scrape_workers": 1,
+    "fetch_engine": "playwright",
+    "parser": "lxml",
+    "parallel_pagination": False,
+    "pagination_workers": 4,
+    "incremental": False,
+    "stop_after_known_pages": 1,
+    "stop_after_known_listings": 0,
+    "expiry_max_age_hours": 24,
+    "expiry_workers": 4,
+    "expiry_request_budget": 0,
+    "expiry_time_budget_seconds": 0,
+    "html_cache_enabled": True,
+    "html_cache_path": "data/html_cache",
+    "html_cache_max_mb": 500,
+    "checkpoint_path": "data/checkpoint.log",
+    "room_attempts": 2,
+    "search_method": "url",
+    "location": "London",
+    "double_room_only": True,
+    "whole_week_only": True,
+    "photos_only": True,
+    "private_landlords_only": True,
+    "min_term_months": 6,
+    "browser_mode": "launch",
+    "browser_profile_path": "data/browser_profile",
+    "storage_state_path": None,
+    "cdp_port": 9222,
+    "database_backend": "sqlite",
+    "sqlite_path": "data/rooms.sqlite3",
+    "parquet_path": "data/rooms.parquet",
+    "map_path": "output/map.html",
+    "export_state_path": "data/export_state.json",
+    "what_if_top_k": 10
 }
 
 IGNORE_KEYWORDS = [
@@ -48,8 +82,62 @@ SCORE_WEIGHTINGS = {
     "preferable_poster_type": 1 
 }
 
+# Alternative scorings compared with the current one by `python main.py --what_if`. Each profile
+# overrides some SCORE_WEIGHTINGS under "weightings" and/or the (min, max) bounds of range
+# metrics such as location_1 under "ranges"
+WEIGHT_PROFILES = {
+    "commute_first": {"weightings": {"location_1": 12, "location_2": 10}},
+    "budget": {"weightings": {"average_price": 12, "bills_included": 6}},
+    "short_commute": {"ranges": {"location_1": (15, 40), "location_2": (15, 40)}},
+}
+
+# Station data used to recognise each room's nearest station. A room is marked
+# direct_line_to_office when its station is on one of the target lines of a destination
+# (L1/L2 in .env); line names are the keys of "lines" in the stations file. When the scraped
+# station isn't recognised, the closest station by coordinates is used if it's at most
+# max_walk_minutes away
+STATIONS = {
+    "path": "assets/stations.json",
+    "min_similarity": 0.75,
+    "nearby_count": 3,
+    "max_walk_minutes": 15,
+    "target_lines": {
+        "location_1": ["jubilee", "elizabeth"],
+        "location_2": ["jubilee", "elizabeth"],
+    },
+}
+
 MAP_SETTINGS = {
     "show_favourites": True,
     "show_new_listings": True,
     "min_score": 15,
-}
\ No newline at end of file
+    "clustered": True,
+}
+
+REQUEST_BLOCKING = {
+    "enabled": True,
+    "resource_types": ["image", "media", "font", "stylesheet"],
+    "domains": [
+        "google-analytics.com",
+        "googletagmanager.com",
+        "googlesyndication.com",
+        "doubleclick.net",
+        "adservice.google.com",
+        "facebook.net",
+        "hotjar.com",
+        "criteo.com",
+        "amazon-adsystem.com",
+    ],
+}
+
+RATE_LIMIT = {
+    "requests_per_second": 2.0,
+    "burst": 4,
+    "min_concurrency": 1,
+    "max_concurrency": 8,
+    "target_latency_seconds": 3.0,
+    "max_retries": 3,
+    "backoff_seconds": 1.0,
+    "max_backoff_seconds": 30.0,
+    "timeout_seconds": 10.0
+}
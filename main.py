@@ -10,6 +10,15 @@ def main():
     parser.add_argument("--number_of_pages", type=int)
     parser.add_argument("--check_for_expired_rooms", action="store_true")
     parser.add_argument("--update_database_only", action="store_true")
+    parser.add_argument("--scrape_workers", type=int)
+    parser.add_argument("--fetch_engine", choices=["playwright", "http"])
+    parser.add_argument("--parallel_pagination", action="store_true")
+    parser.add_argument("--incremental", action="store_true")
+    parser.add_argument("--reprocess", action="store_true")
+    parser.add_argument("--serve_browser", action="store_true")
+    parser.add_argument("--rescore", action="store_true")
+    parser.add_argument("--what_if", nargs="*", metavar="PROFILE")
+    parser.add_argument("--top_k", type=int)
     args = parser.parse_args()
 
     logger.info("STARTING PROGRAM")
@@ -24,11 +33,42 @@ def main():
         print(f"{args.check_for_expired_rooms=}")
         config.check_for_expired_rooms = True
 
+    if args.scrape_workers is not None:
+        print(f"{args.scrape_workers=}")
+        config.scrape_workers = args.scrape_workers
+
+    if args.fetch_engine is not None:
+        print(f"{args.fetch_engine=}")
+        config.fetch_engine = args.fetch_engine
+
+    if args.parallel_pagination:
+        print(f"{args.parallel_pagination=}")
+        config.parallel_pagination = True
+
+    if args.incremental:
+        print(f"{args.incremental=}")
+        config.incremental = True
+
+    if args.top_k is not None:
+        print(f"{args.top_k=}")
+        config.what_if_top_k = args.top_k
+
     if args.update_database_only:
         print("Updating database only (number_of_pages=0)")
         config.number_of_pages = 0
 
-    Pipeline(config=config).run()
+    if args.serve_browser:
+        Pipeline(config=config).serve_browser()
+    elif args.what_if is not None:
+        Pipeline(config=config).what_if(profile_names=args.what_if)
+    elif args.rescore:
+        print("Rescoring the database")
+        Pipeline(config=config).rescore()
+    elif args.reprocess:
+        print("Rebuilding the database from cached HTML")
+        Pipeline(config=config).reprocess()
+    else:
+        Pipeline(config=config).run()
 
     logger.info("STOPPING PROGRAM")  
 
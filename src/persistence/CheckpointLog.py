@@ -0,0 +1,72 @@
+import os
+import pickle
+from typing import Optional
+
+from src.utils.logger_config import logger
+from src.utils.types import Room
+
+
+class CheckpointLog:
+    def __init__(self, path: str) -> None:
+        """Append-only log of the listings processed since the database was last saved.
+
+        Each listing is written and fsynced as soon as it is built, as a pickled
+        (url, room) record, with room None when the listing was skipped as invalid.
+        If a run dies part way, the next run reads the log back, adds its rooms to the
+        database and skips its URLs. A record cut short by the crash is dropped.
+
+        Args:
+            path: File holding the log.
+        """
+        self.path = path
+        self.rooms: list[Room] = []
+        self.processed_urls: set[str] = set()
+        self._file = None
+
+    def load(self) -> None:
+        """Read every complete record, truncating a partly written one at the end"""
+        if not os.path.exists(self.path):
+            return
+
+        good_offset = 0
+        with open(self.path, "rb") as f:
+            while True:
+                try:
+                    url, room = pickle.load(f)
+                except EOFError:
+                    break
+                except (pickle.UnpicklingError, ValueError, TypeError, AttributeError) as e:
+                    logger.warning(f"Checkpoint log {self.path} ends with a damaged record ({e}), dropping it")
+                    break
+
+                good_offset = f.tell()
+                self.processed_urls.add(url)
+                if room is not None:
+                    self.rooms.append(room)
+
+        if good_offset < os.path.getsize(self.path):
+            with open(self.path, "r+b") as f:
+                f.truncate(good_offset)
+
+        if self.processed_urls:
+            logger.info(f"Resuming from checkpoint: {len(self.processed_urls)} listings already processed")
+
+    def record(self, url: str, room: Optional[Room]) -> None:
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._file = open(self.path, "ab")
+
+        pickle.dump((url, room), self._file)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.processed_urls.add(url)
+
+    def clear(self) -> None:
+        """Delete the log once everything in it has been saved to the database"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self.rooms = []
+        self.processed_urls = set()
@@ -0,0 +1,68 @@
+import json
+
+from branca.element import MacroElement
+from folium.elements import JSCSSMixin
+from folium.plugins import MarkerCluster
+from folium.template import Template
+from folium.utilities import image_to_url
+
+
+def _to_script_json(obj) -> str:
+    """JSON that is safe to inline in a <script> block"""
+    return json.dumps(obj, separators=(",", ":")).replace("<", "\\u003c").replace(">", "\\u003e").replace("&", "\\u0026")
+
+
+class ClusteredRoomLayer(JSCSSMixin, MacroElement):
+    _template = Template("""
+        {% macro script(this, kwargs) %}
+        var {{ this.get_name() }} = (function() {
+            function escape(value) {
+                return String(value == null ? "" : value).replace(/[&<>"']/g, function(c) {
+                    return {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;"}[c];
+                });
+            }
+            function popup(p) {
+                var html = "<b>ID:</b> " + escape(p.id) + "<br>"
+                    + "<b>Date added:</b> " + escape(p.date_added) + "<br>"
+                    + "<b>Score:</b> " + escape(p.score) + "<br>"
+                    + "<b>Price:</b> " + escape(p.price) + "<br>"
+                    + '<a href="' + escape(p.url) + '" target="_blank">View room</a>';
+                if (p.image_url) {
+                    html += '<br><img src="' + escape(p.image_url) + '" width="100">';
+                }
+                return html;
+            }
+            var icon = L.icon({iconUrl: {{ this.icon_url_json }}, iconSize: [18, 27]});
+            var cluster = L.markerClusterGroup({disableClusteringAtZoom: 16});
+            L.geoJSON({{ this.data_json }}, {
+                pointToLayer: function(feature, latlng) {
+                    return L.marker(latlng, {icon: icon});
+                },
+                onEachFeature: function(feature, layer) {
+                    layer.bindPopup(function() { return popup(feature.properties); }, {maxWidth: 150});
+                }
+            }).addTo(cluster);
+            cluster.addTo({{ this._parent.get_name() }});
+            return cluster;
+        })();
+        {% endmacro %}
+    """)
+
+    default_js = MarkerCluster.default_js
+    default_css = MarkerCluster.default_css
+
+    def __init__(self, features: list[dict], icon_image: str) -> None:
+        """One clustered layer of room markers, drawn in the browser from a GeoJSON collection.
+
+        The markers share one icon, embedded once, and each popup is built from the
+        feature's properties only when it is opened, so the page holds a single
+        compact data blob however many rooms there are.
+
+        Args:
+            features: GeoJSON point features whose properties feed the popup.
+            icon_image: Path or URL of the marker icon.
+        """
+        super().__init__()
+        self._name = "ClusteredRoomLayer"
+        self.data_json = _to_script_json({"type": "FeatureCollection", "features": features})
+        self.icon_url_json = _to_script_json(image_to_url(icon_image))
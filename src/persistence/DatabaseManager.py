@@ -1,13 +1,24 @@
 import os
 import pickle
 import json
+import hashlib
 import polars as pl
 from src.utils.logger_config import logger
 from config import IGNORE_KEYWORDS, FAVOURITE_KEYWORDS, MESSAGED_KEYWORDS
 from src.utils.types import Room
 import src.utils.utils as ut
-from playwright.sync_api import Page
-from src.scraping.RoomScraper import RoomScraper
+from typing import Optional
+from src.scraping.ExpiryChecker import ExpiryChecker
+from src.persistence.SqliteRoomStore import SqliteRoomStore
+from src.persistence.ParquetRoomStore import ParquetRoomStore, rooms_to_lazyframe
+from src.persistence.ExportState import ExportState
+
+# Which id list each status keyword adds a room to
+STATUS_KEYWORD_LISTS = {
+    **{keyword: 'ignored' for keyword in IGNORE_KEYWORDS},
+    **{keyword: 'favourites' for keyword in FAVOURITE_KEYWORDS},
+    **{keyword: 'messaged' for keyword in MESSAGED_KEYWORDS},
+}
  
 class DatabaseManager:
     def __init__(
@@ -17,7 +28,9 @@ class DatabaseManager:
         output_path: str,
         ignored_ids_path: str,
         favourite_ids_path: str,
-        messaged_ids_path: str
+        messaged_ids_path: str,
+        store: Optional[SqliteRoomStore | ParquetRoomStore] = None,
+        export_state: Optional[ExportState] = None
     ):
         self.check_for_expired_rooms = check_for_expired_rooms
         self.database_path = database_path
@@ -25,6 +38,9 @@ class DatabaseManager:
         self.ignored_ids_path = ignored_ids_path
         self.favourite_ids_path = favourite_ids_path
         self.messaged_ids_path = messaged_ids_path
+        self.store = store
+        self.export_state = export_state
+        self._saved_digest: Optional[str] = None
 
         self.database: list[Room] = []
         self.ignored: set[str] = set()
@@ -32,51 +48,88 @@ class DatabaseManager:
         self.messaged: set[str] = set()
 
     def load(self) -> None:
-        self.database = DatabaseManager._read_pickle_file(path=self.database_path)
+        if self.store is not None:
+            self.database = self.store.load()
+            logger.info(f"Database currently has {len(self.database)} listings")
+        else:
+            self.database = DatabaseManager._read_pickle_file(path=self.database_path)
+            self._saved_digest = hashlib.sha256(pickle.dumps(self.database)).hexdigest()
         self.ignored = set(self._read_json_file(self.ignored_ids_path))
         self.favourites = set(self._read_json_file(self.favourite_ids_path))
         self.messaged = set(self._read_json_file(self.messaged_ids_path))
 
-    def update_database(self, page: Page) -> None:
-        if self.check_for_expired_rooms:
-            self._check_for_expired_rooms_from_database(page=page)
+    def update_database(self, expiry_checker: Optional[ExpiryChecker] = None) -> None:
+        if self.check_for_expired_rooms and expiry_checker is not None:
+            self.database = expiry_checker.remove_expired(self.database)
 
-        # Process ignore and favourite requests
+        # Process ignore and favourite requests, unless the spreadsheet is as we left it
         if os.path.exists(self.output_path):
-            tuples = self._read_status_updates()
-            self._update_id_lists(tuples=tuples)
+            if self._output_changed_since_sync():
+                tuples = self._read_status_updates()
+                self._update_id_lists(tuples=tuples)
+            else:
+                logger.info(f"{self.output_path} unchanged since last sync, skipping status read")
             self._apply_statuses_to_database()
 
     def save(self) -> None:
-        self._write_pickle_file(self.database_path, self.database)
+        if self.store is not None:
+            self.store.save(self.database)
+            logger.info(f"Database currently has {len(self.database)} listings")
+        else:
+            data = pickle.dumps(self.database)
+            digest = hashlib.sha256(data).hexdigest()
+            if digest == self._saved_digest and os.path.exists(self.database_path):
+                logger.info("Database unchanged, not rewriting it")
+                return
+            self._write_pickle_file(self.database_path, data)
+            self._saved_digest = digest
+
+    def scan_rooms(self) -> pl.LazyFrame:
+        """Typed lazy view of the saved rooms, read straight from Parquet when that's the backend"""
+        if isinstance(self.store, ParquetRoomStore) and os.path.exists(self.store.path):
+            return self.store.scan()
+        return rooms_to_lazyframe(self.database)
+
+    def _output_changed_since_sync(self) -> bool:
+        """Whether the spreadsheet may have been edited since it was last exported"""
+        return self.export_state is None or not self.export_state.is_untouched(self.output_path)
 
     def _read_status_updates(self) -> list[tuple[str, str | None]]:
-        df = pl.read_excel(self.output_path)
-        tuples = list(df.select(['id', 'status']).iter_rows())
-    
+        # Only the id and status columns are parsed
+        df = pl.read_excel(
+            self.output_path,
+            engine="calamine",
+            columns=['id', 'status'],
+            schema_overrides={'id': pl.String, 'status': pl.String}
+        )
+        tuples = [(room_id, status) for room_id, status in df.iter_rows() if status]
+
         # Validate statuses
         for room_id, status in tuples:
-            if status and status.lower() not in (IGNORE_KEYWORDS + FAVOURITE_KEYWORDS + MESSAGED_KEYWORDS):
+            if status.lower() not in STATUS_KEYWORD_LISTS:
                 logger.warning(f"room with id: {room_id} had an invalid status: {status}")
 
         return tuples
 
     def _update_id_lists(self, tuples) -> None:
-        configs = [
-            ('ignored', self.ignored_ids_path, IGNORE_KEYWORDS),
-            ('favourites', self.favourite_ids_path, FAVOURITE_KEYWORDS),
-            ('messaged', self.messaged_ids_path, MESSAGED_KEYWORDS)
-        ]
-        for attr, path, keywords in configs:
+        ids_by_list: dict[str, set[str]] = {'ignored': set(), 'favourites': set(), 'messaged': set()}
+        for room_id, status in tuples:
+            attr = STATUS_KEYWORD_LISTS.get(status.lower()) if status else None
+            if attr:
+                ids_by_list[attr].add(room_id)
+
+        paths = {
+            'ignored': self.ignored_ids_path,
+            'favourites': self.favourite_ids_path,
+            'messaged': self.messaged_ids_path
+        }
+        for attr, ids in ids_by_list.items():
             current_id_list = getattr(self, attr)
-            new_ids = [
-                room_id for room_id, status in tuples 
-                if status and status.lower() in keywords and room_id not in current_id_list
-            ]
+            new_ids = ids - current_id_list
             if new_ids:
-                logger.info(f"Added to {attr} list: {new_ids}")
-                current_id_list.update(new_ids)
-                self._write_json_file(path=path, data=sorted(current_id_list))    
+                logger.info(f"Added to {attr} list: {sorted(new_ids)}")
+                current_id_list |= new_ids
+                self._write_json_file(path=paths[attr], data=sorted(current_id_list))    
 
     def _apply_statuses_to_database(self) -> None:
         """Remove ignored rooms from database and update status of favourited rooms
@@ -96,39 +149,6 @@ class DatabaseManager:
             if room.id not in self.favourites and room.id not in self.messaged:
                 room.status = ''
 
-    def _check_for_expired_rooms_from_database(self, page: Page) -> None:
-        """Exclude listings that have been taken off Spareroom
-        
-        A listing is no longer available if:
-            - We can't access the page (expired=False, contactable=False) 
-            - We can access the page but can't contact (expired=True, contactable=False)
-
-        Else, we keep the room in the database
-        """
-        rooms_still_listed = []
-
-        active_c = 0
-        expired_c = 0
-        total_c = len(self.database)
-
-        for room in self.database:
-            remaining = total_c - (active_c + expired_c)
-            print(f"\rACTIVE: {active_c}, EXPIRED: {expired_c}, REMAINING: {remaining}      ", end="", flush=True)
-
-            expired, contactable = RoomScraper(page, room.url).parse_sidebar()
-            if (expired or not expired) and not contactable:
-                expired_c += 1
-                continue
-            elif not expired and contactable:
-                active_c += 1
-                rooms_still_listed.append(room)
-            else:
-                logger.warning(f"{expired=}, {contactable=}, url={room.url}")
-
-        logger.info(f"Removed {expired_c} rooms from the database.")
-
-        self.database = rooms_still_listed
-
     @staticmethod
     def _read_pickle_file(path: str) -> list[Room]:
         try:
@@ -139,11 +159,11 @@ class DatabaseManager:
         logger.info(f"Database currently has {len(data)} listings")
         return data
 
-    @staticmethod
-    def _write_pickle_file(path: str, data: list[Room]) -> None:
-        with open(path, "wb") as f:
-            pickle.dump(data, f)
-        logger.info(f"Database currently has {len(data)} listings")
+    def _write_pickle_file(self, path: str, data: bytes) -> None:
+        with ut.atomic_write_path(path) as tmp_path:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+        logger.info(f"Database currently has {len(self.database)} listings")
 
     @staticmethod
     def _read_json_file(path: str) -> list[str]:
@@ -1,49 +1,107 @@
+from datetime import date
+from typing import Optional
 import polars as pl
-import pandas as pd
+import xlsxwriter
 from src.utils.logger_config import logger
-from dataclasses import asdict
+from src.persistence.ExportState import ExportState, fingerprint_lazyframe
+from src.persistence.ParquetRoomStore import MIXED_FIELDS, decode_mixed
+import src.utils.utils as ut
 
 output_cols = [
-    "status", "id", "url", "poster_type", "date_added", "type", "area", "score", "collective_word_count", 
-    "average_price", "average_deposit", "location_1", "location_2", "direct_line_to_office", 
-    "location", "nearest_station", "available", "minimum_term", "maximum_term", "bills_included",
-    "broadband_included", "furnishings", "garden_or_patio", "living_room",
+    "status", "id", "url", "poster_type", "date_added", "type", "area", "score", "collective_word_count",
+    "average_price", "average_deposit", "location_1", "location_2", "direct_line_to_office",
+    "location", "nearest_station", "closest_station", "station_walk_minutes", "available", "minimum_term",
+    "maximum_term", "bills_included", "broadband_included", "furnishings", "garden_or_patio", "living_room",
     "balcony_or_roof_terrace", "number_of_flatmates", "total_number_of_rooms"
 ]
 
+URL_COL = output_cols.index("url")
+# Columns stored as strings because they can keep a scraped string; their bools and numbers are written natively
+MIXED_COLS = {output_cols.index(name): types for name, types in MIXED_FIELDS.items() if name in output_cols}
+MAX_COLUMN_WIDTH = 60
+
+# Rows pulled from the query result at a time
+BATCH_SIZE = 10_000
+
+
 class ExcelExporter:
-    def __init__(self, db_manager, output_path: str, min_rent: int) -> None:
+    def __init__(
+        self, db_manager, output_path: str, min_rent: int, export_state: Optional[ExportState] = None
+    ) -> None:
         self.db_manager = db_manager
         self.output_path = output_path
         self.min_rent = min_rent
+        self.export_state = export_state
+
+    def create_and_export_dataframe(self) -> bool:
+        """Stream the filtered, score-sorted rooms into the spreadsheet.
 
-    def create_and_export_dataframe(self) -> None:
-        dict_list = [asdict(room) for room in self.db_manager.database]
-        df = (
-            pl.LazyFrame(dict_list, infer_schema_length=len(dict_list))
+        The query runs on polars' streaming engine and its result is read in batches,
+        so Python only ever holds one batch of rows; the score sort still has to see
+        every selected row, but inside polars. The workbook is written in xlsxwriter's
+        constant_memory mode, one row at a time with the URL written as a link in the
+        same pass, and column widths are tracked as rows go by because autofit needs
+        the whole sheet in memory. It is written to a temporary file and moved into
+        place, and skipped altogether when the exported rows haven't changed since the
+        last export, which is checked from a hash of each row without collecting them.
+
+        Returns:
+            Whether the spreadsheet was written.
+        """
+        rooms = (
+            self.db_manager.scan_rooms()
             .select(output_cols)
             .filter(pl.col("average_price") > self.min_rent)
             .sort("score", descending=True)
-        ).collect()
-        df = df.to_pandas()
-        df["date_added"] = df["date_added"].dt.strftime("%d-%b")
+        )
+
+        fingerprint = fingerprint_lazyframe(rooms)
+        if self.export_state is not None and self.export_state.is_unchanged(self.output_path, fingerprint):
+            return False
+
+        try:
+            with ut.atomic_write_path(self.output_path) as tmp_path:
+                self._write_workbook(rooms, tmp_path)
+        except PermissionError as e:
+            logger.error(f"Couldn't replace {self.output_path}, is it open in another program? ({e})")
+            return False
+
+        if self.export_state is not None:
+            self.export_state.record(self.output_path, fingerprint)
+        logger.info(f"Saved database to {self.output_path}.")
+        return True
 
-        with pd.ExcelWriter(self.output_path, engine="xlsxwriter") as writer:
-            df.to_excel(writer, sheet_name="Sheet1", index=False)
+    def _write_workbook(self, rooms: pl.LazyFrame, path: str) -> None:
+        workbook = xlsxwriter.Workbook(path, {"constant_memory": True})
+        worksheet = workbook.add_worksheet("Sheet1")
 
-            workbook = writer.book
-            worksheet = writer.sheets["Sheet1"]
+        header_format = workbook.add_format({"bold": True, "border": 1, "align": "center", "valign": "top"})
+        link_format = workbook.add_format({"font_color": "blue", "underline": 1})
 
-            # Define hyperlink format
-            link_format = workbook.add_format({"font_color": "blue", "underline": 1}) # type: ignore[attr-defined]
+        widths = [len(col) for col in output_cols]
+        for col_num, col in enumerate(output_cols):
+            worksheet.write_string(0, col_num, col, header_format)
 
-            # Replace URLs in column A with 'link' text + hyperlink formatting
-            for row_num, url in enumerate(
-                df["url"], start=1
-            ):  # row 1 = Excel row 2 (zero-based index)
-                worksheet.write_url(row_num, 2, url, link_format, string="link")
+        row_num = 0
+        for batch in rooms.collect_batches(chunk_size=BATCH_SIZE):
+            for row in batch.iter_rows():
+                row_num += 1
+                for col_num, value in enumerate(row):
+                    if value is None:
+                        continue
+                    if col_num in MIXED_COLS:
+                        value = decode_mixed(value, MIXED_COLS[col_num])
+                    if col_num == URL_COL:
+                        worksheet.write_url(row_num, col_num, value, link_format, string="link")
+                        value = "link"
+                    elif isinstance(value, date):
+                        value = value.strftime("%d-%b")
+                        worksheet.write_string(row_num, col_num, value)
+                    else:
+                        worksheet.write(row_num, col_num, value)
+                    widths[col_num] = max(widths[col_num], len(str(value)))
 
-            # Autofit columns (works in pandas >=2.2 with xlsxwriter)
-            worksheet.autofit()
+        for col_num, width in enumerate(widths):
+            worksheet.set_column(col_num, col_num, min(width + 2, MAX_COLUMN_WIDTH))
 
-        logger.info(f"Saved database to {self.output_path}.")
\ No newline at end of file
+        workbook.close()
@@ -0,0 +1,79 @@
+import hashlib
+import json
+import os
+
+import polars as pl
+
+from src.utils.logger_config import logger
+import src.utils.utils as ut
+
+
+def fingerprint_frame(df: pl.DataFrame) -> str:
+    """Hash of a frame's columns and rows, in order"""
+    digest = hashlib.sha256(",".join(df.columns).encode())
+    digest.update(df.hash_rows(seed=0).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def fingerprint_lazyframe(lf: pl.LazyFrame) -> str:
+    """Hash of a query's columns and rows, in order, collecting only one hash per row"""
+    digest = hashlib.sha256(",".join(lf.collect_schema().names()).encode())
+    hashes = lf.select(pl.struct(pl.all()).hash(seed=0)).collect(engine="streaming")
+    digest.update(hashes.to_series().to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _file_state(path: str, with_hash: bool) -> dict:
+    stat = os.stat(path)
+    state = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+    if with_hash:
+        with open(path, "rb") as f:
+            state["sha256"] = hashlib.file_digest(f, "sha256").hexdigest()
+    return state
+
+
+class ExportState:
+    def __init__(self, path: str) -> None:
+        """Remember what was last written to each output file, and the file it produced.
+
+        An output is only skipped when its content would be the same and the file
+        on disk is still the one that was written, so a deleted or hand-edited file
+        is rewritten. The file is compared by mtime and size, then by hash.
+
+        Args:
+            path: JSON file mapping each output path to its fingerprint and file state.
+        """
+        self.path = path
+        try:
+            with open(path, "r") as f:
+                self.outputs: dict[str, dict] = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.outputs = {}
+
+    def is_unchanged(self, output_path: str, fingerprint: str) -> bool:
+        """Whether `output_path` still holds exactly what `fingerprint` describes"""
+        recorded = self.outputs.get(output_path)
+        unchanged = (
+            isinstance(recorded, dict)
+            and recorded.get("fingerprint") == fingerprint
+            and self.is_untouched(output_path)
+        )
+        if unchanged:
+            logger.info(f"{output_path} is up to date, not rewriting it")
+        return unchanged
+
+    def record(self, output_path: str, fingerprint: str) -> None:
+        self.outputs[output_path] = {"fingerprint": fingerprint, **_file_state(output_path, with_hash=True)}
+        with ut.atomic_write_path(self.path) as tmp_path:
+            with open(tmp_path, "w") as f:
+                json.dump(self.outputs, f, indent=2)
+
+    def is_untouched(self, output_path: str) -> bool:
+        """Whether `output_path` is still the file last recorded, e.g. a spreadsheet nobody has edited"""
+        recorded = self.outputs.get(output_path)
+        if not isinstance(recorded, dict) or not os.path.exists(output_path):
+            return False
+        current = _file_state(output_path, with_hash=False)
+        if current["mtime_ns"] == recorded.get("mtime_ns") and current["size"] == recorded.get("size"):
+            return True
+        return _file_state(output_path, with_hash=True)["sha256"] == recorded.get("sha256")
@@ -0,0 +1,114 @@
+import gzip
+import hashlib
+import json
+import os
+import time
+from collections import Counter
+from typing import Optional
+
+from src.utils.logger_config import logger
+
+
+class HtmlCache:
+    def __init__(self, path: str, max_mb: float) -> None:
+        """On-disk store of the raw HTML of each listing, so rooms can be rebuilt offline.
+
+        Pages are gzip-compressed and stored by content hash under `path/objects`, with
+        `path/index.json` mapping each room id to its latest page. When the store grows
+        past `max_mb`, the rooms stored longest ago are evicted first.
+
+        Args:
+            path: Directory holding the cache.
+            max_mb: Maximum compressed size of the cache in megabytes.
+        """
+        self.path = path
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.index_path = os.path.join(path, "index.json")
+
+        self.index: dict[str, dict] = self._read_index()
+        self._refs: Counter[str] = Counter(entry["hash"] for entry in self.index.values())
+        self._dirty = False
+
+    def put(self, room_id: str, html: str) -> None:
+        content = html.encode("utf-8")
+        digest = hashlib.sha256(content).hexdigest()
+
+        entry = self.index.get(room_id)
+        if entry and entry["hash"] == digest:
+            return
+
+        object_path = self._object_path(digest)
+        if not os.path.exists(object_path):
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            with open(object_path, "wb") as f:
+                f.write(gzip.compress(content, compresslevel=6))
+
+        self.index[room_id] = {"hash": digest, "size": os.path.getsize(object_path), "stored": time.time()}
+        self._refs[digest] += 1
+        self._dirty = True
+
+        if entry:
+            self._release(entry["hash"])
+
+    def get(self, room_id: str) -> Optional[str]:
+        entry = self.index.get(room_id)
+        if not entry:
+            return None
+        try:
+            with open(self._object_path(entry["hash"]), "rb") as f:
+                return gzip.decompress(f.read()).decode("utf-8")
+        except (FileNotFoundError, OSError) as e:
+            logger.warning(f"Cached HTML for {room_id} is unreadable: {e}")
+            return None
+
+    def flush(self) -> None:
+        """Evict down to the size limit and write the index, if anything changed"""
+        if not self._dirty:
+            return
+
+        self._evict()
+        os.makedirs(self.path, exist_ok=True)
+        tmp_path = f"{self.index_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.index, f)
+        os.replace(tmp_path, self.index_path)
+        self._dirty = False
+
+    def _evict(self) -> None:
+        sizes = {entry["hash"]: entry["size"] for entry in self.index.values()}
+        total = sum(sizes.values())
+        if total <= self.max_bytes:
+            return
+
+        evicted = 0
+        for room_id, entry in sorted(self.index.items(), key=lambda item: item[1]["stored"]):
+            if total <= self.max_bytes:
+                break
+            del self.index[room_id]
+            if self._release(entry["hash"]):
+                total -= entry["size"]
+            evicted += 1
+        logger.info(f"Evicted {evicted} pages from the HTML cache")
+
+    def _release(self, digest: str) -> bool:
+        """Drop one reference to a stored page, deleting it once nothing uses it"""
+        self._refs[digest] -= 1
+        if self._refs[digest] > 0:
+            return False
+
+        del self._refs[digest]
+        try:
+            os.remove(self._object_path(digest))
+        except FileNotFoundError:
+            pass
+        return True
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.path, "objects", digest[:2], f"{digest}.html.gz")
+
+    def _read_index(self) -> dict[str, dict]:
+        try:
+            with open(self.index_path, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
@@ -1,8 +1,15 @@
+import hashlib
+import json
+from html import escape
+from typing import Optional
 import folium
 from folium.features import CustomIcon
 from datetime import date
 from config import MAP_SETTINGS
 from src.utils.types import Room
+from src.persistence.ExportState import ExportState
+from src.persistence.ClusteredRoomLayer import ClusteredRoomLayer
+import src.utils.utils as ut
 
 MAP_CENTER = (51.5074, -0.1278)
 
@@ -12,49 +19,109 @@ YELLOW_ICON = "assets/marker-icon-yellow.png"
 
 
 class CreateMap:
-    def __init__(self, rooms: list[Room]) -> None:
+    def __init__(
+        self, rooms: list[Room], output_path: str = "output/map.html", export_state: Optional[ExportState] = None
+    ) -> None:
         """Initialize the map, setting the center point as central London.
 
         Args:
             rooms: List of Room objects to display on the map.
+            output_path: Where the map's HTML is saved.
+            export_state: Fingerprints of previous exports, to skip saving an unchanged map.
         """
         self.map = folium.Map(location=MAP_CENTER, tiles="Cartodb Positron", zoom_start=12)
         self.rooms: list[Room] = rooms
+        self.output_path = output_path
+        self.export_state = export_state
 
         self.favourites: list = []
         self.new_listings: list = []
 
         self._show_favourites: bool = MAP_SETTINGS["show_favourites"]
         self._show_new_listings: bool = MAP_SETTINGS["show_new_listings"]
+        self._clustered: bool = MAP_SETTINGS["clustered"]
 
-    def run(self):
+    def run(self) -> bool:
         """Populate the map with room listings and markers.
 
         Filters the rooms database for favorites and new listings. 
         Creates and adds popups for each category based on the config.py file,
-        then saves the map to "output/map.html".
+        then saves the map to output_path, unless its markers are the same as last time.
+
+        Returns:
+            Whether the map was saved.
         """
         self._filter_listings()
 
+        layers = []
         if self._show_favourites and self.favourites:
-            self._create_and_add_popup(self.favourites, YELLOW_ICON)
+            layers.append((self.favourites, YELLOW_ICON))
         if self._show_new_listings and self.new_listings:
-            self._create_and_add_popup(self.new_listings, BLUE_ICON)
-
-        self.map.save("output/map.html")
+            layers.append((self.new_listings, BLUE_ICON))
+
+        fingerprint = self._fingerprint(layers, clustered=self._clustered)
+        if self.export_state is not None and self.export_state.is_unchanged(self.output_path, fingerprint):
+            return False
+
+        for rooms, icon_url in layers:
+            if self._clustered:
+                self._add_clustered_layer(rooms, icon_url)
+            else:
+                self._create_and_add_popup(rooms, icon_url)
+
+        with ut.atomic_write_path(self.output_path) as tmp_path:
+            self.map.save(tmp_path)
+
+        if self.export_state is not None:
+            self.export_state.record(self.output_path, fingerprint)
+        return True
+
+    @staticmethod
+    def _fingerprint(layers: list[tuple[list[Room], str]], clustered: bool) -> str:
+        """Hash of everything the markers show, and how they're drawn"""
+        markers = [
+            [icon_url, room.id, room.location, str(room.date_added), room.score, room.average_price,
+             room.url, room.image_url]
+            for rooms, icon_url in layers
+            for room in rooms
+        ]
+        return hashlib.sha256(json.dumps([clustered, markers]).encode()).hexdigest()
 
     def _filter_listings(self) -> None:
         self.favourites = [
             r for r in self.rooms
             if r.status.lower()=='favourite'
         ]
+        favourite_ids = {r.id for r in self.favourites}
+        today = date.today()
         self.new_listings = [
             r for r in self.rooms 
             if r.score > MAP_SETTINGS["min_score"]
-            and r.date_added == date.today()
-            and r not in self.favourites
+            and r.date_added == today
+            and r.id not in favourite_ids
         ]
 
+    def _add_clustered_layer(self, rooms: list[Room], icon_url: str) -> None:
+        features = []
+        for room in rooms:
+            if not room.location:
+                continue
+
+            latitude, longitude = map(float, room.location.split(","))
+            features.append({
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [longitude, latitude]},
+                "properties": {
+                    "id": room.id,
+                    "date_added": str(room.date_added),
+                    "score": room.score,
+                    "price": room.average_price,
+                    "url": room.url,
+                    "image_url": room.image_url,
+                },
+            })
+        ClusteredRoomLayer(features=features, icon_image=icon_url).add_to(self.map)
+
     def _create_and_add_popup(self, rooms: list[Room], icon_url: str) -> None:
         for room in rooms:
             if not room.location:
@@ -62,16 +129,17 @@ class CreateMap:
 
             location = tuple(map(float, room.location.split(",")))
 
+            # Scraped text is escaped, as in the clustered layer's popups
             popup_html = f"""
-            <b>ID:</b> {room.id}<br>
+            <b>ID:</b> {escape(room.id)}<br>
             <b>Date added:</b> {room.date_added}<br>
             <b>Score:</b> {room.score}<br>
             <b>Price:</b> {room.average_price}<br>
-            <a href="{room.url} target="_blank">View room</a>
+            <a href="{escape(room.url)}" target="_blank">View room</a>
             """
 
             if room.image_url:
-                popup_html += f'<br><img src="{room.image_url}" width="100">'
+                popup_html += f'<br><img src="{escape(room.image_url)}" width="100">'
 
             icon = CustomIcon(icon_image=icon_url, icon_size=(18, 27))
             
@@ -0,0 +1,112 @@
+import os
+import pickle
+from dataclasses import fields
+from datetime import date, datetime
+from typing import Any, Optional, get_args
+
+import polars as pl
+
+from src.utils.logger_config import logger
+from src.utils.types import Room
+from src.persistence.ExportState import fingerprint_frame
+import src.utils.utils as ut
+
+POLARS_TYPES = {
+    str: pl.String,
+    int: pl.Int64,
+    float: pl.Float64,
+    bool: pl.Boolean,
+    date: pl.Date,
+    datetime: pl.Datetime("us"),
+    list: pl.List(pl.String),
+}
+
+
+def _field_types(field_type: Any) -> tuple:
+    """Types a Room field can hold, leaving out None"""
+    return tuple(t for t in get_args(field_type) if t is not type(None)) or (field_type,)
+
+
+def _polars_type(field_type: Any) -> pl.DataType:
+    types = _field_types(field_type)
+    # Fields that keep the scraped string when it can't be converted are stored as strings
+    if len(types) > 1:
+        return pl.String
+    return POLARS_TYPES[types[0]]
+
+
+# Typed schema of the rooms table, so nothing is left to schema inference
+ROOM_SCHEMA = pl.Schema({f.name: _polars_type(f.type) for f in fields(Room)})
+MIXED_FIELDS = {f.name: _field_types(f.type) for f in fields(Room) if len(_field_types(f.type)) > 1}
+
+
+def decode_mixed(value: Any, types: tuple) -> Any:
+    """A mixed field's value as it was before it was stored as a string"""
+    if not isinstance(value, str):
+        return value
+    if bool in types and value in ("True", "False"):
+        return value == "True"
+    if int in types and value.isdigit():
+        return int(value)
+    return value
+
+
+def rooms_to_lazyframe(rooms: list[Room]) -> pl.LazyFrame:
+    """Build a typed LazyFrame from rooms, one column at a time.
+
+    Raises:
+        TypeError: If a value doesn't match its column's type.
+    """
+    columns = {}
+    for name in ROOM_SCHEMA.names():
+        values = [getattr(room, name) for room in rooms]
+        if name in MIXED_FIELDS:
+            values = [None if value is None else str(value) for value in values]
+        columns[name] = values
+    return pl.LazyFrame(columns, schema=ROOM_SCHEMA, strict=True)
+
+
+class ParquetRoomStore:
+    def __init__(self, path: str, migrate_from: Optional[str] = None) -> None:
+        """Store rooms as a typed Parquet file that exports can query lazily.
+
+        Args:
+            path: Parquet file.
+            migrate_from: Pickle database to import once, when `path` doesn't exist yet.
+        """
+        self.path = path
+        self.migrate_from = migrate_from
+        self._saved_fingerprint: Optional[str] = None
+
+    def load(self) -> list[Room]:
+        if not os.path.exists(self.path):
+            if self.migrate_from and os.path.exists(self.migrate_from):
+                with open(self.migrate_from, "rb") as f:
+                    rooms: list[Room] = pickle.load(f)
+                logger.info(f"Migrating {len(rooms)} rooms from {self.migrate_from} to {self.path}")
+                return rooms
+            return []
+
+        df = pl.read_parquet(self.path)
+        self._saved_fingerprint = fingerprint_frame(df)
+        rooms = [Room(**row) for row in df.iter_rows(named=True)]
+        for room in rooms:
+            for name, types in MIXED_FIELDS.items():
+                setattr(room, name, decode_mixed(getattr(room, name), types))
+        return rooms
+
+    def save(self, rooms: list[Room]) -> None:
+        """Write the rooms, unless they're exactly what was loaded"""
+        df = rooms_to_lazyframe(rooms).collect()
+        fingerprint = fingerprint_frame(df)
+        if fingerprint == self._saved_fingerprint and os.path.exists(self.path):
+            logger.info("Database unchanged, not rewriting it")
+            return
+
+        with ut.atomic_write_path(self.path) as tmp_path:
+            df.write_parquet(tmp_path, compression="zstd", statistics=True)
+        self._saved_fingerprint = fingerprint
+
+    def scan(self) -> pl.LazyFrame:
+        """Lazy query over the saved rooms; filters and column selections are pushed into the read"""
+        return pl.scan_parquet(self.path, schema=ROOM_SCHEMA, missing_columns="insert", extra_columns="ignore")
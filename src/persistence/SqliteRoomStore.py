@@ -0,0 +1,174 @@
+import json
+import os
+import pickle
+import sqlite3
+from contextlib import contextmanager
+from dataclasses import fields
+from datetime import date, datetime
+from typing import Any, Iterator, Optional, get_args
+
+from src.utils.logger_config import logger
+from src.utils.types import Room
+
+ROOM_FIELDS = [f.name for f in fields(Room)]
+
+# Columns the pipeline looks rooms up or sorts them by
+INDEXED_COLUMNS = ["status", "date_added", "score"]
+
+
+def _sql_type(field_type: Any) -> str:
+    base = next((t for t in get_args(field_type) if t is not type(None)), field_type)
+    if base in (int, bool):
+        return "INTEGER"
+    if base is float:
+        return "REAL"
+    return "TEXT"
+
+
+COLUMN_TYPES = {f.name: _sql_type(f.type) for f in fields(Room)}
+BOOL_FIELDS = [f.name for f in fields(Room) if f.type is bool or bool in get_args(f.type)]
+LIST_FIELDS = [f.name for f in fields(Room) if f.type is list or list in get_args(f.type)]
+
+
+class SqliteRoomStore:
+    def __init__(self, path: str, migrate_from: Optional[str] = None, read_only: bool = False) -> None:
+        """Store rooms in SQLite, one row per room, writing only rooms that changed.
+
+        The table's columns are derived from the Room dataclass. On load, a snapshot of
+        each row is kept; save then upserts new and changed rooms and deletes removed
+        ones in a single transaction, so a run costs as much as it changes.
+
+        Args:
+            path: SQLite database file.
+            migrate_from: Pickle database to import once, when `path` doesn't exist yet.
+            read_only: Only read the rooms, e.g. for a report. The file is opened read-only
+                and never created, migrated or upgraded; before a migration the pickle
+                is read instead.
+        """
+        self.path = path
+        self.migrate_from = migrate_from
+        self.read_only = read_only
+        self._snapshot: dict[str, tuple] = {}
+
+    def load(self) -> list[Room]:
+        if self.read_only:
+            return self._load_read_only()
+
+        is_new = not os.path.exists(self.path)
+        with self._transaction() as conn:
+            self._create_schema(conn)
+            if is_new and self.migrate_from and os.path.exists(self.migrate_from):
+                self._migrate(conn)
+            rows = self._select_rooms(conn)
+
+        rooms = [self._to_room(row) for row in rows]
+        self._snapshot = {room.id: row for room, row in zip(rooms, rows)}
+        return rooms
+
+    def save(self, rooms: list[Room]) -> None:
+        if self.read_only:
+            raise RuntimeError(f"{self.path} was opened read-only")
+
+        rows = {room.id: self._to_row(room) for room in rooms}
+        changed = [row for room_id, row in rows.items() if self._snapshot.get(room_id) != row]
+        removed = [(room_id,) for room_id in self._snapshot.keys() - rows.keys()]
+
+        if changed or removed:
+            placeholders = ", ".join("?" for _ in ROOM_FIELDS)
+            updates = ", ".join(f"{name} = excluded.{name}" for name in ROOM_FIELDS if name != "id")
+            with self._transaction() as conn:
+                conn.executemany(
+                    f"INSERT INTO rooms ({', '.join(ROOM_FIELDS)}) VALUES ({placeholders}) "
+                    f"ON CONFLICT(id) DO UPDATE SET {updates}",
+                    changed
+                )
+                conn.executemany("DELETE FROM rooms WHERE id = ?", removed)
+
+        logger.info(f"Saved {len(changed)} changed and removed {len(removed)} rooms")
+        self._snapshot = rows
+
+    def _load_read_only(self) -> list[Room]:
+        if not os.path.exists(self.path):
+            if self.migrate_from and os.path.exists(self.migrate_from):
+                with open(self.migrate_from, "rb") as f:
+                    return pickle.load(f)
+            return []
+
+        conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+        try:
+            rows = self._select_rooms(conn)
+        finally:
+            conn.close()
+        return [self._to_room(row) for row in rows]
+
+    @staticmethod
+    def _select_rooms(conn: sqlite3.Connection) -> list[tuple]:
+        # Fields added since a read-only file was last upgraded read as NULL, as ALTER TABLE would give them
+        existing = {row[1] for row in conn.execute("PRAGMA table_info(rooms)")}
+        columns = ", ".join(name if name in existing else f"NULL AS {name}" for name in ROOM_FIELDS)
+        return conn.execute(f"SELECT {columns} FROM rooms ORDER BY rowid").fetchall()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Connection whose statements commit together, or roll back on an error"""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _create_schema(self, conn: sqlite3.Connection) -> None:
+        columns = ", ".join(
+            f"{name} {COLUMN_TYPES[name]}{' PRIMARY KEY' if name == 'id' else ''}" for name in ROOM_FIELDS
+        )
+        conn.execute(f"CREATE TABLE IF NOT EXISTS rooms ({columns})")
+
+        # Add columns for Room fields introduced since the table was created
+        existing = {row[1] for row in conn.execute("PRAGMA table_info(rooms)")}
+        for name in ROOM_FIELDS:
+            if name not in existing:
+                conn.execute(f"ALTER TABLE rooms ADD COLUMN {name} {COLUMN_TYPES[name]}")
+
+        for name in INDEXED_COLUMNS:
+            conn.execute(f"CREATE INDEX IF NOT EXISTS idx_rooms_{name} ON rooms ({name})")
+
+    def _migrate(self, conn: sqlite3.Connection) -> None:
+        with open(self.migrate_from, "rb") as f:
+            rooms: list[Room] = pickle.load(f)
+
+        conn.executemany(
+            f"INSERT OR REPLACE INTO rooms ({', '.join(ROOM_FIELDS)}) VALUES ({', '.join('?' for _ in ROOM_FIELDS)})",
+            [self._to_row(room) for room in rooms]
+        )
+        logger.info(f"Migrated {len(rooms)} rooms from {self.migrate_from} to {self.path}")
+
+    @staticmethod
+    def _to_row(room: Room) -> tuple:
+        row = []
+        for name in ROOM_FIELDS:
+            value = getattr(room, name)
+            if isinstance(value, list):
+                value = json.dumps(value)
+            elif isinstance(value, (date, datetime)):
+                value = value.isoformat()
+            row.append(value)
+        return tuple(row)
+
+    @staticmethod
+    def _to_room(row: tuple) -> Room:
+        room = Room(**dict(zip(ROOM_FIELDS, row)))
+        for name in LIST_FIELDS:
+            if isinstance(getattr(room, name), str):
+                setattr(room, name, json.loads(getattr(room, name)))
+        if isinstance(room.date_added, str):
+            room.date_added = date.fromisoformat(room.date_added)
+        if isinstance(room.last_checked, str):
+            room.last_checked = datetime.fromisoformat(room.last_checked)
+        # Bools are stored as 0/1; scraped strings left in bool fields, such as "No", are kept as they are
+        for name in BOOL_FIELDS:
+            value = getattr(room, name)
+            if type(value) is int and value in (0, 1):
+                setattr(room, name, bool(value))
+        return room
@@ -1,55 +1,133 @@
 from dataclasses import fields
+from typing import Optional
 from playwright.sync_api import Page
 
 import src.utils.utils as ut
-from src.scraping.RoomScraper import RoomScraper
+from src.scraping.LxmlRoomScraper import ROOM_SCRAPERS
+from src.scraping.RoomScraper import PageLoadError
+from src.scraping.RoomPagePool import RoomPagePool
+from src.scraping.HttpFetcher import HttpFetcher
+from src.persistence.HtmlCache import HtmlCache
+from src.persistence.CheckpointLog import CheckpointLog
 from src.processing.RoomNormaliser import RoomNormaliser
 from src.processing.RoomEnricher import RoomEnricher
 from src.services.CommuteService import CommuteService
 from src.processing.calculate_score import get_score
 from src.utils.logger_config import logger
 from src.utils.types import Room
+from config import CONFIG
 
 
 class NewRoomProcessor:
-    def __init__(self, db_manager, domain: str):
+    def __init__(
+        self,
+        db_manager,
+        domain: str,
+        page_pool: Optional[RoomPagePool] = None,
+        fetcher: Optional[HttpFetcher] = None,
+        parser: str = CONFIG["parser"],
+        html_cache: Optional[HtmlCache] = None,
+        commute_service=None,
+        checkpoint: Optional[CheckpointLog] = None,
+        room_attempts: int = 1
+    ):
         self.db_manager = db_manager
         self.domain = domain
-        self.commute_service = CommuteService()
+        self.page_pool = page_pool
+        self.fetcher = fetcher
+        self.scraper_cls = ROOM_SCRAPERS[parser]
+        self.html_cache = html_cache
+        self.checkpoint = checkpoint
+        self.room_attempts = max(1, room_attempts)
+        self._known_ids_before_crawl: Optional[set[str]] = None
+        self.commute_service = commute_service if commute_service is not None else CommuteService()
+        self.normaliser = RoomNormaliser()
         self.enricher = RoomEnricher(commute_service=self.commute_service)
 
     def filter_new_rooms(self, room_urls: list[str]) -> list[str]:
-        existing_ids = {room.id for room in self.db_manager.database}
-        ignored_ids = set(self.db_manager.ignored)
+        known_ids = self._known_ids()
+        processed = self.checkpoint.processed_urls if self.checkpoint is not None else set()
         return [
-            url
-            for url in room_urls
-            if (room_id := ut.get_id_from_url(url)) not in existing_ids
-            and room_id not in ignored_ids
+            url for url in room_urls
+            if ut.get_id_from_url(url) not in known_ids and f"{self.domain}/{url}" not in processed
         ]
 
+    def is_known(self, url: str) -> bool:
+        """Return whether a listing was already in the database or ignored before this crawl"""
+        if self._known_ids_before_crawl is None:
+            self._known_ids_before_crawl = self._known_ids()
+        return ut.get_id_from_url(url) in self._known_ids_before_crawl
+
+    def _known_ids(self) -> set[str]:
+        return {room.id for room in self.db_manager.database} | set(self.db_manager.ignored)
+
     def process_new_rooms(self, page: Page, room_urls: list[str]) -> None:
         logger.info(f"Processing {len(room_urls)} new rooms")
 
-        for i, url in enumerate(room_urls, start=1):
+        urls = [f"{self.domain}/{url}" for url in room_urls]
+
+        # Fetch pages up front over HTTP or across the pool; anything missed is retried on `page`
+        prefetched: list[Optional[str]] = [None] * len(urls)
+        if self.fetcher is not None:
+            prefetched = self.fetcher.fetch_all(urls)
+        elif self.page_pool is not None:
+            prefetched = self.page_pool.fetch_all(urls)
+
+        failed: list[str] = []
+        for i, (url, html) in enumerate(zip(urls, prefetched), start=1):
             ut.flush_print(i, room_urls, "Processing new rooms")
 
-            url = f"{self.domain}/{url}"
-            room = self._build_room(url=url, page=page)
+            room = self._build_room_with_retries(url=url, page=page, html=html)
+            if room is None:
+                failed.append(url)
+                continue
 
             # Add room to database if room is valid
             room_is_valid = self._validate_room(room=room)
             if room_is_valid:
                 self.db_manager.database.append(room)
+            if self.checkpoint is not None:
+                self.checkpoint.record(url, room if room_is_valid else None)
         print()
 
-    def _build_room(self, url: str, page: Page) -> Room:
+        if failed:
+            logger.warning(f"Couldn't process {len(failed)} rooms, they will be retried next run: {failed}")
+
+    def _build_room_with_retries(self, url: str, page: Page, html: Optional[str]) -> Optional[Room]:
+        """Build a room, reloading it in the browser after a parse failure, or None if every attempt fails.
+
+        Page loads are already retried by the rate limiter, so a page that can't be
+        loaded isn't attempted again here.
+        """
+        for attempt in range(1, self.room_attempts + 1):
+            try:
+                return self._build_room(url=url, page=page, html=html)
+            except PageLoadError as e:
+                logger.warning(f"Giving up on {url}: {e}")
+                break
+            except Exception as e:
+                logger.warning(f"Attempt {attempt}/{self.room_attempts} at {url} failed: {e}")
+                if page is None:
+                    break
+                html = None
+        return None
+
+    def rebuild_room(self, url: str, html: str) -> Optional[Room]:
+        """Build a room from already-fetched HTML, returning None if it isn't valid"""
+        room = self._build_room(url=url, page=None, html=html)
+        return room if self._validate_room(room=room) else None
+
+    def _build_room(self, url: str, page: Optional[Page], html: Optional[str] = None) -> Room:
         # Scrape data
-        scraper = RoomScraper(page=page, url=url)
+        scraper = self.scraper_cls(page=page, url=url, html=html)
         room_data = scraper.scrape_data()
 
+        # Keep the raw page so the room can be rebuilt without refetching it
+        if self.html_cache is not None:
+            self.html_cache.put(room_data["id"], scraper.html)
+
         # Normalise data
-        room_data = RoomNormaliser().normalise(room_data=room_data)
+        room_data = self.normaliser.normalise(room_data=room_data)
         
         # Enrich data
         room_data = self.enricher.enrich(room_data=room_data)
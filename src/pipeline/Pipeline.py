@@ -1,11 +1,32 @@
+from contextlib import closing, nullcontext
+from typing import Optional
 from src.scraping.PlaywrightSessionManager import PlaywrightSession
+from src.scraping.BrowserServer import BrowserServer
 from src.scraping.SpareRoomSearcher import SpareRoomSearcher
-from src.scraping.SpareRoomScraper import SpareRoomScraper
+from src.scraping.SpareRoomScraper import SpareRoomScraper, KnownListingStop
+from src.scraping.RoomPagePool import RoomPagePool
+from src.scraping.HttpFetcher import HttpFetcher
+from src.scraping.RequestFilter import RequestFilter
+from src.scraping.RateLimiter import rate_limiter
+from src.scraping.ExpiryChecker import ExpiryChecker
+from src.scraping.LxmlRoomScraper import ROOM_SCRAPERS
 from src.persistence.DatabaseManager import DatabaseManager
 from src.pipeline.NewRoomProcessor import NewRoomProcessor
+from src.pipeline.Reprocessor import Reprocessor
+from src.processing.BatchScorer import BatchScorer
+from src.processing.RankingEngine import RankingEngine, format_rankings
+from src.processing.StationIndex import station_index
+from src.processing.StationLocator import station_locator
+from src.persistence.HtmlCache import HtmlCache
+from src.persistence.CheckpointLog import CheckpointLog
+from src.persistence.SqliteRoomStore import SqliteRoomStore
+from src.persistence.ParquetRoomStore import ParquetRoomStore
 from src.persistence.ExcelExporter import ExcelExporter
 from src.persistence.MapCreator import CreateMap
-from src.utils.types import PipelineConfig
+from src.persistence.ExportState import ExportState
+from src.utils.types import PipelineConfig, SearchCriteria
+from src.utils.logger_config import logger
+from config import REQUEST_BLOCKING, WEIGHT_PROFILES
 
 
 class Pipeline:
@@ -25,47 +46,267 @@ class Pipeline:
         them from database, removes unwanted rooms, searches for new listings, processes 
         any new rooms found, and writes the updated results to disk.
         """
-        with PlaywrightSession(headless=self.config.headless) as session: 
-            page = session.page
-            if page is None:
+        # Only searching needs a browser; otherwise it's just a fallback for the playwright engine
+        rate_limiter.reset_stats()
+        use_http = self.config.fetch_engine == "http"
+        needs_browser = self.config.number_of_pages > 0 or (
+            self.config.check_for_expired_rooms and not use_http
+        )
+
+        # Abort images, fonts, trackers etc. on every browser page; we only parse the DOM
+        request_filter = None
+        if REQUEST_BLOCKING["enabled"]:
+            request_filter = RequestFilter(
+                blocked_resource_types=REQUEST_BLOCKING["resource_types"],
+                blocked_domains=REQUEST_BLOCKING["domains"]
+            )
+
+        session_context = (
+            PlaywrightSession(
+                headless=self.config.headless,
+                request_filter=request_filter,
+                browser_mode=self.config.browser_mode,
+                profile_path=self.config.browser_profile_path,
+                storage_state_path=self.config.storage_state_path,
+                cdp_endpoint=self._cdp_endpoint()
+            )
+            if needs_browser else nullcontext()
+        )
+        fetcher_context = (
+            closing(HttpFetcher(workers=self.config.scrape_workers)) if use_http else nullcontext()
+        )
+        with fetcher_context as fetcher, session_context as session:
+            page = session.page if session else None
+            if needs_browser and page is None:
                 raise RuntimeError("Playwright session did not create a page")
 
             # Update database
-            db_manager = DatabaseManager(
-                database_path=self.config.database_path,
-                check_for_expired_rooms=self.config.check_for_expired_rooms,
-                output_path=self.config.output_path,
-                ignored_ids_path=self.config.ignored_ids_path,
-                favourite_ids_path=self.config.favourite_ids_path,
-                messaged_ids_path=self.config.messaged_ids_path
-            )
+            db_manager = self._create_db_manager()
             db_manager.load()
-            db_manager.update_database(page=page)
+
+            # Pick up rooms built by a run that died before saving
+            checkpoint = CheckpointLog(path=self.config.checkpoint_path)
+            checkpoint.load()
+            self._recover_checkpoint(db_manager=db_manager, checkpoint=checkpoint)
+
+            expiry_fetcher_context = (
+                closing(HttpFetcher(workers=self.config.expiry_workers))
+                if self.config.check_for_expired_rooms else nullcontext()
+            )
+            with expiry_fetcher_context as expiry_fetcher:
+                expiry_checker = None
+                if expiry_fetcher is not None:
+                    expiry_checker = ExpiryChecker(
+                        fetcher=expiry_fetcher,
+                        page=page,
+                        scraper_cls=ROOM_SCRAPERS[self.config.parser],
+                        max_age_hours=self.config.expiry_max_age_hours,
+                        request_budget=self.config.expiry_request_budget,
+                        time_budget_seconds=self.config.expiry_time_budget_seconds
+                    )
+                db_manager.update_database(expiry_checker=expiry_checker)
 
             # Search Spareroom, and get room urls
             if self.config.number_of_pages > 0:
-                search = SpareRoomSearcher(page=page, domain=self.config.domain)
-                search.run(min_rent=self.config.min_rent, max_rent=self.config.max_rent)
+                self._add_new_rooms(
+                    page=page,
+                    db_manager=db_manager,
+                    fetcher=fetcher,
+                    request_filter=request_filter,
+                    checkpoint=checkpoint
+                )
 
-                scraper = SpareRoomScraper(page=page, domain=self.config.domain)
-                room_urls = scraper.collect_room_urls(pages=self.config.number_of_pages)
+            # Rooms saved before stations were located offline get their nearest stations and distances
+            station_locator.enrich_rooms(db_manager.database)
 
-                # Process new rooms and add to database
-                processor = NewRoomProcessor(db_manager=db_manager,domain=self.config.domain)
-                new_urls = processor.filter_new_rooms(room_urls=room_urls)
-                processor.process_new_rooms(page=page, room_urls=new_urls)
+            # Scores follow the current SCORE_WEIGHTINGS, including rooms scraped before they changed
+            BatchScorer().rescore(db_manager.database)
 
             # Save database as pickle object
             db_manager.save()
-            
-            # Export database into excel
-            exporter = ExcelExporter(
-                db_manager=db_manager,
-                output_path=self.config.output_path,
-                min_rent=self.config.min_rent
+            checkpoint.clear()
+            self._export(db_manager=db_manager)
+
+        rate_limiter.log_stats()
+
+    def serve_browser(self) -> None:
+        """Run a long-lived browser that later runs attach to with browser_mode "cdp"."""
+        BrowserServer(
+            headless=self.config.headless,
+            profile_path=self.config.browser_profile_path,
+            port=self.config.cdp_port
+        ).serve_forever()
+
+    def reprocess(self) -> None:
+        """Rebuild every room in the database from cached HTML, without going online."""
+        db_manager = self._create_db_manager()
+        db_manager.load()
+
+        Reprocessor(
+            db_manager=db_manager,
+            html_cache=self._create_html_cache(),
+            parser=self.config.parser
+        ).run()
+
+        db_manager.save()
+        self._export(db_manager=db_manager)
+
+    def rescore(self) -> None:
+        """Rescore every room in the database with the current SCORE_WEIGHTINGS, without going online."""
+        db_manager = self._create_db_manager()
+        db_manager.load()
+        BatchScorer().rescore(db_manager.database)
+        db_manager.save()
+        self._export(db_manager=db_manager)
+
+    def what_if(self, profile_names: Optional[list[str]] = None) -> None:
+        """Print how the ranking would change under each profile in WEIGHT_PROFILES, without going online.
+
+        Args:
+            profile_names: Profiles to compare, all of them by default.
+        """
+        profile_names = profile_names or list(WEIGHT_PROFILES)
+        unknown = [name for name in profile_names if name not in WEIGHT_PROFILES]
+        if unknown:
+            raise ValueError(f"Unknown weight profiles {unknown}, expected some of {list(WEIGHT_PROFILES)}")
+
+        # Only reads the database, so a report never creates, migrates or upgrades it
+        db_manager = self._create_db_manager(read_only=True)
+        db_manager.load()
+
+        engine = RankingEngine(rooms=db_manager.database)
+        rankings = engine.rank(
+            profiles={name: WEIGHT_PROFILES[name] for name in profile_names},
+            top_k=self.config.what_if_top_k
+        )
+        print(format_rankings(rankings, domain=self.config.domain))
+
+    def _export(self, db_manager: DatabaseManager) -> None:
+        # Outputs whose content hasn't changed since the last run aren't rewritten
+        export_state = db_manager.export_state
+
+        # Export database into excel
+        exporter = ExcelExporter(
+            db_manager=db_manager,
+            output_path=self.config.output_path,
+            min_rent=self.config.min_rent,
+            export_state=export_state
+        )
+        exporter.create_and_export_dataframe()
+
+        # Create Folium map to visualise rooms
+        cm = CreateMap(rooms=db_manager.database, output_path=self.config.map_path, export_state=export_state)
+        cm.run()
+
+    def _create_db_manager(self, read_only: bool = False) -> DatabaseManager:
+        return DatabaseManager(
+            database_path=self.config.database_path,
+            check_for_expired_rooms=self.config.check_for_expired_rooms,
+            output_path=self.config.output_path,
+            ignored_ids_path=self.config.ignored_ids_path,
+            favourite_ids_path=self.config.favourite_ids_path,
+            messaged_ids_path=self.config.messaged_ids_path,
+            store=self._create_room_store(read_only=read_only),
+            export_state=ExportState(path=self.config.export_state_path)
+        )
+
+    def _create_room_store(self, read_only: bool = False) -> Optional[SqliteRoomStore | ParquetRoomStore]:
+        """Storage for the room database; None keeps the pickle at database_path.
+
+        Loading a ParquetRoomStore never writes (a migration happens on save), so
+        only SQLite needs opening read-only.
+        """
+        if self.config.database_backend == "sqlite":
+            return SqliteRoomStore(
+                path=self.config.sqlite_path, migrate_from=self.config.database_path, read_only=read_only
+            )
+        if self.config.database_backend == "parquet":
+            return ParquetRoomStore(path=self.config.parquet_path, migrate_from=self.config.database_path)
+        return None
+
+    @staticmethod
+    def _recover_checkpoint(db_manager: DatabaseManager, checkpoint: CheckpointLog) -> None:
+        existing_ids = {room.id for room in db_manager.database}
+        recovered = [room for room in checkpoint.rooms if room.id not in existing_ids]
+        if recovered:
+            logger.info(f"Recovered {len(recovered)} rooms from the checkpoint log")
+            db_manager.database.extend(recovered)
+
+    def _cdp_endpoint(self) -> str:
+        return f"http://localhost:{self.config.cdp_port}"
+
+    def _create_html_cache(self) -> HtmlCache:
+        return HtmlCache(path=self.config.html_cache_path, max_mb=self.config.html_cache_max_mb)
+
+    def _add_new_rooms(
+        self,
+        page,
+        db_manager: DatabaseManager,
+        fetcher: Optional[HttpFetcher],
+        request_filter: Optional[RequestFilter],
+        checkpoint: CheckpointLog
+    ) -> None:
+        """Search SpareRoom, collect listing URLs and add any new, valid rooms to the database"""
+        criteria = SearchCriteria(
+            location=self.config.location,
+            min_rent=self.config.min_rent,
+            max_rent=self.config.max_rent,
+            double_room_only=self.config.double_room_only,
+            whole_week_only=self.config.whole_week_only,
+            photos_only=self.config.photos_only,
+            private_landlords_only=self.config.private_landlords_only,
+            min_term_months=self.config.min_term_months
+        )
+        search = SpareRoomSearcher(page=page, domain=self.config.domain)
+        search.run(criteria=criteria, method=self.config.search_method)
+
+        page_pool = None
+        if fetcher is None and self.config.scrape_workers > 1:
+            page_pool = RoomPagePool(
+                headless=self.config.headless,
+                workers=self.config.scrape_workers,
+                cdp_endpoint=self._cdp_endpoint() if self.config.browser_mode == "cdp" else None,
+                request_filter=request_filter
+            )
+
+        html_cache = self._create_html_cache() if self.config.html_cache_enabled else None
+
+        processor = NewRoomProcessor(
+            db_manager=db_manager,
+            domain=self.config.domain,
+            page_pool=page_pool,
+            fetcher=fetcher,
+            parser=self.config.parser,
+            html_cache=html_cache,
+            checkpoint=checkpoint,
+            room_attempts=self.config.room_attempts
+        )
+
+        early_stop = None
+        if self.config.incremental:
+            early_stop = KnownListingStop(
+                is_known=processor.is_known,
+                known_pages=self.config.stop_after_known_pages,
+                known_listings=self.config.stop_after_known_listings
             )
-            exporter.create_and_export_dataframe()
 
-            # Create Folium map to visualise rooms
-            cm = CreateMap(rooms=db_manager.database)
-            cm.run()
+        results_fetcher_context = (
+            closing(HttpFetcher(workers=self.config.pagination_workers))
+            if self.config.parallel_pagination else nullcontext()
+        )
+        with results_fetcher_context as results_fetcher:
+            scraper = SpareRoomScraper(
+                page=page,
+                domain=self.config.domain,
+                fetcher=results_fetcher,
+                early_stop=early_stop
+            )
+            room_urls = scraper.collect_room_urls(pages=self.config.number_of_pages)
+
+        # Process new rooms and add to database
+        new_urls = processor.filter_new_rooms(room_urls=room_urls)
+        processor.process_new_rooms(page=page, room_urls=new_urls)
+
+        if html_cache is not None:
+            html_cache.flush()
+        station_index.log_stats()
@@ -0,0 +1,82 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from src.persistence.HtmlCache import HtmlCache
+from src.pipeline.NewRoomProcessor import NewRoomProcessor
+from src.utils.logger_config import logger
+from src.utils.types import Room, coordinates
+
+
+class CachedCommuteService:
+    def __init__(self, room: Room) -> None:
+        """Stand-in for CommuteService that answers with a room's existing commute times.
+
+        Rebuilding a room must not call the Routes API, and commute times don't depend
+        on how the page is parsed. This mirrors which destinations were configured when
+        the room was first built, so RoomEnricher takes the same path as it did then.
+        """
+        has_commutes = room.location_1 is not None or room.location_2 is not None
+        self.API_KEY = "cached" if has_commutes else None
+        self.L1 = coordinates("cached", "cached") if room.location_1 is not None else coordinates()
+        self.L2 = coordinates("cached", "cached") if room.location_2 is not None else coordinates()
+        self._room = room
+
+    def get_commute(self, id: str, start: coordinates, end: coordinates) -> Optional[str]:
+        return self._room.location_1 if end is self.L1 else self._room.location_2
+
+
+def _rebuild_room(job: tuple[Room, str, str]) -> Optional[Room]:
+    """Rebuild one room from its cached HTML, keeping the fields that don't come from the page"""
+    old_room, html, parser = job
+    processor = NewRoomProcessor(
+        db_manager=None,
+        domain="",
+        parser=parser,
+        commute_service=CachedCommuteService(old_room)
+    )
+    room = processor.rebuild_room(url=old_room.url, html=html)
+    if room is None:
+        return None
+
+    room.status = old_room.status
+    room.date_added = old_room.date_added
+    room.last_checked = old_room.last_checked
+    return room
+
+
+class Reprocessor:
+    def __init__(self, db_manager, html_cache: HtmlCache, parser: str, workers: Optional[int] = None) -> None:
+        """Rebuild every room in the database from cached HTML, in parallel across CPU cores.
+
+        Args:
+            db_manager: Loaded database manager whose rooms are rebuilt in place.
+            html_cache: Cache of raw listing pages.
+            parser: Listing parser to use, "bs4" or "lxml".
+            workers: Number of worker processes (defaults to the number of CPUs).
+        """
+        self.db_manager = db_manager
+        self.html_cache = html_cache
+        self.parser = parser
+        self.workers = workers or os.cpu_count() or 1
+
+    def run(self) -> None:
+        rooms: list[Room] = self.db_manager.database
+        jobs = []
+        for room in rooms:
+            html = self.html_cache.get(room.id)
+            if html is not None:
+                jobs.append((room, html, self.parser))
+
+        logger.info(f"Rebuilding {len(jobs)} of {len(rooms)} rooms from cached HTML on {self.workers} processes")
+        chunksize = max(1, len(jobs) // (self.workers * 4))
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            rebuilt = list(executor.map(_rebuild_room, jobs, chunksize=chunksize))
+
+        rebuilt_by_id = {old.id: new for (old, _, _), new in zip(jobs, rebuilt)}
+        dropped = sum(new is None for new in rebuilt)
+        self.db_manager.database = [
+            rebuilt_by_id.get(room.id, room) for room in rooms
+            if room.id not in rebuilt_by_id or rebuilt_by_id[room.id] is not None
+        ]
+        logger.info(f"Rebuilt {len(jobs) - dropped} rooms, dropped {dropped} that are no longer valid")
@@ -0,0 +1,147 @@
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+
+from config import SCORE_WEIGHTINGS
+from src.processing.BatchScorer import metric_columns, to_numbers
+from src.processing.calculate_score import BOOL_METRICS, RANGE_METRICS, HIGHER_IS_BETTER
+from src.utils.types import Room
+
+BASELINE = "current"
+
+
+@dataclass
+class RankedRoom:
+    id: str
+    url: str
+    score: float
+    rank: int
+    baseline_rank: int
+
+    @property
+    def movement(self) -> int:
+        """Places gained against the current weightings, negative if the room fell"""
+        return self.baseline_rank - self.rank
+
+
+@dataclass
+class ProfileRanking:
+    name: str
+    top: list[RankedRoom]
+    entered_top: int
+    biggest_rise: Optional[RankedRoom]
+    biggest_fall: Optional[RankedRoom]
+
+
+class RankingEngine:
+    def __init__(self, rooms: Sequence[Room]) -> None:
+        """Rank the same rooms under many weight profiles at once.
+
+        Each metric's score is linear in the room's value, `offset + slope * value`,
+        wherever the value is present, and 0 where it's missing. The values and a
+        present/missing mask are read into one matrix up front; a profile only
+        changes the weights, offsets and slopes, so any number of profiles are
+        scored together with a single matrix multiply.
+
+        Args:
+            rooms: Rooms to rank.
+        """
+        self.rooms = rooms
+        columns = metric_columns(rooms, sorted(RANGE_METRICS.keys() | BOOL_METRICS))
+        self.metrics = list(columns)
+
+        values = np.zeros((len(rooms), len(self.metrics)))
+        present = np.zeros((len(rooms), len(self.metrics)))
+        for j, metric in enumerate(self.metrics):
+            if metric in BOOL_METRICS:
+                values[:, j] = [value is True for value in columns[metric]]
+            else:
+                numbers = to_numbers(columns[metric])
+                is_present = ~np.isnan(numbers)
+                values[:, j] = np.where(is_present, numbers, 0.0)
+                present[:, j] = is_present
+        self._matrix = np.hstack([values, present])
+
+    def scores(self, profiles: dict[str, dict]) -> np.ndarray:
+        """Unrounded score of every room under each profile, one column per profile"""
+        weights = np.column_stack([self._profile_vector(profile) for profile in profiles.values()])
+        return self._matrix @ weights
+
+    def rank(self, profiles: dict[str, dict], top_k: int = 10) -> list[ProfileRanking]:
+        """Top-K rooms of each profile, and how the ranking moved against the current weightings"""
+        if not self.rooms:
+            return []
+
+        profiles = {BASELINE: {}, **profiles}
+        scores = self.scores(profiles)
+
+        # Rank of every room under each profile, 0 being the best
+        order = np.argsort(-scores, axis=0, kind="stable")
+        ranks = np.empty_like(order)
+        np.put_along_axis(ranks, order, np.arange(len(self.rooms))[:, None], axis=0)
+        baseline_top = set(order[:top_k, 0].tolist())
+
+        rankings = []
+        for k, name in enumerate(profiles):
+            movement = ranks[:, 0] - ranks[:, k]
+            rise, fall = int(np.argmax(movement)), int(np.argmin(movement))
+            rankings.append(ProfileRanking(
+                name=name,
+                top=[self._ranked_room(i, k, scores, ranks) for i in order[:top_k, k]],
+                entered_top=len(set(order[:top_k, k].tolist()) - baseline_top),
+                biggest_rise=self._ranked_room(rise, k, scores, ranks) if movement[rise] > 0 else None,
+                biggest_fall=self._ranked_room(fall, k, scores, ranks) if movement[fall] < 0 else None,
+            ))
+        return rankings
+
+    def _profile_vector(self, profile: dict) -> np.ndarray:
+        """Weights applied to the value and mask columns of the matrix for one profile"""
+        weightings = {**SCORE_WEIGHTINGS, **profile.get("weightings", {})}
+        ranges = {**RANGE_METRICS, **profile.get("ranges", {})}
+
+        slopes = np.zeros(len(self.metrics))
+        offsets = np.zeros(len(self.metrics))
+        for j, metric in enumerate(self.metrics):
+            weight = weightings.get(metric, 0)
+            if metric in BOOL_METRICS:
+                slopes[j] = weight
+                continue
+
+            min_v, max_v = ranges[metric]
+            if min_v == max_v:
+                continue
+            if metric in HIGHER_IS_BETTER:
+                slopes[j] = weight / (max_v - min_v)
+                offsets[j] = -weight * min_v / (max_v - min_v)
+            else:
+                slopes[j] = -weight / (max_v - min_v)
+                offsets[j] = weight * max_v / (max_v - min_v)
+        return np.concatenate([slopes, offsets])
+
+    def _ranked_room(self, i: int, k: int, scores: np.ndarray, ranks: np.ndarray) -> RankedRoom:
+        """Room i as ranked by profile k"""
+        room = self.rooms[i]
+        return RankedRoom(
+            id=room.id,
+            url=room.url,
+            score=round(float(scores[i, k]), 1),
+            rank=int(ranks[i, k]) + 1,
+            baseline_rank=int(ranks[i, 0]) + 1
+        )
+
+
+def format_rankings(rankings: list[ProfileRanking], domain: str) -> str:
+    """Plain-text report of each profile's top rooms, with their movement"""
+    lines = []
+    for ranking in rankings:
+        lines.append(f"\n{ranking.name}")
+        if ranking.name != BASELINE:
+            lines.append(f"  {ranking.entered_top} of the top {len(ranking.top)} are new")
+        for room in ranking.top:
+            movement = f"{room.movement:+d}" if room.movement else "="
+            lines.append(f"  {room.rank:>3}. {room.score:>5}  {movement:>6}  {domain}/{room.url}")
+        for label, room in (("Biggest rise", ranking.biggest_rise), ("Biggest fall", ranking.biggest_fall)):
+            if room is not None:
+                lines.append(f"  {label}: {domain}/{room.url} ({room.baseline_rank} -> {room.rank})")
+    return "\n".join(lines)
@@ -1,30 +1,29 @@
-import src.utils.utils as ut
-from src.utils.types import coordinates
-
-jubilee_stations = [
-    "Stanmore", "Canons Park", "Queensbury", "Kingsbury", "Wembley Park", "Neasden", "Dollis Hill",
-    "Willesden Green", "Kilburn", "West Hampstead", "Finchley Road", "Swiss Cottage", "St. John's Wood",
-    "Baker Street", "Bond Street", "Green Park", "Westminster", "Waterloo", "Southwark", "London Bridge", 
-    "Bermondsey", "Canada Water", "Canary Wharf", "North Greenwich", "Canning Town", "West Ham", "Stratford",
-]
+from config import STATIONS
+from typing import Optional
 
-elizabeth_line_stations = [
-    "Reading", "Twyford", "Maidenhead", "Taplow", "Burnham", "Slough", "Langley", "Iver", "West Drayton",
-    "Hayes & Harlington", "Southall", "Hanwell", "West Ealing", "Ealing Broadway", "Acton Main Line",
-    "Paddington", "Bond Street", "Tottenham Court Road", "Farringdon", "Liverpool Street", "Whitechapel",
-    "Canary Wharf", "Custom House", "Woolwich", "Abbey Wood", "Stratford","Maryland", "Forest Gate",
-    "Manor Park", "Ilford", "Seven Kings", "Goodmayes", "Chadwell Heath", "Romford", "Gidea Park",
-    "Harold Wood", "Brentwood", "Shenfield",
-]
+from src.processing.StationIndex import Station, StationIndex, station_index
+from src.processing.StationLocator import StationLocator, station_locator
+from src.utils.types import coordinates
 
 
 class RoomEnricher:
-    def __init__(self, commute_service):
+    def __init__(
+        self,
+        commute_service,
+        stations: StationIndex = station_index,
+        target_lines: dict[str, list[str]] = STATIONS["target_lines"],
+        locator: StationLocator = station_locator,
+        max_walk_minutes: int = STATIONS["max_walk_minutes"]
+    ):
         self.cs = commute_service
-        self.direct_stations = [ut.clean_string(i) for i in jubilee_stations + elizabeth_line_stations]
+        self.stations = stations
+        self.locator = locator
+        self.max_walk_minutes = max_walk_minutes
+        self.target_lines = {destination: frozenset(lines) for destination, lines in target_lines.items()}
 
     def enrich(self, room_data: dict):
-        room_data['direct_line_to_office'] = self._check_station(room_data['nearest_station'])
+        station = self.stations.lookup(room_data['nearest_station'])
+        room_data['direct_line_to_office'] = self._is_direct(station)
 
         # Get listing location, run commute service if API KEY and location coordinates exist
         coords: coordinates = room_data['coordinates']
@@ -32,6 +31,15 @@ class RoomEnricher:
             return room_data
         
         room_data['location'] = f"{coords.latitude}, {coords.longitude}"
+        room_data.update(self.locator.locate(coords.latitude, coords.longitude))
+
+        # Fall back to the closest station when the listing's own isn't recognised
+        if (
+            station is None
+            and room_data['closest_station'] is not None
+            and room_data['station_walk_minutes'] <= self.max_walk_minutes
+        ):
+            room_data['direct_line_to_office'] = self._is_direct(self.stations.get(room_data['closest_station']))
 
         if not self.cs.API_KEY:
             return room_data
@@ -46,7 +54,8 @@ class RoomEnricher:
 
         return room_data
 
-    def _check_station(self, station: str) -> bool:
-        if not station:
+    def _is_direct(self, station: Optional[Station]) -> bool:
+        """Whether the station is on a line that goes straight to one of the destinations"""
+        if station is None:
             return False
-        return True if ut.clean_string(station) in self.direct_stations else False
+        return any(not station.lines.isdisjoint(target) for target in self.target_lines.values())
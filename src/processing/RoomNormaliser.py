@@ -1,100 +1,138 @@
+import re
+from functools import lru_cache
 import src.utils.utils as ut
 from src.utils.logger_config import logger
-from typing import Any
+from typing import Any, Iterable, Optional
+
+# Scraped field names and their standard field names
+RENAMING = {
+    '#_flatmates': 'number_of_flatmates',
+    '#_housemates': 'number_of_flatmates',
+    'bills_included?': 'bills_included',
+    'total_#_rooms': 'total_number_of_rooms',
+    'garden/patio': 'garden_or_patio',
+    'balcony/roof_terrace': 'balcony_or_roof_terrace'
+}
+
+CASTS = {
+    'number_of_flatmates': int,
+    'total_number_of_rooms': int
+}
+
+# Fields whose strings are converted to bool. balcony_or_rooftop_terrace doesn't match the
+# renamed balcony_or_roof_terrace field, so that field keeps its string, as it always has
+BOOL_FIELDS = (
+    'bills_included',
+    'broadband_included',
+    'furnishings',
+    'garden_or_patio',
+    'living_room',
+    'balcony_or_rooftop_terrace'
+)
+BOOL_VALUES = {
+    'furnished': True, 'yes': True, 'shared': True, 'some': True,
+    'unfurnished': False, 'no': False,
+}
+
+# Same match as ut.string_to_number, compiled once
+NUMBER_PATTERN = re.compile(r"[\d,]+")
+
+
+def _to_number(string: str) -> Optional[int]:
+    match = NUMBER_PATTERN.search(string)
+    return int(match.group().replace(",", "")) if match else None
+
+
+# Field names and values repeat across listings, so what each one means is worked out once
+@lru_cache(maxsize=4096)
+def _key_rule(key: str) -> tuple[bool, bool, Optional[str]]:
+    """Whether a scraped field is a price, whether it's a deposit, and its standard name"""
+    return key.startswith("£"), "deposit" in key.lower(), RENAMING.get(key)
+
+
+@lru_cache(maxsize=4096)
+def _monthly_price(key: str) -> Optional[float]:
+    """Monthly price from a price field name such as £220_pw"""
+    price = _to_number(key)
+    if price is not None and "pw" in key.lower():
+        price = price * 52 / 12
+    return price
+
+
+@lru_cache(maxsize=1024)
+def _bool_value(value: str) -> Optional[bool]:
+    return BOOL_VALUES.get(ut.clean_string(value))
+
 
 class RoomNormaliser:
     def normalise(self, room_data: dict[str, Any]) -> dict[str, Any]:
-        """Reformat, rename, and cast room_data dict"""
-        room_data = self._reformat_keys(room_data)
-        room_data = self._rename_keys(room_data)
-        room_data = self._cast_keys(room_data)
-        room_data = self._convert_to_bool(room_data)
-        return room_data
+        """Reformat, rename, and cast room_data dict.
 
-    def _reformat_keys(self, room_data: dict) -> dict:
-        """Rename room attributes"""
+        Prices, room sizes, deposits and renamed fields are all collected in a
+        single pass over the scraped fields; casts and bool conversions then only
+        look up the handful of fields they apply to. room_data is updated in place
+        and returned.
+        """
         prices, room_sizes, deposits = [], [], []
+        renamed = {}
 
         for k, v in room_data.items():
-            if k.startswith("£") and "(NOW LET)" not in v:
-                size = "double" if "double" in v else "single"
-                room_sizes.append(size)
+            is_price, is_deposit, standard_name = _key_rule(k)
+
+            if is_price and "(NOW LET)" not in v:
+                room_sizes.append("double" if "double" in v else "single")
 
-                price = ut.string_to_number(k)
+                price = _monthly_price(k)
                 if price is not None:
-                    if "pw" in k.lower():
-                        price = price * 52 / 12
                     prices.append(price)
 
-            if "deposit" in k.lower():
-                deposit = ut.string_to_number(v)
+            if is_deposit:
+                deposit = _to_number(v)
                 if deposit is not None:
                     deposits.append(deposit)
 
+            if standard_name is not None:
+                renamed[standard_name] = v
+
         if prices:
             room_data['average_price'] = int(sum(prices) / len(prices))
         if room_sizes:
             room_data['room_sizes'] = room_sizes
         if deposits:
             room_data['average_deposit'] = sum(deposits) / len(deposits)
+        room_data.update(renamed)
 
+        self._cast_keys(room_data)
+        self._convert_to_bool(room_data)
         return room_data
 
-    def _rename_keys(self, room_data: dict) -> dict:
-        """Rename keys from scraped field names to standard field names."""
-        RENAMING = {
-            '#_flatmates': 'number_of_flatmates',
-            '#_housemates': 'number_of_flatmates',
-            'bills_included?': 'bills_included',
-            'total_#_rooms': 'total_number_of_rooms',
-            'garden/patio': 'garden_or_patio',
-            'balcony/roof_terrace': 'balcony_or_roof_terrace'
-        }
-
-        new = {RENAMING[k]: room_data.get(k) for k in room_data if k in RENAMING}
+    def normalise_batch(self, rooms_data: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Normalise many room_data dicts with the same compiled rules"""
+        return [self.normalise(room_data) for room_data in rooms_data]
 
-        room_data.update(new)
-        return room_data
-
-    def _cast_keys(self, room_data: dict) -> dict:
+    @staticmethod
+    def _cast_keys(room_data: dict) -> None:
         """Cast certain fields to the appropriate types."""
-        CASTS = {
-            'number_of_flatmates': int,
-            'total_number_of_rooms': int
-        }
-
-        for key, value in room_data.items():
-            if key in CASTS and value is not None:
-                try:
-                    room_data[key] = CASTS[key](value)
-                except (ValueError, TypeError):
-                    logger.warning(f"Failed to cast {key}='{value}'")
-        return room_data
-    
-    def _convert_to_bool(self, room_data: dict) -> dict:
-        """Converts string values to bool equivalent"""
-            # Get metrics from room dictionary
-        metrics_to_convert = [
-            'bills_included', 
-            'broadband_included', 
-            'furnishings', 
-            'garden_or_patio', 
-            'living_room', 
-            'balcony_or_rooftop_terrace'
-        ]
-        GOOD_VALS = ['furnished', 'yes', 'shared', 'some']
-        BAD_VALS = ['unfurnished', 'no']
+        for key, cast in CASTS.items():
+            value = room_data.get(key)
+            if value is None:
+                continue
+            try:
+                room_data[key] = cast(value)
+            except (ValueError, TypeError):
+                logger.warning(f"Failed to cast {key}='{value}'")
 
-        for k, v in room_data.items():
-            if k not in metrics_to_convert:
+    @staticmethod
+    def _convert_to_bool(room_data: dict) -> None:
+        """Converts string values to bool equivalent"""
+        for key in BOOL_FIELDS:
+            if key not in room_data:
                 continue
-            
-            val = ut.clean_string(v) if isinstance(v, str) else None
-            if val in GOOD_VALS:
-                room_data[k] = True
-            elif val in BAD_VALS:
-                room_data[k] = False
-            else:
-                logger.warning(f"Found unexpected string '{val}' for {k}")
 
-        return room_data
\ No newline at end of file
+            v = room_data[key]
+            converted = _bool_value(v) if isinstance(v, str) else None
+            if converted is None:
+                val = ut.clean_string(v) if isinstance(v, str) else None
+                logger.warning(f"Found unexpected string '{val}' for {key}")
+            else:
+                room_data[key] = converted
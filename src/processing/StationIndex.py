@@ -0,0 +1,160 @@
+import json
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Optional
+
+from config import STATIONS
+from src.utils.logger_config import logger
+
+# Spellings of the same word, reduced to one form
+TOKEN_FORMS = {"street": "st", "saint": "st", "road": "rd", "mkt": "market", "&": "and"}
+# Trailing words that don't tell stations apart, e.g. "Bethnal Green Station" or "Canada Water Overground"
+TRAILING_TOKENS = {"station", "stn", "underground", "tube", "overground", "dlr"}
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+|&")
+
+
+@dataclass(frozen=True)
+class Station:
+    name: str
+    lines: frozenset[str]
+
+
+def normalise_name(name: str) -> str:
+    """Reduce a station name to the form it's looked up by, e.g. "St. John's Wood" -> "st johns wood"."""
+    name = unicodedata.normalize("NFKC", name).lower().replace("'", "").replace("’", "").replace(".", "")
+    tokens = [TOKEN_FORMS.get(token, token) for token in TOKEN_PATTERN.findall(name)]
+    while len(tokens) > 1 and tokens[-1] in TRAILING_TOKENS:
+        tokens.pop()
+    return " ".join(tokens)
+
+
+def _trigrams(key: str) -> set[str]:
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class StationIndex:
+    def __init__(self, lines: dict[str, list[str]], aliases: dict[str, str], min_similarity: float = 0.75) -> None:
+        """Look up stations by name, tolerating punctuation, abbreviations and typos.
+
+        Names and aliases are normalised into one dict, so an exact or alias hit is a
+        single hash lookup. Anything else goes to a trigram index: candidates sharing
+        trigrams with the name are ranked by Dice similarity, and the best one is
+        accepted if it reaches `min_similarity`. Fuzzy results are cached, and every
+        lookup is counted so the miss rate can be logged.
+
+        Args:
+            lines: Stations on each line, keyed by line name.
+            aliases: Other names stations go by, mapped to the station's name in `lines`.
+            min_similarity: Lowest Dice similarity accepted for a fuzzy match, 0 to 1.
+        """
+        self.min_similarity = min_similarity
+
+        station_lines: dict[str, set[str]] = defaultdict(set)
+        for line, names in lines.items():
+            for name in names:
+                station_lines[name].add(line)
+        stations = {name: Station(name=name, lines=frozenset(served)) for name, served in station_lines.items()}
+
+        self._stations: dict[str, Station] = {normalise_name(name): station for name, station in stations.items()}
+        self._aliases: dict[str, Station] = {
+            normalise_name(alias): stations[name] for alias, name in aliases.items()
+            if normalise_name(alias) not in self._stations
+        }
+
+        self._trigram_index: dict[str, list[str]] = defaultdict(list)
+        self._trigram_counts: dict[str, int] = {}
+        self._token_counts: dict[str, int] = {}
+        for key in self._stations.keys() | self._aliases.keys():
+            trigrams = _trigrams(key)
+            self._trigram_counts[key] = len(trigrams)
+            self._token_counts[key] = len(key.split())
+            for trigram in trigrams:
+                self._trigram_index[trigram].append(key)
+
+        self._fuzzy_cache: dict[str, Optional[Station]] = {}
+        self.stats: Counter[str] = Counter()
+        self.missed: Counter[str] = Counter()
+
+    @classmethod
+    def from_file(cls, path: str, min_similarity: float = 0.75) -> "StationIndex":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(lines=data["lines"], aliases=data.get("aliases", {}), min_similarity=min_similarity)
+
+    def lookup(self, name: Optional[str]) -> Optional[Station]:
+        """The station called `name`, or None if there's no close enough match"""
+        if not name:
+            return None
+
+        key = normalise_name(name)
+        station = self._stations.get(key)
+        if station is not None:
+            self.stats["exact"] += 1
+            return station
+
+        station = self._aliases.get(key)
+        if station is not None:
+            self.stats["alias"] += 1
+            return station
+
+        if key not in self._fuzzy_cache:
+            self._fuzzy_cache[key] = self._fuzzy_lookup(key)
+        station = self._fuzzy_cache[key]
+        if station is None:
+            self.stats["missed"] += 1
+            self.missed[name] += 1
+        else:
+            self.stats["fuzzy"] += 1
+        return station
+
+    def get(self, name: str) -> Optional[Station]:
+        """The station with exactly this name, e.g. one found by coordinates, without counting a lookup"""
+        return self._stations.get(normalise_name(name))
+
+    def lines(self, name: Optional[str]) -> frozenset[str]:
+        """Lines serving the station called `name`, empty if it isn't recognised"""
+        station = self.lookup(name)
+        return station.lines if station is not None else frozenset()
+
+    @property
+    def miss_rate(self) -> float:
+        total = sum(self.stats.values())
+        return self.stats["missed"] / total if total else 0.0
+
+    def log_stats(self) -> None:
+        if not self.stats:
+            return
+        logger.info(
+            f"Station lookups: {dict(self.stats)}, miss rate: {self.miss_rate:.1%}, "
+            f"most missed: {self.missed.most_common(5)}"
+        )
+
+    def _fuzzy_lookup(self, key: str) -> Optional[Station]:
+        trigrams = _trigrams(key)
+        shared: Counter[str] = Counter()
+        for trigram in trigrams:
+            shared.update(self._trigram_index.get(trigram, ()))
+
+        # A name with more words than the candidate is a different place that contains its
+        # name, e.g. "Reading West" or "Hampstead Heath", rather than a misspelling of it
+        tokens = len(key.split())
+        shared = Counter({
+            candidate: count for candidate, count in shared.items() if self._token_counts[candidate] >= tokens
+        })
+        if not shared:
+            return None
+
+        # Dice similarity; ties go to the alphabetically first name so results are stable
+        negative_similarity, best = min(
+            (-2 * count / (len(trigrams) + self._trigram_counts[candidate]), candidate)
+            for candidate, count in shared.items()
+        )
+        if -negative_similarity < self.min_similarity:
+            return None
+        return self._stations.get(best) or self._aliases[best]
+
+
+station_index = StationIndex.from_file(STATIONS["path"], min_similarity=STATIONS["min_similarity"])
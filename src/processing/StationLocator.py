@@ -0,0 +1,158 @@
+import heapq
+import json
+import math
+import os
+from collections import defaultdict
+from typing import Optional, Sequence
+
+from dotenv import load_dotenv
+
+from config import STATIONS
+from src.utils.logger_config import logger
+from src.utils.types import Room, coordinates
+
+# Kilometres per degree around London, where a flat projection is accurate to well under 1%
+ORIGIN_LATITUDE = 51.5
+KM_PER_DEGREE_LATITUDE = 110.574
+KM_PER_DEGREE_LONGITUDE = 111.320 * math.cos(math.radians(ORIGIN_LATITUDE))
+
+WALK_SPEED_KMH = 4.8
+# Streets don't run straight to the station; walking routes are roughly this much longer
+WALK_DETOUR_FACTOR = 1.3
+
+
+def _project(latitude: float, longitude: float) -> tuple[float, float]:
+    """Kilometres east and north of the projection origin"""
+    return longitude * KM_PER_DEGREE_LONGITUDE, (latitude - ORIGIN_LATITUDE) * KM_PER_DEGREE_LATITUDE
+
+
+def walk_minutes(distance_km: float) -> int:
+    return round(distance_km * WALK_DETOUR_FACTOR / WALK_SPEED_KMH * 60)
+
+
+def load_destinations() -> dict[str, coordinates]:
+    """The L1 and L2 coordinates in .env, keyed by the Room field of their commute"""
+    load_dotenv()
+    destinations = {}
+    for field_name, prefix in (("location_1", "L1"), ("location_2", "L2")):
+        latitude, longitude = os.getenv(f"{prefix}_LAT"), os.getenv(f"{prefix}_LON")
+        if latitude and longitude:
+            destinations[field_name] = coordinates(float(latitude), float(longitude))
+    return destinations
+
+
+class StationLocator:
+    def __init__(
+        self,
+        stations: dict[str, Sequence[float]],
+        destinations: Optional[dict[str, coordinates]] = None,
+        nearby_count: int = 3,
+        cell_km: float = 1.0
+    ) -> None:
+        """Find the stations nearest a room, and how far it is from each destination, offline.
+
+        Stations are projected onto a flat kilometre grid and bucketed into square
+        cells. A search looks at the room's own cell and then rings of cells around
+        it, and stops once no unvisited cell could hold anything closer than the
+        stations already found, so a lookup only touches a few stations.
+
+        Args:
+            stations: Latitude and longitude of each station, keyed by name.
+            destinations: Coordinates of L1/L2, keyed by the Room field of their commute.
+            nearby_count: Number of nearest stations kept for each room.
+            cell_km: Width of a grid cell in kilometres.
+        """
+        self.destinations = destinations if destinations is not None else {}
+        self.nearby_count = nearby_count
+        self.cell_km = cell_km
+
+        self._names = list(stations)
+        self._points = [_project(*stations[name]) for name in self._names]
+        self._cells: dict[tuple[int, int], list[int]] = defaultdict(list)
+        for i, point in enumerate(self._points):
+            self._cells[self._cell(point)].append(i)
+
+        xs = [cell[0] for cell in self._cells] or [0]
+        ys = [cell[1] for cell in self._cells] or [0]
+        self._bounds = (min(xs), max(xs), min(ys), max(ys))
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs) -> "StationLocator":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(stations=data["coordinates"], **kwargs)
+
+    def nearest(self, latitude: float, longitude: float, k: int = 1) -> list[tuple[str, float]]:
+        """The k nearest stations as (name, straight-line km), nearest first"""
+        point = _project(latitude, longitude)
+        cx, cy = self._cell(point)
+        min_x, max_x, min_y, max_y = self._bounds
+
+        if not (min_x <= cx <= max_x and min_y <= cy <= max_y):
+            # Outside the area the stations cover, where rings would mostly be empty; compare every station
+            found = [(math.dist(point, station), i) for i, station in enumerate(self._points)]
+        else:
+            found = []
+            last_ring = max(cx - min_x, max_x - cx, cy - min_y, max_y - cy)
+            for ring in range(last_ring + 1):
+                for cell in self._ring_cells(cx, cy, ring):
+                    for i in self._cells.get(cell, ()):
+                        found.append((math.dist(point, self._points[i]), i))
+
+                # Cells outside this ring are all at least `ring * cell_km` away
+                if len(found) >= k and heapq.nsmallest(k, found)[-1][0] <= ring * self.cell_km:
+                    break
+
+        return [(self._names[i], distance) for distance, i in heapq.nsmallest(k, found)]
+
+    def locate(self, latitude: float, longitude: float) -> dict:
+        """Transport fields of a Room at these coordinates"""
+        nearby = self.nearest(latitude, longitude, k=self.nearby_count)
+        fields = {
+            "closest_station": nearby[0][0] if nearby else None,
+            "station_walk_minutes": walk_minutes(nearby[0][1]) if nearby else None,
+            "nearby_stations": [name for name, _ in nearby],
+        }
+
+        point = _project(latitude, longitude)
+        for field_name, destination in self.destinations.items():
+            distance = math.dist(point, _project(destination.latitude, destination.longitude))
+            fields[f"{field_name}_distance_km"] = round(distance, 2)
+        return fields
+
+    def enrich_rooms(self, rooms: Sequence[Room]) -> int:
+        """Fill in the transport fields of located rooms that don't have them, returning how many"""
+        enriched = 0
+        for room in rooms:
+            if room.closest_station is not None or not room.location:
+                continue
+            latitude, longitude = (float(part) for part in room.location.split(","))
+            for name, value in self.locate(latitude, longitude).items():
+                setattr(room, name, value)
+            enriched += 1
+
+        if enriched:
+            logger.info(f"Added nearest stations and distances to {enriched} rooms")
+        return enriched
+
+    def _cell(self, point: tuple[float, float]) -> tuple[int, int]:
+        return math.floor(point[0] / self.cell_km), math.floor(point[1] / self.cell_km)
+
+    @staticmethod
+    def _ring_cells(cx: int, cy: int, ring: int) -> list[tuple[int, int]]:
+        """Cells on the square ring `ring` cells out from (cx, cy)"""
+        if ring == 0:
+            return [(cx, cy)]
+        cells = []
+        for dx in range(-ring, ring + 1):
+            cells.append((cx + dx, cy - ring))
+            cells.append((cx + dx, cy + ring))
+        for dy in range(-ring + 1, ring):
+            cells.append((cx - ring, cy + dy))
+            cells.append((cx + ring, cy + dy))
+        return cells
+
+
+station_locator = StationLocator.from_file(
+    STATIONS["path"], destinations=load_destinations(), nearby_count=STATIONS["nearby_count"]
+)
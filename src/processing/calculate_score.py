@@ -3,6 +3,30 @@ import src.utils.utils as ut
 from src.utils.logger_config import logger
 from src.utils.types import Room
 
+BOOL_METRICS = {
+    "direct_line_to_office",
+    "bills_included",
+    "broadband_included",
+    "furnishings",
+    "garden_or_patio",
+    "living_room",
+    "balcony_or_rooftop_terrace",
+    "preferable_poster_type"
+}
+
+RANGE_METRICS = {
+    "location_1": (20, 60),
+    "location_2": (20, 60),
+    "minimum_term": (0, 12),
+    "total_number_of_rooms": (2, 6),
+    "average_price": (700, 1000),
+    "collective_word_count": (0, 7)
+}
+
+# A lower value is better for all range metrics apart from these
+HIGHER_IS_BETTER = {"collective_word_count"}
+
+
 def get_score(room: Room) -> float:
     """Calculate a composite score for a room.
 
@@ -20,26 +44,6 @@ def get_score(room: Room) -> float:
     Returns:
         The final room score, rounded to one decimal place.
     """
-    BOOL_METRICS = {
-        "direct_line_to_office",
-        "bills_included",       
-        "broadband_included",
-        "furnishings",
-        "garden_or_patio",
-        "living_room",
-        "balcony_or_rooftop_terrace",
-        "preferable_poster_type"
-    }
-
-    RANGE_METRICS = {
-        "location_1": (20, 60),
-        "location_2": (20, 60),
-        "minimum_term": (0, 12),
-        "total_number_of_rooms": (2, 6),
-        "average_price": (700, 1000),
-        "collective_word_count": (0, 7)
-    }
-
     metric_scores: dict[str, float] = {}
 
     for metric, _ in SCORE_WEIGHTINGS.items():
@@ -64,9 +68,8 @@ def get_score(room: Room) -> float:
                 metric_scores[metric] = 0
                 continue
 
-            # A lower value is better for all metrics apart from collective_word_count
             min_v, max_v = RANGE_METRICS[metric]
-            invert = True if metric != 'collective_word_count' else False
+            invert = metric not in HIGHER_IS_BETTER
             metric_scores[metric] = ut.normalise(val, min_v, max_v, invert=invert)  
             continue
 
@@ -0,0 +1,41 @@
+import os
+import time
+from playwright.sync_api import sync_playwright
+
+from src.utils.logger_config import logger
+
+
+class BrowserServer:
+    def __init__(self, headless: bool, profile_path: str, port: int) -> None:
+        """Keep a browser running between pipeline runs, for the "cdp" browser mode.
+
+        The browser uses the persistent profile in `profile_path` and listens for CDP
+        connections on `port`, so each run attaches to a warm browser with its cache
+        and cookies instead of launching a new one.
+
+        Args:
+            headless: Whether to run the browser headless.
+            profile_path: Browser profile directory, shared with the "persistent" mode.
+            port: Remote debugging port the pipeline connects to.
+        """
+        self.headless = headless
+        self.profile_path = profile_path
+        self.port = port
+
+    def serve_forever(self) -> None:
+        os.makedirs(self.profile_path, exist_ok=True)
+        with sync_playwright() as playwright:
+            context = playwright.chromium.launch_persistent_context(
+                self.profile_path,
+                headless=self.headless,
+                args=[f"--remote-debugging-port={self.port}"]
+            )
+            logger.info(f"Browser listening on http://localhost:{self.port}, press Ctrl+C to stop")
+            try:
+                while True:
+                    time.sleep(1)
+            except KeyboardInterrupt:
+                pass
+            finally:
+                context.close()
+                logger.info("Stopped browser server")
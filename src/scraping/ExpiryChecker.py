@@ -0,0 +1,138 @@
+import re
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
+from typing import Optional
+from playwright.sync_api import Page
+
+from src.scraping.HttpFetcher import HttpFetcher
+from src.scraping.RoomScraper import RoomScraper
+from src.utils.logger_config import logger
+from src.utils.types import Room
+
+EXPIRED_PATTERN = re.compile(r'<section\b[^>]*\bclass=["\'][^"\']*(?<![\w-])listing-contact--expired(?![\w-])')
+CONTACT_PATTERN = re.compile(r'<ul\b[^>]*\bclass=["\'][^"\']*(?<![\w-])contact_methods(?![\w-])')
+
+
+def parse_sidebar_html(html: str) -> tuple[bool, bool]:
+    """Cheap equivalent of RoomScraper.parse_sidebar that scans the raw HTML for the two classes"""
+    return bool(EXPIRED_PATTERN.search(html)), bool(CONTACT_PATTERN.search(html))
+
+
+class ExpiryChecker:
+    def __init__(
+        self,
+        fetcher: HttpFetcher,
+        page: Optional[Page],
+        scraper_cls: type[RoomScraper],
+        max_age_hours: float,
+        request_budget: int = 0,
+        time_budget_seconds: float = 0
+    ) -> None:
+        """Re-verify rooms in the database, oldest check first, and drop expired ones.
+
+        Args:
+            fetcher: HTTP fetcher used to download listings concurrently.
+            page: Browser page to fall back on when a download fails, if there is one.
+            scraper_cls: Parser used for listings loaded through the browser fallback.
+            max_age_hours: Only rooms last checked longer ago than this are re-checked.
+            request_budget: Maximum rooms to check per run (0 for no limit).
+            time_budget_seconds: Stop checking after this long, abandoning downloads still
+                in progress (0 for no limit).
+        """
+        self.fetcher = fetcher
+        self.page = page
+        self.scraper_cls = scraper_cls
+        self.max_age = timedelta(hours=max_age_hours)
+        self.request_budget = request_budget
+        self.time_budget_seconds = time_budget_seconds
+
+    def remove_expired(self, rooms: list[Room]) -> list[Room]:
+        """Return `rooms` without the listings that are no longer available.
+
+        A listing is no longer available if we can't contact the advertiser, whether or
+        not the page shows the expired notice. Rooms that couldn't be loaded are kept
+        and retried on the next run.
+        """
+        due = self._rooms_due(rooms)
+        logger.info(f"Checking {len(due)} of {len(rooms)} rooms for expiry")
+
+        expired_ids: set[str] = set()
+        checked = processed = 0
+        deadline = time.monotonic() + self.time_budget_seconds if self.time_budget_seconds else None
+
+        # Keep one download per worker in flight, and handle each as soon as it finishes
+        remaining = iter(due)
+        pending: dict[Future, Room] = {}
+        executor = ThreadPoolExecutor(max_workers=self.fetcher.workers)
+
+        def submit_next() -> None:
+            room = next(remaining, None)
+            if room is not None:
+                pending[executor.submit(self.fetcher.fetch, room.url)] = room
+
+        try:
+            for _ in range(self.fetcher.workers):
+                submit_next()
+
+            while pending:
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                if deadline is not None and time.monotonic() >= deadline:
+                    logger.info("Expiry check time budget used up")
+                    break
+
+                for future in done:
+                    room = pending.pop(future)
+                    processed += 1
+                    submit_next()
+
+                    result = self._check(room, future.result(), deadline)
+                    if result is None:
+                        continue
+
+                    expired, contactable = result
+                    room.last_checked = datetime.now()
+                    checked += 1
+                    if not contactable:
+                        expired_ids.add(room.id)
+                    elif expired:
+                        logger.warning(f"{expired=}, {contactable=}, url={room.url}")
+
+                print(f"\rCHECKED: {checked}, EXPIRED: {len(expired_ids)}, REMAINING: {len(due) - processed}      ", end="", flush=True)
+        finally:
+            # Downloads still running are abandoned rather than waited for
+            executor.shutdown(wait=False, cancel_futures=True)
+        print()
+
+        logger.info(f"Removed {len(expired_ids)} rooms from the database.")
+        return [room for room in rooms if room.id not in expired_ids]
+
+    def _rooms_due(self, rooms: list[Room]) -> list[Room]:
+        """Rooms whose last check is older than max_age, never-checked and oldest first"""
+        cutoff = datetime.now() - self.max_age
+        due = [room for room in rooms if room.last_checked is None or room.last_checked < cutoff]
+        due.sort(key=lambda room: (room.last_checked is not None, room.last_checked or datetime.min))
+
+        if self.request_budget:
+            due = due[:self.request_budget]
+        return due
+
+    def _check(self, room: Room, html: Optional[str], deadline: Optional[float]) -> Optional[tuple[bool, bool]]:
+        if html is not None:
+            return parse_sidebar_html(html)
+
+        if self.page is None:
+            logger.warning(f"Couldn't fetch {room.url}, keeping it in the database")
+            return None
+
+        # The browser fallback runs on this thread, so it mustn't start once the budget is spent
+        if deadline is not None and time.monotonic() >= deadline:
+            logger.info(f"No time left to load {room.url} in the browser, leaving it unchecked")
+            return None
+
+        try:
+            return self.scraper_cls(self.page, room.url).parse_sidebar()
+        except Exception as e:
+            logger.warning(f"Couldn't load {room.url} ({e}), keeping it in the database")
+            return None
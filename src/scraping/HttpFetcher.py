@@ -0,0 +1,109 @@
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+
+from src.scraping.RateLimiter import rate_limiter
+from src.utils.logger_config import logger
+
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+)
+
+# urllib3 only decodes brotli when one of these packages is installed, so only ask for it then
+BROTLI_AVAILABLE = any(importlib.util.find_spec(name) for name in ("brotli", "brotlicffi"))
+ACCEPT_ENCODING = "gzip, deflate, br" if BROTLI_AVAILABLE else "gzip, deflate"
+
+# Status codes whose body is still a real SpareRoom page (e.g. an expired listing)
+USABLE_STATUS_CODES = {200, 404, 410}
+
+# Text that only shows up on bot-check or error pages
+BLOCKED_MARKERS = (
+    "cf-challenge",
+    "challenge-platform",
+    "<title>just a moment",
+    "<title>access denied",
+    "<title>attention required",
+)
+
+
+class HttpFetcher:
+    def __init__(self, workers: int = 4, timeout: Optional[float] = None) -> None:
+        """Fetch listing pages over plain HTTP without a browser.
+
+        Uses one pooled, keep-alive session. Compressed responses (gzip, deflate, and
+        brotli when `brotli` or `brotlicffi` is installed) are decoded by urllib3.
+        Requests are paced and retried by the shared rate limiter.
+
+        Args:
+            workers: Size of the connection pool and of the thread pool in fetch_all.
+            timeout: Timeout in seconds for each request (defaults to the rate limiter's).
+        """
+        self.workers = workers
+        self.timeout = timeout if timeout is not None else rate_limiter.timeout_seconds
+
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.headers.update(make_headers(keep_alive=True, accept_encoding=ACCEPT_ENCODING))
+        self._session.headers.update({
+            "User-Agent": USER_AGENT,
+            "Accept": "text/html,application/xhtml+xml",
+            "Accept-Language": "en-GB,en;q=0.9",
+        })
+
+    def fetch(self, url: str) -> Optional[str]:
+        """Fetch a page's HTML.
+
+        Returns:
+            The HTML, or None if the request failed or the response looks blocked or
+            incomplete, in which case callers should fall back to the browser.
+        """
+        try:
+            response = rate_limiter.call(
+                url,
+                lambda: self._session.get(url, timeout=self.timeout),
+                status=lambda response: response.status_code
+            )
+        except requests.RequestException as e:
+            logger.warning(f"HTTP fetch failed for {url}: {e}")
+            return None
+
+        if response.status_code not in USABLE_STATUS_CODES:
+            logger.warning(f"HTTP fetch got status {response.status_code} for {url}")
+            return None
+
+        html = response.text
+        if not self._looks_complete(html):
+            logger.warning(f"HTTP fetch returned an incomplete or blocked page for {url}")
+            return None
+
+        return html
+
+    def fetch_all(self, urls: list[str]) -> list[Optional[str]]:
+        """Fetch every URL across the connection pool, keeping the order of `urls`."""
+        if not urls:
+            return []
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            return list(executor.map(self.fetch, urls))
+
+    def set_cookies(self, cookies: list[dict]) -> None:
+        """Copy cookies from a browser context, e.g. so search results share its session"""
+        for cookie in cookies:
+            self._session.cookies.set(
+                cookie["name"], cookie["value"], domain=cookie.get("domain"), path=cookie.get("path", "/")
+            )
+
+    def close(self) -> None:
+        self._session.close()
+
+    @staticmethod
+    def _looks_complete(html: str) -> bool:
+        lowered = html.lower()
+        if "</html>" not in lowered[-2000:]:
+            return False
+        return not any(marker in lowered for marker in BLOCKED_MARKERS)
@@ -1,35 +1,119 @@
-from playwright.sync_api import sync_playwright
+import os
+from typing import Optional
+from playwright.sync_api import sync_playwright, Route
 from src.utils.logger_config import logger
+from src.scraping.RequestFilter import RequestFilter
 
 
 class PlaywrightSession:
-    def __init__(self, headless: bool) -> None:
+    def __init__(
+        self,
+        headless: bool,
+        request_filter: Optional[RequestFilter] = None,
+        browser_mode: str = "launch",
+        profile_path: str = "data/browser_profile",
+        storage_state_path: Optional[str] = None,
+        cdp_endpoint: Optional[str] = None
+    ) -> None:
+        """Open a browser page for the pipeline.
+
+        Args:
+            headless: Whether to run the browser headless.
+            request_filter: Rules for aborting unneeded requests.
+            browser_mode: "launch" starts a fresh browser, restoring cookies from
+                `storage_state_path`; "persistent" reuses the profile (cache and cookies)
+                in `profile_path`; "cdp" attaches to a running browser at `cdp_endpoint`,
+                e.g. one started with `python main.py --serve_browser`, and launches one
+                instead if nothing is listening.
+            profile_path: Browser profile directory for the "persistent" mode.
+            storage_state_path: File cookies and local storage are saved to and restored
+                from in the "launch" mode.
+            cdp_endpoint: Address of the running browser for the "cdp" mode.
+        """
         self.headless = headless
+        self.request_filter = request_filter
+        self.browser_mode = browser_mode
+        self.profile_path = profile_path
+        self.storage_state_path = storage_state_path
+        self.cdp_endpoint = cdp_endpoint
         self.playwright = None
         self.browser = None
         self.context = None
         self.page = None
+        self._owns_context = True
 
     def __enter__(self):
         self.playwright = sync_playwright().start()
+
+        if self.browser_mode == "persistent":
+            self._launch_persistent()
+        elif not (self.browser_mode == "cdp" and self._connect()):
+            self._launch()
+
+        if self.request_filter:
+            self.page.route("**/*", self._handle_route)
+            self.page.on("response", lambda response: self.request_filter.record_response_size(response.headers))
+
+        logger.info(f"Opened browser page ({self.browser_mode}).")
+        return self
+
+    def _launch(self) -> None:
         self.browser = self.playwright.chromium.launch(headless=self.headless)
+        storage_state = None
+        if self.storage_state_path and os.path.exists(self.storage_state_path):
+            storage_state = self.storage_state_path
+        self.context = self.browser.new_context(storage_state=storage_state, **self._viewport())
+        self.page = self.context.new_page()
 
-        if self.headless:
-            self.page = self.browser.new_page()
+    def _launch_persistent(self) -> None:
+        os.makedirs(self.profile_path, exist_ok=True)
+        self.context = self.playwright.chromium.launch_persistent_context(
+            self.profile_path, headless=self.headless, **self._viewport()
+        )
+        self.page = self.context.pages[0] if self.context.pages else self.context.new_page()
+
+    def _connect(self) -> bool:
+        """Attach to a running browser, reusing its default context so its cache is warm"""
+        try:
+            self.browser = self.playwright.chromium.connect_over_cdp(self.cdp_endpoint)
+        except Exception as e:
+            logger.warning(f"Couldn't connect to a browser at {self.cdp_endpoint} ({e}), launching one instead")
+            return False
+
+        if self.browser.contexts:
+            self.context = self.browser.contexts[0]
+            self._owns_context = False
         else:
-            self.context = self.browser.new_context(viewport={"width": 1200, "height": 1200})
-            self.page = self.context.new_page()
+            self.context = self.browser.new_context(**self._viewport())
+        self.page = self.context.new_page()
+        return True
+
+    def _viewport(self) -> dict:
+        return {} if self.headless else {"viewport": {"width": 1200, "height": 1200}}
+
+    def _handle_route(self, route: Route) -> None:
+        request = route.request
+        if self.request_filter.should_block(request.resource_type, request.url):
+            route.abort()
+        else:
+            route.continue_()
 
-        logger.info("Launched browser.")
-        return self
-    
     def __exit__(self, exc_type, exec_value, traceback):
+        if self.context and self._owns_context and self.browser_mode != "persistent" and self.storage_state_path:
+            try:
+                os.makedirs(os.path.dirname(self.storage_state_path) or ".", exist_ok=True)
+                self.context.storage_state(path=self.storage_state_path)
+            except Exception as e:
+                logger.warning(f"Couldn't save browser storage state: {e}")
         if self.page:
             self.page.close()
-        if self.context:
+        if self.context and self._owns_context:
             self.context.close()
         if self.browser:
+            # Closes a launched browser; only disconnects from one attached over CDP
             self.browser.close()
         if self.playwright:
             self.playwright.stop()
+        if self.request_filter:
+            self.request_filter.log_stats()
         logger.info("Closed playwright session")
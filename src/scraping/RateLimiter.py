@@ -0,0 +1,222 @@
+import asyncio
+import random
+import threading
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+from urllib.parse import urlparse
+
+from config import RATE_LIMIT
+from src.utils.logger_config import logger
+
+T = TypeVar("T")
+
+# Responses that mean the site wants us to slow down
+THROTTLE_STATUS_CODES = {429, 503}
+
+# How much the concurrency limit shrinks after a throttled or slow response
+THROTTLE_DECREASE = 0.5
+LATENCY_DECREASE = 0.9
+
+# How often a request waiting for a free slot checks again
+SLOT_POLL_SECONDS = 0.05
+
+
+class _HostState:
+    def __init__(self, burst: float, concurrency: float) -> None:
+        self.tokens = burst
+        self.refilled_at = time.monotonic()
+        self.limit = concurrency
+        self.in_flight = 0
+        self.paused_until = 0.0
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        requests_per_second: float,
+        burst: float,
+        min_concurrency: int,
+        max_concurrency: int,
+        target_latency_seconds: float,
+        max_retries: int,
+        backoff_seconds: float,
+        max_backoff_seconds: float,
+        timeout_seconds: float
+    ) -> None:
+        """Pace and retry every request the scrapers make, per host.
+
+        Each host gets a token bucket refilled at `requests_per_second`, and a
+        concurrency limit that shrinks multiplicatively after a 429/503 or a response
+        slower than the target latency, and grows back by one per window of fast
+        responses. The limit starts at `max_concurrency`, so parallel workers aren't
+        serialised while it ramps up; the bucket already paces the request rate.
+        Failed and throttled requests are retried with full-jitter exponential backoff,
+        and a throttled host is paused for the backoff so other workers hold off too.
+        The timeout for page loads is configured here as well.
+
+        Args:
+            requests_per_second: Token refill rate per host (0 disables the bucket).
+            burst: Bucket size, i.e. requests allowed at once after an idle spell.
+            min_concurrency: Lowest concurrency limit per host.
+            max_concurrency: Highest concurrency limit per host.
+            target_latency_seconds: Responses slower than this count as congestion.
+            max_retries: Retries after a failed or throttled request.
+            backoff_seconds: Base of the exponential backoff between retries.
+            max_backoff_seconds: Cap on a single backoff.
+            timeout_seconds: Timeout for each request or page load.
+        """
+        if min_concurrency < 1 or max_concurrency < min_concurrency:
+            raise ValueError("Need 1 <= min_concurrency <= max_concurrency")
+
+        self.requests_per_second = requests_per_second
+        self.burst = max(1.0, burst)
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.target_latency_seconds = target_latency_seconds
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.timeout_seconds = timeout_seconds
+
+        self._lock = threading.Lock()
+        self._hosts: dict[str, _HostState] = {}
+        self.reset_stats()
+
+    def call(self, url: str, request: Callable[[], T], status: Callable[[T], Optional[int]]) -> T:
+        """Run `request` for `url` once it's allowed, retrying failures and throttling.
+
+        Args:
+            url: URL being requested, whose host decides which limits apply.
+            request: Makes the request and returns its response.
+            status: Reads the HTTP status code from the response, if there is one.
+
+        Returns:
+            The last response, which may still be throttled once retries run out.
+
+        Raises:
+            The request's exception when it still fails after every retry.
+        """
+        host = self._host_of(url)
+        for attempt in range(self.max_retries + 1):
+            while (wait := self._try_acquire(host)) > 0:
+                time.sleep(wait)
+
+            started = time.monotonic()
+            try:
+                response = request()
+            except Exception:
+                self._release(host, time.monotonic() - started, throttled=False, failed=True)
+                if attempt == self.max_retries:
+                    raise
+                time.sleep(self._backoff(host, attempt, throttled=False))
+                continue
+
+            throttled = status(response) in THROTTLE_STATUS_CODES
+            self._release(host, time.monotonic() - started, throttled=throttled, failed=False)
+            if not throttled or attempt == self.max_retries:
+                return response
+            time.sleep(self._backoff(host, attempt, throttled=True))
+
+        raise AssertionError("unreachable")
+
+    async def call_async(
+        self, url: str, request: Callable[[], Awaitable[T]], status: Callable[[T], Optional[int]]
+    ) -> T:
+        """Async version of call, for the Playwright page pool"""
+        host = self._host_of(url)
+        for attempt in range(self.max_retries + 1):
+            while (wait := self._try_acquire(host)) > 0:
+                await asyncio.sleep(wait)
+
+            started = time.monotonic()
+            try:
+                response = await request()
+            except Exception:
+                self._release(host, time.monotonic() - started, throttled=False, failed=True)
+                if attempt == self.max_retries:
+                    raise
+                await asyncio.sleep(self._backoff(host, attempt, throttled=False))
+                continue
+
+            throttled = status(response) in THROTTLE_STATUS_CODES
+            self._release(host, time.monotonic() - started, throttled=throttled, failed=False)
+            if not throttled or attempt == self.max_retries:
+                return response
+            await asyncio.sleep(self._backoff(host, attempt, throttled=True))
+
+        raise AssertionError("unreachable")
+
+    def reset_stats(self) -> None:
+        self.requests = 0
+        self.retries = 0
+        self.throttled = 0
+        self.failed = 0
+        self.total_latency = 0.0
+
+    def log_stats(self) -> None:
+        if not self.requests:
+            return
+        limits = {host: round(state.limit, 1) for host, state in self._hosts.items()}
+        logger.info(
+            f"Requests: {self.requests}, retries: {self.retries}, throttled: {self.throttled}, "
+            f"failed: {self.failed}, mean latency: {self.total_latency / self.requests:.2f}s, "
+            f"concurrency limits: {limits}"
+        )
+
+    def _try_acquire(self, host: str) -> float:
+        """Take a slot and a token for `host`, or return how long to wait before trying again"""
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                state = self._hosts[host] = _HostState(self.burst, float(self.max_concurrency))
+
+            now = time.monotonic()
+            if now < state.paused_until:
+                return state.paused_until - now
+            if state.in_flight >= int(state.limit):
+                return SLOT_POLL_SECONDS
+
+            if self.requests_per_second > 0:
+                elapsed = now - state.refilled_at
+                state.tokens = min(self.burst, state.tokens + elapsed * self.requests_per_second)
+                state.refilled_at = now
+                if state.tokens < 1:
+                    return (1 - state.tokens) / self.requests_per_second
+                state.tokens -= 1
+
+            state.in_flight += 1
+            return 0.0
+
+    def _release(self, host: str, latency: float, throttled: bool, failed: bool) -> None:
+        with self._lock:
+            state = self._hosts[host]
+            state.in_flight -= 1
+
+            self.requests += 1
+            self.total_latency += latency
+            self.throttled += throttled
+            self.failed += failed
+
+            if throttled or failed:
+                state.limit *= THROTTLE_DECREASE
+            elif self.target_latency_seconds and latency > self.target_latency_seconds:
+                state.limit *= LATENCY_DECREASE
+            else:
+                state.limit += 1 / state.limit
+            state.limit = min(self.max_concurrency, max(self.min_concurrency, state.limit))
+
+    def _backoff(self, host: str, attempt: int, throttled: bool) -> float:
+        delay = random.uniform(0, min(self.max_backoff_seconds, self.backoff_seconds * 2 ** attempt))
+        with self._lock:
+            self.retries += 1
+            if throttled:
+                state = self._hosts[host]
+                state.paused_until = max(state.paused_until, time.monotonic() + delay)
+        return delay
+
+    @staticmethod
+    def _host_of(url: str) -> str:
+        return (urlparse(url).hostname or "").lower()
+
+
+rate_limiter = RateLimiter(**RATE_LIMIT)
@@ -0,0 +1,69 @@
+from collections import Counter
+from urllib.parse import urlparse
+
+from src.utils.logger_config import logger
+
+# Rough average transfer sizes, used to estimate what blocking a request saves
+ESTIMATED_RESOURCE_BYTES = {
+    "image": 150_000,
+    "media": 500_000,
+    "font": 40_000,
+    "stylesheet": 30_000,
+    "script": 60_000,
+    "xhr": 5_000,
+    "fetch": 5_000,
+}
+
+
+class RequestFilter:
+    def __init__(self, blocked_resource_types: list[str], blocked_domains: list[str]) -> None:
+        """Decide which browser requests to abort and count what was blocked.
+
+        Args:
+            blocked_resource_types: Playwright resource types to abort, e.g. "image" or "font".
+            blocked_domains: Hosts to abort, including their subdomains.
+        """
+        self.blocked_resource_types = set(blocked_resource_types)
+        self.blocked_domains = tuple(d.lower().lstrip(".") for d in blocked_domains)
+
+        self.allowed = 0
+        self.blocked = 0
+        self.blocked_by_type: Counter[str] = Counter()
+        self.allowed_bytes = 0
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        """Return whether a request should be aborted, and count it either way."""
+        if resource_type in self.blocked_resource_types or self._is_blocked_domain(url):
+            self.blocked += 1
+            self.blocked_by_type[resource_type] += 1
+            return True
+
+        self.allowed += 1
+        return False
+
+    def record_response_size(self, headers: dict[str, str]) -> None:
+        """Add an allowed response's Content-Length to the transferred total."""
+        try:
+            self.allowed_bytes += int(headers.get("content-length", 0))
+        except ValueError:
+            pass
+
+    @property
+    def estimated_bytes_saved(self) -> int:
+        return sum(
+            ESTIMATED_RESOURCE_BYTES.get(resource_type, 0) * count
+            for resource_type, count in self.blocked_by_type.items()
+        )
+
+    def log_stats(self) -> None:
+        logger.info(
+            f"Requests allowed: {self.allowed} ({self.allowed_bytes / 1e6:.1f} MB), "
+            f"blocked: {self.blocked} (estimated {self.estimated_bytes_saved / 1e6:.1f} MB saved), "
+            f"blocked by type: {dict(self.blocked_by_type)}"
+        )
+
+    def _is_blocked_domain(self, url: str) -> bool:
+        if not self.blocked_domains:
+            return False
+        host = (urlparse(url).hostname or "").lower()
+        return any(host == d or host.endswith(f".{d}") for d in self.blocked_domains)
@@ -0,0 +1,114 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from playwright.async_api import async_playwright, Browser, Playwright, Route
+
+from src.utils.logger_config import logger
+from src.scraping.RequestFilter import RequestFilter
+from src.scraping.RateLimiter import rate_limiter
+
+
+class RoomPagePool:
+    def __init__(
+        self,
+        headless: bool,
+        workers: int,
+        request_filter: Optional[RequestFilter] = None,
+        cdp_endpoint: Optional[str] = None
+    ) -> None:
+        """Fetch listing pages concurrently on a pool of Playwright pages.
+
+        Page loads are paced and retried by the shared rate limiter, which may allow
+        fewer loads at once than there are workers.
+
+        Args:
+            headless: Whether to run the pool's browser headless.
+            workers: Number of pages fetching listings at the same time.
+            request_filter: Rules for aborting unneeded requests, shared with the main session.
+            cdp_endpoint: Running browser to open the pool's pages in instead of launching one.
+        """
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+
+        self.headless = headless
+        self.workers = workers
+        self.request_filter = request_filter
+        self.cdp_endpoint = cdp_endpoint
+
+    def fetch_all(self, urls: list[str]) -> list[Optional[str]]:
+        """Fetch the HTML of every URL, keeping the order of `urls`.
+
+        The async Playwright API can't share a thread with the sync session the
+        pipeline already has open, so the pool runs its event loop in its own thread.
+
+        Returns:
+            The HTML of each listing, or None where the page couldn't be loaded.
+        """
+        if not urls:
+            return []
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, self._fetch_all(urls)).result()
+
+    async def _fetch_all(self, urls: list[str]) -> list[Optional[str]]:
+        queue: asyncio.Queue[tuple[int, str]] = asyncio.Queue()
+        for item in enumerate(urls):
+            queue.put_nowait(item)
+
+        results: list[Optional[str]] = [None] * len(urls)
+
+        async with async_playwright() as playwright:
+            browser = await self._open_browser(playwright)
+            try:
+                workers = [
+                    self._worker(browser, queue, results, len(urls))
+                    for _ in range(min(self.workers, len(urls)))
+                ]
+                await asyncio.gather(*workers)
+            finally:
+                await browser.close()
+
+        print()
+        return results
+
+    async def _open_browser(self, playwright: Playwright) -> Browser:
+        if self.cdp_endpoint:
+            try:
+                return await playwright.chromium.connect_over_cdp(self.cdp_endpoint)
+            except Exception as e:
+                logger.warning(f"Couldn't connect to a browser at {self.cdp_endpoint} ({e}), launching one instead")
+        return await playwright.chromium.launch(headless=self.headless)
+
+    async def _worker(
+        self, browser: Browser, queue: asyncio.Queue, results: list[Optional[str]], total: int
+    ) -> None:
+        context = await browser.new_context()
+        page = await context.new_page()
+        if self.request_filter:
+            await page.route("**/*", self._handle_route)
+            page.on("response", lambda response: self.request_filter.record_response_size(response.headers))
+
+        try:
+            while not queue.empty():
+                i, url = queue.get_nowait()
+                try:
+                    await rate_limiter.call_async(
+                        url,
+                        lambda: page.goto(url, timeout=rate_limiter.timeout_seconds * 1000),
+                        status=lambda response: response.status if response else None
+                    )
+                    results[i] = await page.content()
+                except Exception as e:
+                    logger.warning(f"Failed to fetch {url}: {e}")
+
+                done = sum(r is not None for r in results)
+                print(f"\rFetching new rooms: {done}/{total}.", end="", flush=True)
+        finally:
+            await context.close()
+
+    async def _handle_route(self, route: Route) -> None:
+        request = route.request
+        if self.request_filter.should_block(request.resource_type, request.url):
+            await route.abort()
+        else:
+            await route.continue_()
@@ -6,14 +6,36 @@ from bs4.element import Tag, PageElement
 
 import src.utils.utils as ut
 from src.utils.logger_config import logger
+from src.scraping.RateLimiter import rate_limiter
 from src.services.CommuteService import coordinates
 
+LOCATION_PATTERN = re.compile(r'location:\s*{[^}]*latitude:\s*"([^"]+)",\s*longitude:\s*"([^"]+)"')
+PART_WEEK_LETTINGS = ("Room available Monday to Friday only", "Room available weekends only")
+KEY_FEATURE_NAMES = ["type", "area", "postcode", "nearest_station"]
+COLLECTIVE_WORDS = {
+    "we", "us", "our", "ours",
+    "together", "household", "home",
+    "shared", "sharing"
+}
+
+
+class PageLoadError(Exception):
+    """A listing page couldn't be loaded, even after the rate limiter's retries"""
+
 
 class RoomScraper:
-    def __init__(self, page: Page, url: str):
+    def __init__(self, page: Optional[Page], url: str, html: Optional[str] = None):
+        """Load a listing page and parse it.
+
+        Args:
+            page: Playwright page used to fetch the listing when `html` isn't given.
+            url: URL of the listing.
+            html: Already-fetched HTML of the listing, e.g. from a concurrent fetcher.
+        """
         self.page = page
         self.url = url
-        self.soup: BeautifulSoup = self._get_room_soup()
+        self.html: str = html if html is not None else self._get_room_html()
+        self.soup: BeautifulSoup = BeautifulSoup(self.html, "html.parser")
 
     def parse_sidebar(self) -> tuple[bool, bool]:
         expired = self.soup.select_one('section.listing-contact--expired')
@@ -44,10 +66,18 @@ class RoomScraper:
 
         return room_data
 
-    def _get_room_soup(self) -> BeautifulSoup:
-        self.page.goto(self.url, timeout=10000)
-        html: str = self.page.content()
-        return BeautifulSoup(html, "html.parser")
+    def _get_room_html(self) -> str:
+        if self.page is None:
+            raise PageLoadError(f"No page available to fetch {self.url}")
+        try:
+            rate_limiter.call(
+                self.url,
+                lambda: self.page.goto(self.url, timeout=rate_limiter.timeout_seconds * 1000),
+                status=lambda response: response.status if response else None
+            )
+        except Exception as e:
+            raise PageLoadError(f"Couldn't load {self.url}: {e}") from e
+        return self.page.content()
 
     def _get_text(self, page_element: Optional[PageElement], default: str = "") -> str:
         return page_element.get_text(strip=True) if page_element else default
@@ -60,24 +90,33 @@ class RoomScraper:
     def _letting_available_all_week(self) -> bool:
         """Extract bool for whether room is available 24/7"""
         feature_list: Optional[Tag] = self.soup.select_one("ul.feature-list")
-        if feature_list:
-            for li in feature_list.find_all("li"):
-                text = self._get_text(li)
-                if text in ["Room available Monday to Friday only", "Room available weekends only"]:
-                    return False
-        return True
+        if not feature_list:
+            return True
+        return self._available_all_week_from_texts(self._get_text(li) for li in feature_list.find_all("li"))
 
     def _get_key_features(self) -> Dict[str, str]:
         """Extract key features: type, area, postcode, nearest_station"""
-        key_names = ["type", "area", "postcode", "nearest_station"]
-        features: Dict[str, str] = dict.fromkeys(key_names, "")
-
         ul: Optional[Tag] = self.soup.select_one("ul.key-features")
-        if not ul:
-            return features
+        texts = [self._get_text(li) for li in ul.find_all("li")] if ul else []
+        return self._key_features_from_texts(texts)
+
+    def _get_feature_list(self) -> Dict[str, str]:
+        """Get detailed dictionary of room features"""
+        pairs = []
+        for dl in self.soup.select("dl.feature-list"):
+            dt_tags = dl.find_all("dt")
+            dd_tags = dl.find_all("dd")
+            pairs.extend((self._get_text(dt), self._get_text(dd)) for dt, dd in zip(dt_tags, dd_tags))
+        return self._feature_list_from_pairs(pairs)
+
+    @staticmethod
+    def _available_all_week_from_texts(texts) -> bool:
+        return not any(text in PART_WEEK_LETTINGS for text in texts)
 
-        for i, li in enumerate(ul.find_all("li")):
-            text = self._get_text(li)
+    @staticmethod
+    def _key_features_from_texts(texts: list[str]) -> Dict[str, str]:
+        features: Dict[str, str] = dict.fromkeys(KEY_FEATURE_NAMES, "")
+        for i, text in enumerate(texts):
             if i == 0:
                 text = " ".join(line.strip() for line in text.splitlines() if line.strip())
             elif i == 1:
@@ -87,25 +126,18 @@ class RoomScraper:
             elif i == 3:
                 text = text.split("Station")[0]
 
-            if i < len(key_names):
-                features[key_names[i]] = text
+            if i < len(KEY_FEATURE_NAMES):
+                features[KEY_FEATURE_NAMES[i]] = text
         return features
 
-    def _get_feature_list(self) -> Dict[str, str]:
-        """Get detailed dictionary of room features"""
-        features: Dict[str, str] = {}
-        for dl in self.soup.select("dl.feature-list"):
-            dt_tags = dl.find_all("dt")
-            dd_tags = dl.find_all("dd")
-            for dt, dd in zip(dt_tags, dd_tags):
-                key = "_".join(dt.get_text(strip=True).lower().split())
-                value = dd.get_text(strip=True)
-                features[key] = value
-        return features
-    
+    @staticmethod
+    def _feature_list_from_pairs(pairs: list[tuple[str, str]]) -> Dict[str, str]:
+        """Turn (dt, dd) text pairs into snake_case keys and values"""
+        return {"_".join(dt.lower().split()): dd for dt, dd in pairs}
+
     def _get_location(self) -> coordinates:
-        pattern = r'location:\s*{[^}]*latitude:\s*"([^"]+)",\s*longitude:\s*"([^"]+)"'
-        match = re.search(pattern, str(self.soup))
+        """Read coordinates straight from the raw HTML of the listing's inline script"""
+        match = LOCATION_PATTERN.search(self.html)
         if match:
             try:
                 latitude = round(float(match.group(1)), 6)
@@ -123,14 +155,10 @@ class RoomScraper:
 
     def _get_collective_word_count(self) -> int:
         element = self.soup.select_one("p.detaildesc")
-        text = self._get_text(element)
+        return self._collective_word_count_from_text(self._get_text(element))
 
+    @staticmethod
+    def _collective_word_count_from_text(text: str) -> int:
         words = text.split(" ")
-
-        COLLECTIVE_WORDS = {
-            "we", "us", "our", "ours",
-            "together", "household", "home",
-            "shared", "sharing"
-        }
         collective_words = [w for w in words if w in COLLECTIVE_WORDS]
         return len(collective_words)
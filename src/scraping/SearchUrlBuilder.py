@@ -0,0 +1,55 @@
+from urllib.parse import urlencode
+
+from src.utils.types import SearchCriteria
+
+SEARCH_PATH = "flatshare/search.pl"
+
+# Query parameters the advanced search form submits for each criterion
+PARAM_NAMES = {
+    "location": "search",
+    "min_rent": "min_rent",
+    "max_rent": "max_rent",
+    "double_room_only": "room_types",
+    "whole_week_only": "days_of_wk_available",
+    "photos_only": "photoads_only",
+    "private_landlords_only": "landlord",
+    "min_term_months": "min_term",
+}
+
+# Always sent: only rooms in shared flats, no studios or whole properties
+FIXED_PARAMS = [
+    ("searchtype", "advanced"),
+    ("flatshare_type", "offered"),
+    ("showme_rooms", "Y"),
+    ("showme_1beds", "N"),
+    ("showme_buddyup_properties", "N"),
+]
+
+
+class SearchUrlBuilder:
+    def __init__(self, domain: str) -> None:
+        """Turn search criteria into the results URL the advanced search form leads to.
+
+        Args:
+            domain: SpareRoom domain, e.g. "https://www.spareroom.co.uk".
+        """
+        self.domain = domain
+
+    def build(self, criteria: SearchCriteria) -> str:
+        params = FIXED_PARAMS + [
+            (PARAM_NAMES["location"], criteria.location),
+            (PARAM_NAMES["min_rent"], str(criteria.min_rent)),
+            (PARAM_NAMES["max_rent"], str(criteria.max_rent)),
+        ]
+        if criteria.double_room_only:
+            params.append((PARAM_NAMES["double_room_only"], "double"))
+        if criteria.whole_week_only:
+            params.append((PARAM_NAMES["whole_week_only"], "7 days"))
+        if criteria.photos_only:
+            params.append((PARAM_NAMES["photos_only"], "Y"))
+        if criteria.private_landlords_only:
+            params.append((PARAM_NAMES["private_landlords_only"], "private"))
+        if criteria.min_term_months:
+            params.append((PARAM_NAMES["min_term_months"], str(criteria.min_term_months)))
+
+        return f"{self.domain}/{SEARCH_PATH}?{urlencode(params)}"
@@ -1,10 +1,69 @@
+from typing import Optional, Callable
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+import lxml.html
 from src.utils.logger_config import logger
+from src.scraping.HttpFetcher import HttpFetcher
+from src.scraping.RateLimiter import rate_limiter
+
+
+class KnownListingStop:
+    def __init__(self, is_known: Callable[[str], bool], known_pages: int, known_listings: int) -> None:
+        """Decide when an incremental crawl has reached listings it has already seen.
+
+        Results are sorted newest first, so once whole pages (or a long run of listings)
+        are all known, everything after them is known too.
+
+        Args:
+            is_known: Returns True for a listing URL that is in the database or ignored.
+            known_pages: Stop after this many consecutive pages of known listings (0 disables).
+            known_listings: Stop after this many consecutive known listings (0 disables).
+        """
+        self.is_known = is_known
+        self.known_pages = known_pages
+        self.known_listings = known_listings
+
+        self._known_page_run = 0
+        self._known_listing_run = 0
+
+    def should_stop(self, page_urls: list[str]) -> bool:
+        """Record one results page, in feed order, and return whether to stop paginating"""
+        page_all_known = True
+        for url in page_urls:
+            if self.is_known(url):
+                self._known_listing_run += 1
+            else:
+                self._known_listing_run = 0
+                page_all_known = False
+
+        self._known_page_run = self._known_page_run + 1 if page_all_known else 0
+
+        return bool(
+            (self.known_pages and self._known_page_run >= self.known_pages)
+            or (self.known_listings and self._known_listing_run >= self.known_listings)
+        )
 
 
 class SpareRoomScraper:
-    def __init__(self, page, domain: str) -> None:
+    def __init__(
+        self,
+        page,
+        domain: str,
+        fetcher: Optional[HttpFetcher] = None,
+        early_stop: Optional[KnownListingStop] = None
+    ) -> None:
+        """Collect listing URLs from SpareRoom search results.
+
+        Args:
+            page: Playwright page showing the first page of search results.
+            domain: SpareRoom domain.
+            fetcher: If given, result pages 2..N are fetched concurrently with it
+                     instead of clicking through them one at a time.
+            early_stop: If given, stop paginating once results are all already known.
+        """
         self.page = page
         self.domain = domain
+        self.fetcher = fetcher
+        self.early_stop = early_stop
 
     def collect_room_urls(self, pages: int) -> list[str]:
         """Iterate through listing pages and collect room URLs.
@@ -16,6 +75,17 @@ class SpareRoomScraper:
         # Sort by newest listings first
         self.page.select_option("#sort_by", value="days_since_placed")
 
+        if self.fetcher is not None and pages > 1:
+            all_urls = self._collect_in_parallel(pages)
+        else:
+            all_urls = self._collect_in_sequence(pages)
+
+        logger.info(f"Retrieved {len(all_urls)} rooms")
+        
+        all_urls = list(dict.fromkeys(all_urls))
+        return all_urls
+
+    def _collect_in_sequence(self, pages: int) -> list[str]:
         all_urls = []
         for i in range(pages):
             logger.info(f"Scanning page {i+1}")
@@ -23,28 +93,115 @@ class SpareRoomScraper:
             page_urls = self._get_room_urls_on_page()
             all_urls.extend(page_urls)
 
+            if self._reached_known_listings(page_urls):
+                break
+
             try:
                 self._click_next_page()
             except (StopIteration, ValueError):
                 logger.info("No more pages to scrape")
                 break
+        return all_urls
 
-        logger.info(f"Retrieved {len(all_urls)} rooms")
-        
-        all_urls = list(dict.fromkeys(all_urls))
+    def _collect_in_parallel(self, pages: int) -> list[str]:
+        """Read the first page, then fetch pages 2..N concurrently from its pagination URL.
+
+        Pages are fetched in batches of `fetcher.workers` and read in order, so an
+        incremental crawl stops after the batch in which it reaches known listings.
+        Falls back to clicking through pages if the pagination URL can't be worked out.
+        """
+        first_page_urls = self._get_room_urls_on_page()
+        if self._reached_known_listings(first_page_urls):
+            return first_page_urls
+
+        template = self._learn_page_template()
+        if template is None:
+            logger.warning("Couldn't learn the pagination URL, scanning pages in sequence")
+            return self._collect_in_sequence(pages)
+
+        self.fetcher.set_cookies(self.page.context.cookies())
+        page_urls = [self._build_page_url(*template, page_index=i) for i in range(1, pages)]
+        batch_size = self.fetcher.workers if self.early_stop else len(page_urls)
+
+        all_urls = list(first_page_urls)
+        previous = first_page_urls
+        for start in range(0, len(page_urls), batch_size):
+            batch = page_urls[start:start + batch_size]
+            logger.info(f"Fetching pages {start + 2}-{start + len(batch) + 1} concurrently")
+
+            for page_url, html in zip(batch, self.fetcher.fetch_all(batch)):
+                if html is None:
+                    html = self._fetch_with_browser(page_url)
+
+                page_urls_found = self.parse_room_urls(html)
+                # Past the last page the site returns nothing, or repeats the last page
+                if not page_urls_found or page_urls_found == previous:
+                    logger.info("No more pages to scrape")
+                    return all_urls
+
+                all_urls.extend(page_urls_found)
+                previous = page_urls_found
+
+                if self._reached_known_listings(page_urls_found):
+                    return all_urls
         return all_urls
 
+    def _reached_known_listings(self, page_urls: list[str]) -> bool:
+        if self.early_stop is None or not self.early_stop.should_stop(page_urls):
+            return False
+        logger.info("Reached listings that are already known, stopping early")
+        return True
+
+    def _learn_page_template(self) -> Optional[tuple[str, list[tuple[str, str]], int]]:
+        """Return (base url, query params, page size) from the next page link"""
+        next_button = self.page.query_selector("#paginationNextPageLink")
+        href = next_button.get_attribute("href") if next_button else None
+        if not href:
+            return None
+
+        url = f"{self.domain}/flatshare/{href}"
+        params = parse_qsl(urlsplit(url).query, keep_blank_values=True)
+        offsets = [value for key, value in params if key == "offset"]
+        if len(offsets) != 1 or not offsets[0].isdigit() or int(offsets[0]) <= 0:
+            return None
+
+        return url, params, int(offsets[0])
+
+    @staticmethod
+    def _build_page_url(url: str, params: list[tuple[str, str]], page_size: int, page_index: int) -> str:
+        query = urlencode([
+            (key, str(page_index * page_size) if key == "offset" else value)
+            for key, value in params
+        ])
+        return urlunsplit(urlsplit(url)._replace(query=query))
+
+    def _fetch_with_browser(self, url: str) -> str:
+        self._goto(url)
+        return self.page.content()
+
+    def _goto(self, url: str) -> None:
+        rate_limiter.call(
+            url,
+            lambda: self.page.goto(url, wait_until="load", timeout=rate_limiter.timeout_seconds * 1000),
+            status=lambda response: response.status if response else None
+        )
+
     def _get_room_urls_on_page(self) -> list[str]:
         self.page.wait_for_selector("ul.listing-results")
-        rooms = self.page.query_selector_all("ul.listing-results li")
-        urls = []
-
-        for room in rooms:
-            room_url = room.get_attribute("data-listing-url")
-            if room_url:
-                urls.append(room_url)
+        return self.parse_room_urls(self.page.content())
 
-        return urls
+    @staticmethod
+    def parse_room_urls(html: str) -> list[str]:
+        """Return the listing URLs of a search results page, in page order"""
+        root = lxml.html.document_fromstring(html)
+        return [
+            room_url
+            for room_url in root.xpath(
+                '//ul[contains(concat(" ", normalize-space(@class), " "), " listing-results ")]'
+                '//li/@data-listing-url'
+            )
+            if room_url
+        ]
     
     def _click_next_page(self) -> None:
         next_button = self.page.query_selector("#paginationNextPageLink")
@@ -57,4 +214,4 @@ class SpareRoomScraper:
             logger.warning("Next button has no href")
             raise ValueError("Invalid next page link")
         
-        self.page.goto(f"{self.domain}/flatshare/{href}", wait_until="load")
+        self._goto(f"{self.domain}/flatshare/{href}")
@@ -1,4 +1,10 @@
+from src.scraping.RateLimiter import rate_limiter
+from src.scraping.SearchUrlBuilder import SearchUrlBuilder
 from src.utils.logger_config import logger
+from src.utils.types import SearchCriteria
+
+# Pause after filling each search form field, so the form's scripts can keep up
+FORM_FILL_DELAY_MS = 500
 
 
 class SpareRoomSearcher:
@@ -6,35 +12,70 @@ class SpareRoomSearcher:
         self.page = page
         self.domain = domain
 
-        search_url = "flatshare/search.pl?searchtype=advanced"
-        self.page.goto(f"{self.domain}/{search_url}", timeout=10000)
-
-    def run(self, min_rent: int, max_rent: int) -> None:
-        """Perform a search on Spareroom with specified rent filters.
+    def run(self, criteria: SearchCriteria, method: str = "url") -> None:
+        """Perform a search on Spareroom for the given criteria.
 
-        Fills the search form on the Spareroom website for London listings,
-        applies the given minimum and maximum rent, sets predefined search
-        filters (room type, availability, photos, etc.), and submits the search.
+        Opens the results URL for the criteria directly. If that page doesn't show any
+        results, or `method` is "form", fills in the advanced search form instead.
         """
+        if method == "url":
+            try:
+                self._search_with_url(criteria)
+                logger.info("Searching Spareroom.")
+                return
+            except Exception as e:
+                logger.warning(f"Search URL didn't load results ({e}), falling back to the search form")
+
+        self._search_with_form(criteria)
+        logger.info("Searching Spareroom.")
+
+    def _search_with_url(self, criteria: SearchCriteria) -> None:
+        url = SearchUrlBuilder(domain=self.domain).build(criteria)
+        self._goto(url)
+        self.page.wait_for_selector("ul.listing-results", timeout=rate_limiter.timeout_seconds * 1000)
+
+    def _search_with_form(self, criteria: SearchCriteria) -> None:
+        """Fill the advanced search form with the criteria and submit it"""
+        self._goto(f"{self.domain}/flatshare/search.pl?searchtype=advanced")
+
         # Fill input boxes
-        self._fill_element(selector='#search_by_location_field', value="London")
-        self._fill_element(selector='#min-rent', value=str(min_rent))
-        self._fill_element(selector='#max-rent', value=str(max_rent))
+        self._fill_element(selector='#search_by_location_field', value=criteria.location)
+        self._fill_element(selector='#min-rent', value=str(criteria.min_rent))
+        self._fill_element(selector='#max-rent', value=str(criteria.max_rent))
 
         # Check boxes
-        self.page.evaluate("""document.getElementById('oneBedOrStudio').checked = false;""")
-        self.page.evaluate("""document.getElementById('wholeProperty').checked = false;""")
-        self.page.evaluate("""document.getElementById('wholeWeek').checked = true;""")
-        self.page.evaluate("""document.getElementById('doubleRoom').checked = true;""")
-        self.page.evaluate("""document.getElementById('adsWithPhoto').checked = true;""")
-        self.page.evaluate("""document.getElementById('privateLandlords').checked = true;""")
-        self.page.evaluate("""document.querySelector('select[name="min_term"]').value = '6';""")
+        self.page.evaluate(
+            """(c) => {
+                document.getElementById('oneBedOrStudio').checked = false;
+                document.getElementById('wholeProperty').checked = false;
+                document.getElementById('wholeWeek').checked = c.whole_week_only;
+                document.getElementById('doubleRoom').checked = c.double_room_only;
+                document.getElementById('adsWithPhoto').checked = c.photos_only;
+                document.getElementById('privateLandlords').checked = c.private_landlords_only;
+                if (c.min_term_months) {
+                    document.querySelector('select[name="min_term"]').value = String(c.min_term_months);
+                }
+            }""",
+            {
+                "whole_week_only": criteria.whole_week_only,
+                "double_room_only": criteria.double_room_only,
+                "photos_only": criteria.photos_only,
+                "private_landlords_only": criteria.private_landlords_only,
+                "min_term_months": criteria.min_term_months,
+            }
+        )
 
         # Search
         self.page.press("#search_by_location_field", "Enter")
-        logger.info("Searching Spareroom.")
+
+    def _goto(self, url: str) -> None:
+        rate_limiter.call(
+            url,
+            lambda: self.page.goto(url, timeout=rate_limiter.timeout_seconds * 1000),
+            status=lambda response: response.status if response else None
+        )
 
     def _fill_element(self, selector: str, value: str) -> None:
         self.page.wait_for_selector(selector)
         self.page.fill(selector, value)
-        self.page.wait_for_timeout(500)
+        self.page.wait_for_timeout(FORM_FILL_DELAY_MS)
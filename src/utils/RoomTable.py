@@ -0,0 +1,141 @@
+import math
+import sys
+from array import array
+from dataclasses import fields
+from datetime import date, datetime
+from typing import Any, Callable, Iterable, Iterator
+
+from src.utils.types import Room, CompactRoom
+
+# How each CompactRoom field is stored in a column
+FLOAT_COLUMNS = {
+    "latitude", "longitude", "commute_1_minutes", "commute_2_minutes", "average_price",
+    "average_deposit", "score", "collective_word_count",
+    "station_walk_minutes", "location_1_distance_km", "location_2_distance_km",
+}
+INT_COLUMNS = {"average_price", "collective_word_count", "station_walk_minutes"}
+BOOL_COLUMNS = {"available_all_week", "direct_line_to_office", "preferable_poster_type"}
+# Scraped fields can keep their string when it isn't a bool or number, e.g. "ask" or "3+",
+# so they're stored like repeated strings, as codes into the values seen in the column
+CATEGORY_COLUMNS = {
+    "status", "type", "area", "nearest_station", "available", "minimum_term", "maximum_term",
+    "poster_type", "closest_station", "bills_included", "broadband_included", "furnishings",
+    "garden_or_patio", "living_room", "balcony_or_roof_terrace", "number_of_flatmates",
+    "total_number_of_rooms",
+}
+DATE_COLUMNS = {"date_added"}
+DATETIME_COLUMNS = {"last_checked"}
+
+COLUMN_NAMES = [f.name for f in fields(CompactRoom)]
+
+# Stands in for None in a bool column
+MISSING_BOOL = -1
+
+
+class RoomTable:
+    def __init__(self) -> None:
+        """Rooms stored column by column, for bulk work over a large listing history.
+
+        Numbers live in float arrays with NaN for missing values, booleans in a byte
+        array, dates as ordinals, and repeated values such as strings and scraped
+        fields as integer codes into one list of categories per column. Whole
+        columns can be read at once, e.g. handed to numpy with
+        `np.asarray(table.column("score"))`, and rows are rebuilt on demand.
+        """
+        self._length = 0
+        self._columns: dict[str, Any] = {}
+        self._categories: dict[str, list[Any]] = {}
+        self._codes: dict[str, dict[tuple[type, Any], int]] = {}
+
+        for name in COLUMN_NAMES:
+            if name in FLOAT_COLUMNS or name in DATETIME_COLUMNS:
+                self._columns[name] = array("d")
+            elif name in BOOL_COLUMNS:
+                self._columns[name] = array("b")
+            elif name in DATE_COLUMNS:
+                self._columns[name] = array("l")
+            elif name in CATEGORY_COLUMNS:
+                self._columns[name] = array("I")
+                self._categories[name] = []
+                self._codes[name] = {}
+            else:
+                self._columns[name] = []
+
+    @classmethod
+    def from_rooms(cls, rooms: Iterable[Room | CompactRoom]) -> "RoomTable":
+        table = cls()
+        for room in rooms:
+            table.append(room)
+        return table
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[CompactRoom]:
+        return self.rows()
+
+    def append(self, room: Room | CompactRoom) -> None:
+        compact = room if isinstance(room, CompactRoom) else CompactRoom.from_room(room)
+        for name in COLUMN_NAMES:
+            value = getattr(compact, name)
+            column = self._columns[name]
+            if name in FLOAT_COLUMNS:
+                column.append(math.nan if value is None else value)
+            elif name in DATETIME_COLUMNS:
+                column.append(math.nan if value is None else value.timestamp())
+            elif name in BOOL_COLUMNS:
+                if value is not None and not isinstance(value, bool):
+                    raise TypeError(f"{name} must be a bool or None, not {value!r}")
+                column.append(MISSING_BOOL if value is None else int(value))
+            elif name in DATE_COLUMNS:
+                column.append(value.toordinal())
+            elif name in CATEGORY_COLUMNS:
+                column.append(self._code(name, value))
+            else:
+                column.append(value)
+        self._length += 1
+
+    def column(self, name: str) -> Any:
+        """The raw storage of a column; category columns are decoded to their values"""
+        if name in CATEGORY_COLUMNS:
+            categories = self._categories[name]
+            return [categories[code] for code in self._columns[name]]
+        return self._columns[name]
+
+    def row(self, i: int) -> CompactRoom:
+        return CompactRoom(**{name: self._value(name, i) for name in COLUMN_NAMES})
+
+    def rows(self) -> Iterator[CompactRoom]:
+        return (self.row(i) for i in range(self._length))
+
+    def to_rooms(self) -> list[Room]:
+        return [row.to_room() for row in self.rows()]
+
+    def where(self, predicate: Callable[[CompactRoom], bool]) -> "RoomTable":
+        return RoomTable.from_rooms(row for row in self.rows() if predicate(row))
+
+    def _code(self, name: str, value: Any) -> int:
+        # Keyed by type too, as True and 1 are equal dict keys
+        codes = self._codes[name]
+        key = (type(value), value)
+        code = codes.get(key)
+        if code is None:
+            code = codes[key] = len(self._categories[name])
+            self._categories[name].append(sys.intern(value) if isinstance(value, str) else value)
+        return code
+
+    def _value(self, name: str, i: int) -> Any:
+        value = self._columns[name][i]
+        if name in FLOAT_COLUMNS:
+            if math.isnan(value):
+                return None
+            return int(value) if name in INT_COLUMNS else value
+        if name in DATETIME_COLUMNS:
+            return None if math.isnan(value) else datetime.fromtimestamp(value)
+        if name in BOOL_COLUMNS:
+            return None if value == MISSING_BOOL else bool(value)
+        if name in DATE_COLUMNS:
+            return date.fromordinal(value)
+        if name in CATEGORY_COLUMNS:
+            return self._categories[name][value]
+        return value
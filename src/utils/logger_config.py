@@ -1,14 +1,20 @@
 import logging
+import os
 
-def setup_logger(level=logging.INFO) -> logging.Logger:
+# Log file of the pipeline's runs; tests and benchmarks set SPAREROOM_LOG_PATH to "" to log to the console only
+LOG_PATH = os.environ.get("SPAREROOM_LOG_PATH", "data/app.log")
+
+
+def setup_logger(level=logging.INFO, log_path: str = LOG_PATH) -> logging.Logger:
     logger = logging.getLogger()
     logger.setLevel(logging.DEBUG)
 
-    file_handler = logging.FileHandler("data/app.log", mode="a")
-    file_handler.setLevel(level)
-    file_formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-    file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+    if log_path:
+        file_handler = logging.FileHandler(log_path, mode="a")
+        file_handler.setLevel(level)
+        file_formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+        file_handler.setFormatter(file_formatter)
+        logger.addHandler(file_handler)
 
     console_handler = logging.StreamHandler()
     console_handler.setLevel(level)
@@ -1,5 +1,6 @@
-from dataclasses import dataclass
-from datetime import date
+import sys
+from dataclasses import dataclass, field
+from datetime import date, datetime
 from typing import Optional
 from collections import namedtuple
 
@@ -10,7 +11,7 @@ class Room:
     status: str = ""
     url: str = ""
     id: Optional[str] = ""
-    date_added: date = date.today()
+    date_added: date = field(default_factory=date.today)
     
     type: Optional[str] = None
     area: Optional[str] = None
@@ -23,21 +24,23 @@ class Room:
     location_2: Optional[str] = None
 
     average_price: Optional[int] = None
-    average_deposit: Optional[int] = None
+    average_deposit: Optional[float] = None
 
     available: Optional[str] = None
     minimum_term: Optional[str] = None
     maximum_term: Optional[str] = None
 
-    bills_included: Optional[bool] = None
-    broadband_included: Optional[bool] = None
-    furnishings: Optional[bool] = None
-    garden_or_patio: Optional[bool] = None
-    living_room: Optional[bool] = None
-    balcony_or_roof_terrace: Optional[bool] = None
+    # Scraped values that RoomNormaliser can't convert keep their string, e.g. "ask" or "3+",
+    # and balcony_or_roof_terrace is never converted, so it's always "Yes" or "No"
+    bills_included: Optional[bool | str] = None
+    broadband_included: Optional[bool | str] = None
+    furnishings: Optional[bool | str] = None
+    garden_or_patio: Optional[bool | str] = None
+    living_room: Optional[bool | str] = None
+    balcony_or_roof_terrace: Optional[bool | str] = None
     
-    number_of_flatmates: Optional[int] = None
-    total_number_of_rooms: Optional[int] = None
+    number_of_flatmates: Optional[int | str] = None
+    total_number_of_rooms: Optional[int | str] = None
     room_sizes: Optional[list] = None
     score: Optional[float] = None
     image_url: str = ""
@@ -45,6 +48,176 @@ class Room:
     poster_type: str = ""
     collective_word_count: int = 0
     preferable_poster_type: bool = False
+    last_checked: Optional[datetime] = None
+
+    closest_station: Optional[str] = None
+    station_walk_minutes: Optional[int] = None
+    nearby_stations: Optional[list] = None
+    location_1_distance_km: Optional[float] = None
+    location_2_distance_km: Optional[float] = None
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value else value
+
+
+def _commute_minutes(commute: Optional[str]) -> Optional[float]:
+    if not commute:
+        return None
+    digits = "".join(c for c in commute if c.isdigit())
+    return float(digits) if digits else None
+
+
+@dataclass(frozen=True, slots=True)
+class CompactRoom:
+    """Memory-lean, read-only copy of a Room for holding large listing histories.
+
+    Slotted, so there's no per-instance __dict__. Fields that repeat across rooms
+    (area, type, poster type, terms...) are interned so rooms share one string,
+    coordinates and commutes are floats, and room_sizes is a tuple. Converting back
+    with to_room reformats location and commutes, so "N/A" commutes come back as None.
+    """
+    id: str
+    url: str
+    status: str
+    date_added: date
+    type: Optional[str]
+    area: Optional[str]
+    nearest_station: Optional[str]
+    available_all_week: Optional[bool]
+    direct_line_to_office: Optional[bool]
+    latitude: Optional[float]
+    longitude: Optional[float]
+    commute_1_minutes: Optional[float]
+    commute_2_minutes: Optional[float]
+    average_price: Optional[int]
+    average_deposit: Optional[float]
+    available: Optional[str]
+    minimum_term: Optional[str]
+    maximum_term: Optional[str]
+    bills_included: Optional[bool | str]
+    broadband_included: Optional[bool | str]
+    furnishings: Optional[bool | str]
+    garden_or_patio: Optional[bool | str]
+    living_room: Optional[bool | str]
+    balcony_or_roof_terrace: Optional[bool | str]
+    number_of_flatmates: Optional[int | str]
+    total_number_of_rooms: Optional[int | str]
+    room_sizes: tuple[str, ...]
+    score: Optional[float]
+    image_url: str
+    poster_type: str
+    collective_word_count: int
+    preferable_poster_type: bool
+    last_checked: Optional[datetime]
+    closest_station: Optional[str]
+    station_walk_minutes: Optional[int]
+    nearby_stations: Optional[tuple[str, ...]]
+    location_1_distance_km: Optional[float]
+    location_2_distance_km: Optional[float]
+
+    @classmethod
+    def from_room(cls, room: Room) -> "CompactRoom":
+        latitude = longitude = None
+        if room.location:
+            lat, lon = room.location.split(",")
+            latitude, longitude = float(lat), float(lon)
+
+        return cls(
+            id=room.id or "",
+            url=room.url,
+            status=sys.intern(room.status),
+            date_added=room.date_added,
+            type=_intern(room.type),
+            area=_intern(room.area),
+            nearest_station=_intern(room.nearest_station),
+            available_all_week=room.available_all_week,
+            direct_line_to_office=room.direct_line_to_office,
+            latitude=latitude,
+            longitude=longitude,
+            commute_1_minutes=_commute_minutes(room.location_1),
+            commute_2_minutes=_commute_minutes(room.location_2),
+            average_price=room.average_price,
+            average_deposit=room.average_deposit,
+            available=_intern(room.available),
+            minimum_term=_intern(room.minimum_term),
+            maximum_term=_intern(room.maximum_term),
+            bills_included=room.bills_included,
+            broadband_included=room.broadband_included,
+            furnishings=room.furnishings,
+            garden_or_patio=room.garden_or_patio,
+            living_room=room.living_room,
+            balcony_or_roof_terrace=room.balcony_or_roof_terrace,
+            number_of_flatmates=room.number_of_flatmates,
+            total_number_of_rooms=room.total_number_of_rooms,
+            room_sizes=tuple(sys.intern(size) for size in room.room_sizes or ()),
+            score=room.score,
+            image_url=room.image_url,
+            poster_type=sys.intern(room.poster_type),
+            collective_word_count=room.collective_word_count,
+            preferable_poster_type=room.preferable_poster_type,
+            last_checked=room.last_checked,
+            closest_station=_intern(room.closest_station),
+            station_walk_minutes=room.station_walk_minutes,
+            nearby_stations=tuple(sys.intern(name) for name in room.nearby_stations)
+            if room.nearby_stations is not None else None,
+            location_1_distance_km=room.location_1_distance_km,
+            location_2_distance_km=room.location_2_distance_km,
+        )
+
+    def to_room(self) -> Room:
+        has_location = self.latitude is not None and self.longitude is not None
+        return Room(
+            status=self.status,
+            url=self.url,
+            id=self.id,
+            date_added=self.date_added,
+            type=self.type,
+            area=self.area,
+            nearest_station=self.nearest_station,
+            available_all_week=self.available_all_week,
+            direct_line_to_office=self.direct_line_to_office,
+            location=f"{self.latitude}, {self.longitude}" if has_location else None,
+            location_1=f"{int(self.commute_1_minutes)} mins" if self.commute_1_minutes is not None else None,
+            location_2=f"{int(self.commute_2_minutes)} mins" if self.commute_2_minutes is not None else None,
+            average_price=self.average_price,
+            average_deposit=self.average_deposit,
+            available=self.available,
+            minimum_term=self.minimum_term,
+            maximum_term=self.maximum_term,
+            bills_included=self.bills_included,
+            broadband_included=self.broadband_included,
+            furnishings=self.furnishings,
+            garden_or_patio=self.garden_or_patio,
+            living_room=self.living_room,
+            balcony_or_roof_terrace=self.balcony_or_roof_terrace,
+            number_of_flatmates=self.number_of_flatmates,
+            total_number_of_rooms=self.total_number_of_rooms,
+            room_sizes=list(self.room_sizes),
+            score=self.score,
+            image_url=self.image_url,
+            poster_type=self.poster_type,
+            collective_word_count=self.collective_word_count,
+            preferable_poster_type=self.preferable_poster_type,
+            last_checked=self.last_checked,
+            closest_station=self.closest_station,
+            station_walk_minutes=self.station_walk_minutes,
+            nearby_stations=list(self.nearby_stations) if self.nearby_stations is not None else None,
+            location_1_distance_km=self.location_1_distance_km,
+            location_2_distance_km=self.location_2_distance_km,
+        )
+
+
+@dataclass
+class SearchCriteria:
+    location: str
+    min_rent: int
+    max_rent: int
+    double_room_only: bool = True
+    whole_week_only: bool = True
+    photos_only: bool = True
+    private_landlords_only: bool = True
+    min_term_months: int = 6
 
 
 @dataclass()
@@ -61,6 +234,40 @@ class PipelineConfig:
     messaged_ids_path: str
     domain: str
     update_database_only: bool
+    scrape_workers: int = 1
+    fetch_engine: str = "playwright"
+    parser: str = "lxml"
+    parallel_pagination: bool = False
+    pagination_workers: int = 4
+    incremental: bool = False
+    stop_after_known_pages: int = 1
+    stop_after_known_listings: int = 0
+    expiry_max_age_hours: float = 24
+    expiry_workers: int = 4
+    expiry_request_budget: int = 0
+    expiry_time_budget_seconds: float = 0
+    html_cache_enabled: bool = True
+    html_cache_path: str = "data/html_cache"
+    html_cache_max_mb: float = 500
+    checkpoint_path: str = "data/checkpoint.log"
+    room_attempts: int = 2
+    search_method: str = "url"
+    location: str = "London"
+    double_room_only: bool = True
+    whole_week_only: bool = True
+    photos_only: bool = True
+    private_landlords_only: bool = True
+    min_term_months: int = 6
+    browser_mode: str = "launch"
+    browser_profile_path: str = "data/browser_profile"
+    storage_state_path: Optional[str] = None
+    cdp_port: int = 9222
+    database_backend: str = "sqlite"
+    sqlite_path: str = "data/rooms.sqlite3"
+    parquet_path: str = "data/rooms.parquet"
+    map_path: str = "output/map.html"
+    export_state_path: str = "data/export_state.json"
+    what_if_top_k: int = 10
 
     def __post_init__(self):
         if self.number_of_pages < 0:
@@ -68,3 +275,27 @@ class PipelineConfig:
         
         if self.min_rent > self.max_rent:
             raise ValueError("min_rent cannot exceed max_rent")
+
+        if self.scrape_workers < 1:
+            raise ValueError("scrape_workers must be >= 1")
+
+        if self.fetch_engine not in ("playwright", "http"):
+            raise ValueError("fetch_engine must be 'playwright' or 'http'")
+
+        if self.parser not in ("bs4", "lxml"):
+            raise ValueError("parser must be 'bs4' or 'lxml'")
+
+        if self.pagination_workers < 1:
+            raise ValueError("pagination_workers must be >= 1")
+
+        if self.search_method not in ("url", "form"):
+            raise ValueError("search_method must be 'url' or 'form'")
+
+        if self.browser_mode not in ("launch", "persistent", "cdp"):
+            raise ValueError("browser_mode must be 'launch', 'persistent' or 'cdp'")
+
+        if self.database_backend not in ("pickle", "sqlite", "parquet"):
+            raise ValueError("database_backend must be 'pickle', 'sqlite' or 'parquet'")
+
+        if self.what_if_top_k < 1:
+            raise ValueError("what_if_top_k must be >= 1")
@@ -1,6 +1,9 @@
+import os
 import unicodedata
 import re
+from contextlib import contextmanager
 from datetime import datetime, timedelta, time
+from typing import Iterator
 
 def flush_print(i: int, list: list, msg: str) -> None:
     """Print a progress message on the same line, flushing output immediately.
@@ -99,4 +102,28 @@ def get_id_from_url(url: str) -> str:
     Returns:
         A string representing the room's SpareRoom ID
     """
-    return url.split("=")[1].split("&")[0]
\ No newline at end of file
+    return url.split("=")[1].split("&")[0]
+
+@contextmanager
+def atomic_write_path(path: str) -> Iterator[str]:
+    """Give a temporary path to write to, then move it over `path` in one step.
+
+    Readers of `path` see either the old file or the complete new one, never a
+    half-written file. If writing fails, the temporary file is removed and `path`
+    is left as it was.
+
+    Args:
+        path: Final path of the file.
+
+    Yields:
+        A temporary path in the same directory, keeping the extension of `path`.
+    """
+    directory, name = os.path.split(path)
+    os.makedirs(directory or ".", exist_ok=True)
+    tmp_path = os.path.join(directory, f".{name}.tmp{os.path.splitext(name)[1]}")
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
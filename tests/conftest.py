@@ -0,0 +1,4 @@
+import os
+
+# Keep test runs out of the pipeline's log file
+os.environ["SPAREROOM_LOG_PATH"] = ""
@@ -0,0 +1,39 @@
+import random
+
+from src.processing.BatchScorer import BatchScorer
+from src.processing.calculate_score import get_score
+from src.utils.types import Room
+
+
+def _random_rooms(n: int) -> list[Room]:
+    rng = random.Random(0)
+    return [
+        Room(
+            id=str(i),
+            direct_line_to_office=rng.choice([True, False, None]),
+            location_1=rng.choice([None, "N/A", f"{rng.randint(5, 90)} mins"]),
+            location_2=rng.choice([None, f"{rng.randint(5, 90)} mins"]),
+            minimum_term=rng.choice([None, "None", "1 year", f"{rng.randint(1, 24)} months"]),
+            bills_included=rng.choice([True, False, None]),
+            living_room=rng.choice([True, False, None]),
+            total_number_of_rooms=rng.choice([None, *range(1, 9)]),
+            average_price=rng.choice([None, *range(500, 1400, 7)]),
+            collective_word_count=rng.randint(0, 10),
+            preferable_poster_type=rng.choice([True, False]),
+        )
+        for i in range(n)
+    ]
+
+
+def test_batch_scores_match_get_score():
+    rooms = _random_rooms(2000)
+    assert BatchScorer().score(rooms) == [get_score(room) for room in rooms]
+
+
+def test_rescore_applies_new_weightings():
+    rooms = [Room(id="1", bills_included=True), Room(id="2", bills_included=False)]
+    changed = BatchScorer(weightings={"bills_included": 3, "gender": 1}).rescore(rooms)
+
+    assert changed == 2
+    assert [room.score for room in rooms] == [3.0, 0.0]
+    assert BatchScorer().score([]) == []
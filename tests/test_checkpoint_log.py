@@ -0,0 +1,37 @@
+from src.persistence.CheckpointLog import CheckpointLog
+from src.utils.types import Room
+
+
+def test_resumes_from_complete_records_and_drops_a_torn_tail(tmp_path):
+    path = tmp_path / "checkpoint.log"
+    log = CheckpointLog(path=str(path))
+    log.record("url/1", Room(id="1", url="url/1"))
+    log.record("url/2", None)
+    log.record("url/3", Room(id="3", url="url/3"))
+    log._file.close()
+
+    # Simulate a crash part way through writing the last record
+    size = path.stat().st_size
+    with open(path, "r+b") as f:
+        f.truncate(size - 5)
+
+    resumed = CheckpointLog(path=str(path))
+    resumed.load()
+    assert resumed.processed_urls == {"url/1", "url/2"}
+    assert [room.id for room in resumed.rooms] == ["1"]
+
+    # New records append cleanly after the truncated tail
+    resumed.record("url/3", Room(id="3", url="url/3"))
+    resumed._file.close()
+    again = CheckpointLog(path=str(path))
+    again.load()
+    assert [room.id for room in again.rooms] == ["1", "3"]
+
+
+def test_clear_removes_the_log(tmp_path):
+    path = tmp_path / "checkpoint.log"
+    log = CheckpointLog(path=str(path))
+    log.record("url/1", Room(id="1"))
+    log.clear()
+    assert not path.exists()
+    assert log.processed_urls == set()
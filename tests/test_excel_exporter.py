@@ -0,0 +1,94 @@
+from datetime import date
+
+import polars as pl
+
+from src.persistence.DatabaseManager import DatabaseManager
+from src.persistence.ExcelExporter import ExcelExporter, output_cols
+from src.persistence.ExportState import ExportState
+from src.utils.types import Room
+
+
+def make_manager(tmp_path) -> DatabaseManager:
+    return DatabaseManager(
+        check_for_expired_rooms=False,
+        database_path=str(tmp_path / "rooms.pkl"),
+        output_path=str(tmp_path / "database.xlsx"),
+        ignored_ids_path=str(tmp_path / "ignored_ids.json"),
+        favourite_ids_path=str(tmp_path / "favourite_ids.json"),
+        messaged_ids_path=str(tmp_path / "messaged_ids.json")
+    )
+
+
+def test_exports_filtered_rooms_sorted_by_score(tmp_path):
+    manager = make_manager(tmp_path)
+    manager.database = [
+        Room(id="1", url="https://example.com/1", date_added=date(2024, 5, 1), average_price=900, score=3.5),
+        Room(id="2", url="https://example.com/2", date_added=date(2024, 5, 2), average_price=150, score=9.0),
+        Room(id="3", url="https://example.com/3", date_added=date(2024, 5, 3), average_price=700, score=8.0,
+             status="FAVOURITE", bills_included=True),
+    ]
+    ExcelExporter(db_manager=manager, output_path=manager.output_path, min_rent=200).create_and_export_dataframe()
+
+    df = pl.read_excel(manager.output_path, engine="calamine")
+    assert df.columns == output_cols
+    assert df["id"].cast(pl.String).to_list() == ["3", "1"]
+    assert df["url"].to_list() == ["link", "link"]
+    assert df["date_added"].to_list() == ["03-May", "01-May"]
+    assert df["status"].to_list() == ["FAVOURITE", None]
+    assert manager._read_status_updates() == [("3", "FAVOURITE")]
+
+
+def test_skips_rewriting_unchanged_rows(tmp_path):
+    manager = make_manager(tmp_path)
+    manager.database = [Room(id="1", url="https://example.com/1", average_price=900, score=3.5)]
+    export_state = ExportState(path=str(tmp_path / "export_state.json"))
+
+    def export() -> bool:
+        return ExcelExporter(
+            db_manager=manager, output_path=manager.output_path, min_rent=200, export_state=export_state
+        ).create_and_export_dataframe()
+
+    assert export()
+    assert not export()
+
+    manager.database[0].status = "FAVOURITE"
+    assert export()
+    assert not list(tmp_path.glob(".*.tmp*"))
+
+
+def test_rewrites_an_edited_or_deleted_spreadsheet(tmp_path):
+    manager = make_manager(tmp_path)
+    manager.database = [Room(id="1", url="https://example.com/1", average_price=900, score=3.5)]
+    export_state = ExportState(path=str(tmp_path / "export_state.json"))
+
+    def export() -> bool:
+        return ExcelExporter(
+            db_manager=manager, output_path=manager.output_path, min_rent=200, export_state=export_state
+        ).create_and_export_dataframe()
+
+    assert export()
+    with open(manager.output_path, "ab") as f:
+        f.write(b"edited")
+    assert export()
+    assert not export()
+
+    (tmp_path / "database.xlsx").unlink()
+    assert export()
+
+
+def test_writes_scraped_bools_and_counts_as_native_cells(tmp_path):
+    manager = make_manager(tmp_path)
+    manager.database = [
+        Room(id="1", url="https://example.com/1", average_price=900, score=3.5, bills_included=True,
+             number_of_flatmates=3, balcony_or_roof_terrace="Yes"),
+        Room(id="2", url="https://example.com/2", average_price=800, score=2.5, bills_included=False,
+             number_of_flatmates=2, balcony_or_roof_terrace="No"),
+    ]
+    ExcelExporter(db_manager=manager, output_path=manager.output_path, min_rent=200).create_and_export_dataframe()
+
+    df = pl.read_excel(manager.output_path, engine="calamine")
+    assert df.schema["bills_included"] == pl.Boolean
+    assert df["bills_included"].to_list() == [True, False]
+    assert df.schema["number_of_flatmates"].is_numeric()
+    assert df["number_of_flatmates"].to_list() == [3, 2]
+    assert df["balcony_or_roof_terrace"].to_list() == ["Yes", "No"]
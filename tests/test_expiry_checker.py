@@ -0,0 +1,75 @@
+import time
+from pathlib import Path
+
+from src.scraping.ExpiryChecker import ExpiryChecker
+from src.scraping.RoomScraper import RoomScraper
+from src.utils.types import Room
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+class FakeFetcher:
+    def __init__(self, pages: dict[str, str], workers: int = 2, delay: float = 0) -> None:
+        self.pages = pages
+        self.workers = workers
+        self.delay = delay
+
+    def fetch(self, url: str):
+        time.sleep(self.delay)
+        return self.pages.get(url)
+
+
+def make_checker(fetcher: FakeFetcher, time_budget_seconds: float = 0) -> ExpiryChecker:
+    return ExpiryChecker(
+        fetcher=fetcher, page=None, scraper_cls=RoomScraper, max_age_hours=0, time_budget_seconds=time_budget_seconds
+    )
+
+
+def test_removes_rooms_that_cant_be_contacted():
+    pages = {
+        "live": (FIXTURES / "listing_double_room.html").read_text(),
+        "expired": (FIXTURES / "listing_expired.html").read_text(),
+    }
+    rooms = [Room(id=url, url=url) for url in ("live", "expired", "unreachable")]
+
+    kept = make_checker(FakeFetcher(pages)).remove_expired(rooms)
+
+    assert [room.id for room in kept] == ["live", "unreachable"]
+    assert kept[0].last_checked is not None
+    assert kept[1].last_checked is None
+
+
+def test_stops_at_the_time_budget_without_waiting_for_slow_downloads():
+    rooms = [Room(id=str(i), url=str(i)) for i in range(10)]
+    started = time.monotonic()
+
+    kept = make_checker(FakeFetcher({}, workers=2, delay=1.0), time_budget_seconds=0.2).remove_expired(rooms)
+
+    assert time.monotonic() - started < 0.8
+    assert kept == rooms
+
+
+def test_browser_fallback_stops_at_the_time_budget():
+    loaded: list[str] = []
+
+    class SlowBrowserScraper:
+        def __init__(self, page, url: str) -> None:
+            self.url = url
+
+        def parse_sidebar(self) -> tuple[bool, bool]:
+            time.sleep(0.15)
+            loaded.append(self.url)
+            return False, True
+
+    rooms = [Room(id=str(i), url=str(i)) for i in range(10)]
+    checker = ExpiryChecker(
+        fetcher=FakeFetcher({}), page=object(), scraper_cls=SlowBrowserScraper, max_age_hours=0, time_budget_seconds=0.2
+    )
+    started = time.monotonic()
+
+    kept = checker.remove_expired(rooms)
+
+    assert time.monotonic() - started < 0.6
+    assert 1 <= len(loaded) <= 2
+    assert {room.id for room in kept if room.last_checked is not None} == set(loaded)
+    assert kept == rooms
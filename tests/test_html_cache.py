@@ -0,0 +1,58 @@
+import gzip
+import itertools
+import os
+
+from src.persistence.HtmlCache import HtmlCache
+
+
+def page(n: int, size: int = 20_000) -> str:
+    # Hex digits of a hash chain, so pages barely compress and sizes are predictable
+    return "".join(f"{hash((n, i)) & 0xFFFFFFFF:08x}" for i in range(size // 8))
+
+
+def test_round_trips_gzipped_pages_across_instances(tmp_path):
+    cache = HtmlCache(path=str(tmp_path), max_mb=10)
+    html = "<html><body>" + "room " * 1000 + "</body></html>"
+    cache.put("1", html)
+    cache.flush()
+
+    entry = cache.index["1"]
+    with open(cache._object_path(entry["hash"]), "rb") as f:
+        stored = f.read()
+    assert gzip.decompress(stored).decode("utf-8") == html
+    assert entry["size"] == len(stored) < len(html)
+
+    assert HtmlCache(path=str(tmp_path), max_mb=10).get("1") == html
+    assert cache.get("2") is None
+
+
+def test_shared_pages_are_stored_once_and_deleted_with_their_last_room(tmp_path):
+    cache = HtmlCache(path=str(tmp_path), max_mb=10)
+    cache.put("1", page(0))
+    cache.put("2", page(0))
+    shared = cache._object_path(cache.index["1"]["hash"])
+    assert cache.index["1"]["hash"] == cache.index["2"]["hash"]
+
+    cache.put("1", page(1))
+    assert os.path.exists(shared)
+    assert cache.get("2") == page(0)
+
+    cache.put("2", page(2))
+    assert not os.path.exists(shared)
+    assert (cache.get("1"), cache.get("2")) == (page(1), page(2))
+
+
+def test_evicts_the_oldest_rooms_past_the_size_limit(tmp_path, monkeypatch):
+    clock = itertools.count()
+    monkeypatch.setattr("src.persistence.HtmlCache.time.time", lambda: next(clock))
+
+    cache = HtmlCache(path=str(tmp_path), max_mb=0)
+    for n in range(4):
+        cache.put(str(n), page(n))
+    cache.max_bytes = cache.index["2"]["size"] + cache.index["3"]["size"]
+    evicted_paths = [cache._object_path(cache.index[room_id]["hash"]) for room_id in ("0", "1")]
+    cache.flush()
+
+    assert sorted(cache.index) == ["2", "3"]
+    assert not any(os.path.exists(path) for path in evicted_paths)
+    assert sorted(HtmlCache(path=str(tmp_path), max_mb=0).index) == ["2", "3"]
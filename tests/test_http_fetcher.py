@@ -0,0 +1,81 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from src.scraping.HttpFetcher import HttpFetcher
+from src.scraping.RateLimiter import rate_limiter
+
+DOMAIN = "https://www.spareroom.co.uk"
+PAGE = "<html><head><title>Double room</title></head><body>Listing</body></html>"
+
+
+class FakeSession:
+    def __init__(self, responses: dict) -> None:
+        self.responses = responses
+        self.threads: set[int] = set()
+        self.closed = False
+
+    def get(self, url: str, timeout: float):
+        self.threads.add(threading.get_ident())
+        response = self.responses[url]
+        if isinstance(response, Exception):
+            raise response
+        # Earlier URLs answer last, so fetch_all has to put the pages back in order
+        time.sleep(0.01 / int(url.rsplit("/", 1)[1]))
+        return response
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def response(status_code: int = 200, text: str = PAGE) -> SimpleNamespace:
+    return SimpleNamespace(status_code=status_code, text=text)
+
+
+@pytest.fixture
+def fetcher(monkeypatch):
+    monkeypatch.setattr(rate_limiter, "requests_per_second", 0)
+    monkeypatch.setattr(rate_limiter, "max_backoff_seconds", 0)
+    return HttpFetcher(workers=3)
+
+
+def test_looks_complete():
+    assert HttpFetcher._looks_complete(PAGE)
+    assert not HttpFetcher._looks_complete(PAGE[:-len("</html>")])
+    assert not HttpFetcher._looks_complete("<html><title>Just a moment...</title></html>")
+    assert not HttpFetcher._looks_complete('<html><div id="cf-challenge"></div></html>')
+
+
+@pytest.mark.parametrize("status_code, usable", [(200, True), (404, True), (410, True), (403, False), (500, False)])
+def test_only_usable_status_codes_return_html(fetcher, status_code, usable):
+    url = f"{DOMAIN}/1"
+    fetcher._session = FakeSession({url: response(status_code)})
+
+    assert fetcher.fetch(url) == (PAGE if usable else None)
+
+
+def test_failures_return_none_so_the_caller_falls_back(fetcher):
+    urls = [f"{DOMAIN}/{i}" for i in range(1, 4)]
+    fetcher._session = FakeSession({
+        urls[0]: requests.ConnectionError("connection reset"),
+        urls[1]: response(text="<html><title>Access Denied</title></html>"),
+        urls[2]: response(text=PAGE[:20]),
+    })
+
+    assert [fetcher.fetch(url) for url in urls] == [None, None, None]
+
+
+def test_fetch_all_keeps_url_order(fetcher):
+    urls = [f"{DOMAIN}/{i}" for i in range(1, 7)]
+    session = FakeSession({url: response(text=PAGE.replace("Listing", url)) for url in urls})
+    fetcher._session = session
+
+    assert fetcher.fetch_all(urls) == [PAGE.replace("Listing", url) for url in urls]
+    assert len(session.threads) > 1
+    assert fetcher.fetch_all([]) == []
+
+    fetcher.close()
+    assert session.closed
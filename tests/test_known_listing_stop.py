@@ -0,0 +1,28 @@
+from src.scraping.SpareRoomScraper import KnownListingStop
+
+KNOWN = {"a", "b", "c", "d", "e", "f"}
+
+
+def make_stop(known_pages: int, known_listings: int) -> KnownListingStop:
+    return KnownListingStop(is_known=lambda url: url in KNOWN, known_pages=known_pages, known_listings=known_listings)
+
+
+def test_stops_after_consecutive_known_pages():
+    stop = make_stop(known_pages=2, known_listings=0)
+    assert not stop.should_stop(["new1", "a"])
+    assert not stop.should_stop(["b", "c"])
+    assert stop.should_stop(["d", "e"])
+
+
+def test_new_listing_resets_known_page_run():
+    stop = make_stop(known_pages=2, known_listings=0)
+    assert not stop.should_stop(["a", "b"])
+    assert not stop.should_stop(["c", "new1"])
+    assert not stop.should_stop(["d", "e"])
+
+
+def test_stops_after_run_of_known_listings_across_pages():
+    stop = make_stop(known_pages=0, known_listings=3)
+    assert not stop.should_stop(["new1", "a", "b"])
+    assert not stop.should_stop(["c", "new2"])
+    assert stop.should_stop(["d", "e", "f"])
@@ -0,0 +1,41 @@
+from src.persistence.MapCreator import CreateMap
+from src.utils.types import Room
+
+HOSTILE_URL = 'https://www.spareroom.co.uk/1"><script>alert(1)</script>'
+
+
+def make_rooms() -> list[Room]:
+    return [
+        Room(id="1", url=HOSTILE_URL, location="51.5, -0.1", score=50, status="favourite"),
+        Room(id="2", url="https://www.spareroom.co.uk/2", location="51.6, -0.2", score=50),
+        Room(id="3", url="https://www.spareroom.co.uk/3", score=50),
+    ]
+
+
+def render(tmp_path, clustered: bool) -> str:
+    output = tmp_path / "map.html"
+    creator = CreateMap(rooms=make_rooms(), output_path=str(output))
+    creator._clustered = clustered
+    assert creator.run()
+    return output.read_text()
+
+
+def test_clustered_map_embeds_features_as_safe_json(tmp_path):
+    html = render(tmp_path, clustered=True)
+
+    assert html.count('"type":"Feature"') == 2
+    assert '"coordinates":[-0.1,51.5]' in html and '"coordinates":[-0.2,51.6]' in html
+    assert "spareroom.co.uk/3" not in html
+    # The scraped URL can't close the script block, and the popup escapes it when it's opened
+    assert "<script>alert(1)" not in html
+    assert "\\u003cscript\\u003ealert(1)" in html
+    assert "escape(p.url)" in html
+
+
+def test_unclustered_map_escapes_popups(tmp_path):
+    html = render(tmp_path, clustered=False)
+
+    assert html.count("L.marker(") == 2
+    assert "spareroom.co.uk/3" not in html
+    assert "<script>alert(1)" not in html
+    assert "&lt;script&gt;alert(1)" in html
@@ -0,0 +1,60 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+from src.pipeline.NewRoomProcessor import NewRoomProcessor
+from src.scraping.RateLimiter import rate_limiter
+
+FIXTURES = Path(__file__).parent / "fixtures"
+DOMAIN = "https://www.spareroom.co.uk"
+
+
+def listing(room_id: str) -> str:
+    return f"flatshare/flatshare_detail.pl?flatshare_id={room_id}&search_id=1"
+
+
+class FakePage:
+    def __init__(self, dead_ids: set[str]) -> None:
+        self.dead_ids = dead_ids
+        self.loads: list[str] = []
+
+    def goto(self, url: str, timeout: float):
+        self.loads.append(url)
+        if any(f"flatshare_id={room_id}&" in url for room_id in self.dead_ids):
+            raise TimeoutError("page load timed out")
+        return SimpleNamespace(status=200)
+
+    def content(self) -> str:
+        return (FIXTURES / "listing_double_room.html").read_text()
+
+
+def test_isolates_failures_and_retries_each_listing_once(monkeypatch):
+    monkeypatch.setattr(rate_limiter, "requests_per_second", 0)
+    monkeypatch.setattr(rate_limiter, "max_backoff_seconds", 0)
+
+    processor = NewRoomProcessor(
+        db_manager=SimpleNamespace(database=[], ignored=[]),
+        domain=DOMAIN,
+        parser="lxml",
+        commute_service=SimpleNamespace(API_KEY=None),
+        room_attempts=2
+    )
+
+    # The first parse of listing 3 fails, as if the page had loaded half-way
+    normalise = processor.normaliser.normalise
+    failures = iter([True])
+
+    def flaky_normalise(room_data):
+        if room_data["id"] == "3" and next(failures, False):
+            raise ValueError("truncated page")
+        return normalise(room_data)
+
+    monkeypatch.setattr(processor.normaliser, "normalise", flaky_normalise)
+
+    page = FakePage(dead_ids={"2"})
+    processor.process_new_rooms(page=page, room_urls=[listing("1"), listing("2"), listing("3")])
+
+    assert [room.id for room in processor.db_manager.database] == ["1", "3"]
+    # A dead page is only retried by the rate limiter; a parse failure reloads the page once
+    assert page.loads.count(f"{DOMAIN}/{listing('2')}") == rate_limiter.max_retries + 1
+    assert page.loads.count(f"{DOMAIN}/{listing('3')}") == 2
+    assert page.loads.count(f"{DOMAIN}/{listing('1')}") == 1
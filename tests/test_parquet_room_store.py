@@ -0,0 +1,65 @@
+from datetime import date, datetime
+
+import polars as pl
+
+from src.persistence.ParquetRoomStore import ParquetRoomStore, ROOM_SCHEMA, rooms_to_lazyframe
+from src.processing.RoomNormaliser import RoomNormaliser
+from src.utils.types import Room
+
+
+def test_round_trips_rooms_with_a_typed_schema(tmp_path):
+    rooms = [
+        Room(
+            id="1",
+            url="flatshare/1",
+            date_added=date(2024, 5, 1),
+            average_price=850,
+            bills_included=True,
+            room_sizes=["double"],
+            score=12.5,
+            last_checked=datetime(2024, 5, 2, 9, 30)
+        ),
+        Room(id="2", url="flatshare/2", date_added=date(2024, 5, 3), average_price=600, score=7)
+    ]
+    store = ParquetRoomStore(path=str(tmp_path / "rooms.parquet"))
+    store.save(rooms)
+
+    assert store.load() == rooms
+    assert store.scan().collect_schema() == ROOM_SCHEMA
+
+
+def test_scan_filters_and_sorts_lazily(tmp_path):
+    store = ParquetRoomStore(path=str(tmp_path / "rooms.parquet"))
+    store.save([Room(id=str(i), average_price=500 + 100 * i, score=float((i * 7) % 6)) for i in range(6)])
+
+    df = (
+        store.scan()
+        .select("id", "score")
+        .filter(pl.col("score") > 0)
+        .sort("score", descending=True)
+        .collect()
+    )
+    assert df["id"].to_list() == ["5", "4", "3", "2", "1"]
+
+
+def test_keeps_normaliser_output_that_isnt_the_expected_type(tmp_path):
+    room_data = RoomNormaliser().normalise({
+        "£950_pcm": "(double)",
+        "deposit": "£1,096.00",
+        "deposit_(room_2)": "£951.00",
+        "#_flatmates": "3+",
+        "balcony/roof_terrace": "Yes",
+        "furnishings": "ask",
+        "bills_included?": "Yes",
+    })
+    room = Room(id="1", **{k: v for k, v in room_data.items() if k in ROOM_SCHEMA.names()})
+    assert (room.average_deposit, room.number_of_flatmates, room.balcony_or_roof_terrace) == (1023.5, "3+", "Yes")
+
+    row = rooms_to_lazyframe([room]).collect().row(0, named=True)
+    assert row["average_deposit"] == 1023.5
+    assert row["number_of_flatmates"] == "3+"
+    assert row["balcony_or_roof_terrace"] == "Yes"
+
+    store = ParquetRoomStore(path=str(tmp_path / "rooms.parquet"))
+    store.save([room, Room(id="2", number_of_flatmates=2, bills_included=False)])
+    assert store.load() == [room, Room(id="2", number_of_flatmates=2, bills_included=False)]
@@ -0,0 +1,122 @@
+import json
+
+from src.scraping.PlaywrightSessionManager import PlaywrightSession
+
+
+class FakePage:
+    def close(self):
+        pass
+
+
+class FakeContext:
+    def __init__(self, storage_state=None):
+        self.storage_state_restored = storage_state
+        self.pages = []
+        self.closed = False
+
+    def new_page(self):
+        self.pages.append(FakePage())
+        return self.pages[-1]
+
+    def storage_state(self, path):
+        with open(path, "w") as f:
+            json.dump({"cookies": []}, f)
+
+    def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self, contexts=()):
+        self.contexts = list(contexts)
+
+    def new_context(self, storage_state=None, **kwargs):
+        self.contexts.append(FakeContext(storage_state))
+        return self.contexts[-1]
+
+    def close(self):
+        pass
+
+
+class FakeChromium:
+    def __init__(self, cdp_browser=None):
+        self.cdp_browser = cdp_browser
+        self.calls = []
+
+    def launch(self, headless):
+        self.calls.append("launch")
+        return FakeBrowser()
+
+    def launch_persistent_context(self, path, headless, **kwargs):
+        self.calls.append(("persistent", path))
+        context = FakeContext()
+        context.new_page()
+        return context
+
+    def connect_over_cdp(self, endpoint):
+        self.calls.append(("cdp", endpoint))
+        if self.cdp_browser is None:
+            raise ConnectionError("nothing listening")
+        return self.cdp_browser
+
+
+class FakePlaywright:
+    def __init__(self, chromium):
+        self.chromium = chromium
+
+    def start(self):
+        return self
+
+    def stop(self):
+        pass
+
+
+def use_chromium(monkeypatch, chromium: FakeChromium) -> None:
+    monkeypatch.setattr("src.scraping.PlaywrightSessionManager.sync_playwright", lambda: FakePlaywright(chromium))
+
+
+def test_launch_keeps_no_cookies_unless_asked(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    chromium = FakeChromium()
+    use_chromium(monkeypatch, chromium)
+
+    with PlaywrightSession(headless=True) as session:
+        assert session.context.storage_state_restored is None
+    assert chromium.calls == ["launch"]
+    assert not list(tmp_path.iterdir())
+
+    state_path = tmp_path / "storage_state.json"
+    with PlaywrightSession(headless=True, storage_state_path=str(state_path)):
+        pass
+    assert state_path.exists()
+
+    with PlaywrightSession(headless=True, storage_state_path=str(state_path)) as session:
+        assert session.context.storage_state_restored == str(state_path)
+
+
+def test_persistent_reuses_the_profile(tmp_path, monkeypatch):
+    chromium = FakeChromium()
+    use_chromium(monkeypatch, chromium)
+    profile_path = str(tmp_path / "profile")
+
+    with PlaywrightSession(headless=True, browser_mode="persistent", profile_path=profile_path) as session:
+        assert session.page is session.context.pages[0]
+    assert chromium.calls == [("persistent", profile_path)]
+    assert session.context.closed
+
+
+def test_cdp_attaches_to_the_running_browser_and_falls_back_to_launching(monkeypatch):
+    running = FakeBrowser(contexts=[FakeContext()])
+    chromium = FakeChromium(cdp_browser=running)
+    use_chromium(monkeypatch, chromium)
+
+    with PlaywrightSession(headless=True, browser_mode="cdp", cdp_endpoint="http://localhost:9222") as session:
+        assert session.context is running.contexts[0]
+    # The running browser's context is left open for the next run
+    assert not running.contexts[0].closed
+
+    chromium = FakeChromium()
+    use_chromium(monkeypatch, chromium)
+    with PlaywrightSession(headless=True, browser_mode="cdp", cdp_endpoint="http://localhost:9222"):
+        pass
+    assert chromium.calls == [("cdp", "http://localhost:9222"), "launch"]
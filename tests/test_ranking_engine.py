@@ -0,0 +1,31 @@
+from src.processing.BatchScorer import BatchScorer
+from src.processing.RankingEngine import RankingEngine
+from src.utils.types import Room
+
+ROOMS = [
+    Room(id="1", url="flatshare/1", location_1="25 mins", average_price=950, bills_included=True),
+    Room(id="2", url="flatshare/2", location_1="55 mins", average_price=720, bills_included=True),
+    Room(id="3", url="flatshare/3", location_1="N/A", average_price=800, minimum_term="6 months"),
+    Room(id="4", url="flatshare/4", location_1="40 mins", collective_word_count=5, living_room=True),
+]
+
+
+def test_current_profile_matches_batch_scores():
+    scores = RankingEngine(ROOMS).scores({"current": {}})[:, 0]
+    assert [round(score, 1) for score in scores] == BatchScorer().score(ROOMS)
+
+
+def test_profiles_rerank_rooms():
+    engine = RankingEngine(ROOMS)
+    profiles = {
+        "commute_first": {"weightings": {"location_1": 50}},
+        "cheap": {"weightings": {"average_price": 50}},
+        "wide_commute": {"ranges": {"location_1": (0, 120)}},
+    }
+    current, commute_first, cheap, wide_commute = engine.rank(profiles, top_k=2)
+
+    assert current.name == "current" and current.entered_top == 0
+    assert commute_first.top[0].id == "1"
+    assert cheap.top[0].id == "2"
+    assert cheap.top[0].movement == cheap.top[0].baseline_rank - 1
+    assert wide_commute.top[0].score != current.top[0].score
@@ -0,0 +1,62 @@
+import pytest
+
+from src.scraping.RateLimiter import RateLimiter
+
+URL = "https://www.spareroom.co.uk/flatshare/"
+
+
+def make_limiter(**overrides) -> RateLimiter:
+    settings = dict(
+        requests_per_second=0,
+        burst=1,
+        min_concurrency=1,
+        max_concurrency=8,
+        target_latency_seconds=0,
+        max_retries=2,
+        backoff_seconds=0.001,
+        max_backoff_seconds=0.001,
+        timeout_seconds=10
+    )
+    settings.update(overrides)
+    return RateLimiter(**settings)
+
+
+def test_retries_throttled_responses_then_returns_success():
+    limiter = make_limiter()
+    statuses = iter([429, 503, 200])
+    assert limiter.call(URL, lambda: next(statuses), status=lambda s: s) == 200
+    assert (limiter.requests, limiter.retries, limiter.throttled) == (3, 2, 2)
+
+
+def test_raises_once_retries_are_used_up():
+    limiter = make_limiter()
+
+    def fail():
+        raise ConnectionError("boom")
+
+    with pytest.raises(ConnectionError):
+        limiter.call(URL, fail, status=lambda s: s)
+    assert limiter.failed == 3
+
+
+def test_concurrency_grows_on_success_and_halves_on_throttle():
+    limiter = make_limiter(min_concurrency=1, max_concurrency=8)
+    for _ in range(10):
+        limiter.call(URL, lambda: 200, status=lambda s: s)
+    grown = limiter._hosts["www.spareroom.co.uk"].limit
+    assert grown > 3
+
+    limiter.call(URL, lambda: 429, status=lambda s: s)
+    assert limiter._hosts["www.spareroom.co.uk"].limit < grown / 2 + 1
+
+
+def test_concurrency_starts_at_the_maximum():
+    limiter = make_limiter(min_concurrency=1, max_concurrency=4)
+    assert [limiter._try_acquire("host") for _ in range(5)] == [0, 0, 0, 0, pytest.approx(0.05)]
+
+
+def test_token_bucket_spaces_out_requests():
+    limiter = make_limiter(requests_per_second=100, burst=1)
+    assert limiter._try_acquire("host") == 0
+    limiter._release("host", 0, throttled=False, failed=False)
+    assert limiter._try_acquire("host") > 0
@@ -0,0 +1,37 @@
+from datetime import date
+from pathlib import Path
+from types import SimpleNamespace
+
+from src.persistence.HtmlCache import HtmlCache
+from src.pipeline.Reprocessor import Reprocessor
+from src.utils.types import Room
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def url(room_id: str) -> str:
+    return f"https://www.spareroom.co.uk/flatshare/flatshare_detail.pl?flatshare_id={room_id}&search_id=1"
+
+
+def test_rebuilds_rooms_from_cached_html_offline(tmp_path):
+    cache = HtmlCache(path=str(tmp_path / "html"), max_mb=10)
+    cache.put("1", (FIXTURES / "listing_double_room.html").read_text())
+    cache.put("2", (FIXTURES / "listing_part_week.html").read_text())
+
+    rooms = [
+        Room(id="1", url=url("1"), status="FAVOURITE", date_added=date(2024, 5, 1), location_1="25 mins"),
+        Room(id="2", url=url("2"), date_added=date(2024, 5, 2)),
+        Room(id="3", url=url("3"), date_added=date(2024, 5, 3), average_price=700),
+    ]
+    db_manager = SimpleNamespace(database=list(rooms))
+
+    Reprocessor(db_manager=db_manager, html_cache=cache, parser="lxml", workers=1).run()
+
+    rebuilt, uncached = db_manager.database
+    # Fields from the page are rebuilt; status, dates and commute times are kept
+    assert rebuilt.id == "1"
+    assert rebuilt.average_price == 951
+    assert rebuilt.location == "51.527312, -0.055341"
+    assert (rebuilt.status, rebuilt.date_added, rebuilt.location_1) == ("FAVOURITE", date(2024, 5, 1), "25 mins")
+    # The part-week room is no longer valid, and the uncached room is left alone
+    assert uncached is rooms[2]
@@ -0,0 +1,51 @@
+import logging
+
+from src.scraping.RequestFilter import ESTIMATED_RESOURCE_BYTES, RequestFilter
+
+
+def make_filter() -> RequestFilter:
+    return RequestFilter(blocked_resource_types=["image", "font"], blocked_domains=[".DoubleClick.net", "hotjar.com"])
+
+
+def test_blocks_by_resource_type_and_domain():
+    request_filter = make_filter()
+
+    assert request_filter.should_block("image", "https://www.spareroom.co.uk/photo.jpg")
+    assert request_filter.should_block("font", "https://fonts.example.com/a.woff2")
+    assert request_filter.should_block("script", "https://doubleclick.net/tag.js")
+    assert request_filter.should_block("xhr", "https://stats.g.DOUBLECLICK.net/collect")
+    assert request_filter.should_block("script", "https://static.hotjar.com/c.js")
+
+    assert not request_filter.should_block("document", "https://www.spareroom.co.uk/flatshare/")
+    assert not request_filter.should_block("script", "https://nothotjar.com/c.js")
+    assert not request_filter.should_block("script", "https://hotjar.com.example.org/c.js")
+
+
+def test_counts_requests_and_sizes():
+    request_filter = make_filter()
+    for resource_type, url in [
+        ("image", "https://www.spareroom.co.uk/1.jpg"),
+        ("image", "https://www.spareroom.co.uk/2.jpg"),
+        ("script", "https://static.hotjar.com/c.js"),
+        ("document", "https://www.spareroom.co.uk/flatshare/"),
+    ]:
+        request_filter.should_block(resource_type, url)
+
+    request_filter.record_response_size({"content-length": "2000"})
+    request_filter.record_response_size({"content-length": "not a number"})
+    request_filter.record_response_size({})
+
+    assert (request_filter.allowed, request_filter.blocked) == (1, 3)
+    assert request_filter.blocked_by_type == {"image": 2, "script": 1}
+    assert request_filter.allowed_bytes == 2000
+    assert request_filter.estimated_bytes_saved == 2 * ESTIMATED_RESOURCE_BYTES["image"] + ESTIMATED_RESOURCE_BYTES["script"]
+
+
+def test_log_labels_bytes_saved_as_an_estimate(caplog):
+    request_filter = make_filter()
+    request_filter.should_block("image", "https://www.spareroom.co.uk/1.jpg")
+
+    with caplog.at_level(logging.INFO):
+        request_filter.log_stats()
+
+    assert "estimated 0.1 MB saved" in caplog.text
@@ -0,0 +1,123 @@
+from types import SimpleNamespace
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+
+from src.scraping.RateLimiter import rate_limiter
+from src.scraping.SpareRoomScraper import KnownListingStop, SpareRoomScraper
+
+DOMAIN = "https://www.spareroom.co.uk"
+PAGE_SIZE = 10
+NEXT_HREF = "search.pl?offset={offset}&search_id=123&sort_by=days_since_placed&mode=list"
+
+
+def results_html(page_index: int, last_page: int) -> str:
+    """A results page with two listings, or no listings past the last page"""
+    ids = [2 * page_index + 1, 2 * page_index + 2] if page_index <= last_page else []
+    items = "".join(f'<li data-listing-url="flatshare_detail.pl?flatshare_id={i}"></li>' for i in ids)
+    return f'<html><body><ul class="listing-results">{items}</ul></body></html>'
+
+
+def page_index_of(url: str) -> int:
+    query = parse_qs(urlsplit(url).query)
+    if "offset" in query:
+        return int(query["offset"][0]) // PAGE_SIZE
+    return int(query.get("page", ["0"])[0])
+
+
+class FakePage:
+    def __init__(self, last_page: int, next_href: str = NEXT_HREF) -> None:
+        self.last_page = last_page
+        self.next_href = next_href
+        self.page_index = 0
+        self.loads: list[str] = []
+        self.context = SimpleNamespace(cookies=lambda: [{"name": "session", "value": "abc"}])
+
+    def select_option(self, selector: str, value: str) -> None:
+        pass
+
+    def wait_for_selector(self, selector: str) -> None:
+        pass
+
+    def content(self) -> str:
+        return results_html(self.page_index, self.last_page)
+
+    def query_selector(self, selector: str):
+        next_index = self.page_index + 1
+        href = self.next_href.format(offset=next_index * PAGE_SIZE, page=next_index)
+        return SimpleNamespace(get_attribute=lambda name: href)
+
+    def goto(self, url: str, wait_until: str, timeout: float):
+        self.loads.append(url)
+        self.page_index = page_index_of(url)
+        return SimpleNamespace(status=200)
+
+
+class FakeFetcher:
+    def __init__(self, last_page: int, workers: int, missed: set[int] = frozenset()) -> None:
+        self.last_page = last_page
+        self.workers = workers
+        self.missed = missed
+        self.batches: list[list[int]] = []
+        self.cookies: list[dict] = []
+
+    def set_cookies(self, cookies: list[dict]) -> None:
+        self.cookies.extend(cookies)
+
+    def fetch_all(self, urls: list[str]) -> list[Optional[str]]:
+        indexes = [page_index_of(url) for url in urls]
+        self.batches.append(indexes)
+        return [None if i in self.missed else results_html(i, self.last_page) for i in indexes]
+
+
+def listing_ids(urls: list[str]) -> list[int]:
+    return [int(url.rsplit("=", 1)[1]) for url in urls]
+
+
+def test_page_urls_follow_the_learned_template():
+    scraper = SpareRoomScraper(page=FakePage(last_page=5), domain=DOMAIN)
+    template = scraper._learn_page_template()
+
+    assert template[2] == PAGE_SIZE
+    assert scraper._build_page_url(*template, page_index=3) == (
+        f"{DOMAIN}/flatshare/search.pl?offset=30&search_id=123&sort_by=days_since_placed&mode=list"
+    )
+
+
+def test_collects_pages_concurrently_until_the_results_run_out(monkeypatch):
+    monkeypatch.setattr(rate_limiter, "requests_per_second", 0)
+    page = FakePage(last_page=3)
+    fetcher = FakeFetcher(last_page=3, workers=2, missed={2})
+
+    urls = SpareRoomScraper(page=page, domain=DOMAIN, fetcher=fetcher).collect_room_urls(pages=6)
+
+    assert listing_ids(urls) == list(range(1, 9))
+    # Without an early stop every page goes out in one batch, and a missed page is loaded in the browser
+    assert fetcher.batches == [[1, 2, 3, 4, 5]]
+    assert page.loads == [f"{DOMAIN}/flatshare/{NEXT_HREF.format(offset=20)}"]
+    assert fetcher.cookies == [{"name": "session", "value": "abc"}]
+
+
+def test_stops_after_the_batch_that_reaches_known_listings():
+    known = {f"flatshare_detail.pl?flatshare_id={i}" for i in (5, 6)}
+    early_stop = KnownListingStop(is_known=known.__contains__, known_pages=1, known_listings=0)
+    fetcher = FakeFetcher(last_page=10, workers=2)
+
+    urls = SpareRoomScraper(
+        page=FakePage(last_page=10), domain=DOMAIN, fetcher=fetcher, early_stop=early_stop
+    ).collect_room_urls(pages=10)
+
+    # Pages are fetched workers at a time, and page 3 (listings 5 and 6) is all known
+    assert fetcher.batches == [[1, 2]]
+    assert listing_ids(urls) == list(range(1, 7))
+
+
+def test_falls_back_to_clicking_through_without_an_offset(monkeypatch):
+    monkeypatch.setattr(rate_limiter, "requests_per_second", 0)
+    page = FakePage(last_page=2, next_href="search.pl?page={page}&search_id=123")
+    fetcher = FakeFetcher(last_page=2, workers=2)
+
+    urls = SpareRoomScraper(page=page, domain=DOMAIN, fetcher=fetcher).collect_room_urls(pages=3)
+
+    assert listing_ids(urls) == list(range(1, 7))
+    assert fetcher.batches == []
+    assert page.loads[0] == f"{DOMAIN}/flatshare/search.pl?page=1&search_id=123"
@@ -0,0 +1,42 @@
+from src.processing.RoomNormaliser import RoomNormaliser
+
+RAW = {
+    "id": "10000001",
+    "£950_pcm": "(double)",
+    "£220_pw": "(double, ensuite)",
+    "£700_pcm": "(single)(NOW LET)",
+    "deposit": "£1,096.00",
+    "deposit_(room_2)": "£950.00",
+    "bills_included?": "Yes",
+    "furnishings": "Furnished",
+    "garden/patio": "Yes",
+    "balcony/roof_terrace": "No",
+    "broadband_included": " YES ",
+    "living_room": "shared",
+    "#_flatmates": "3",
+    "total_#_rooms": "4 rooms",
+}
+
+
+def test_normalise():
+    room_data = RoomNormaliser().normalise(dict(RAW))
+
+    assert room_data["average_price"] == 951
+    assert room_data["room_sizes"] == ["double", "double"]
+    assert room_data["average_deposit"] == 1023.0
+    assert room_data["bills_included"] is True
+    assert room_data["furnishings"] is True
+    assert room_data["garden_or_patio"] is True
+    assert room_data["broadband_included"] is True
+    assert room_data["number_of_flatmates"] == 3
+    # Values that can't be cast or converted are kept as scraped
+    assert room_data["total_number_of_rooms"] == "4 rooms"
+    assert room_data["balcony_or_roof_terrace"] == "No"
+    # Scraped field names are kept alongside the standard ones
+    assert room_data["bills_included?"] == "Yes"
+
+
+def test_normalise_batch_matches_normalise():
+    rooms = [dict(RAW), {**RAW, "£220_pw": "(single)", "#_housemates": "1"}]
+    expected = [RoomNormaliser().normalise(dict(room)) for room in rooms]
+    assert RoomNormaliser().normalise_batch(rooms) == expected
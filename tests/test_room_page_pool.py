@@ -0,0 +1,137 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+import src.scraping.RoomPagePool as room_page_pool
+from src.scraping.RoomPagePool import RoomPagePool
+from src.scraping.RateLimiter import rate_limiter
+from src.pipeline.NewRoomProcessor import NewRoomProcessor
+from tests.test_new_room_processor import DOMAIN, FakePage, listing
+
+
+class FakeAsyncPage:
+    def __init__(self, browser) -> None:
+        self.browser = browser
+        self.url = None
+
+    async def goto(self, url: str, timeout: float):
+        self.browser.threads.add(threading.get_ident())
+        # Later URLs load faster, so the workers finish out of order
+        await asyncio.sleep(0.01 / int(url.rsplit("/", 1)[1]))
+        if url in self.browser.dead_urls:
+            raise TimeoutError("page load timed out")
+        self.url = url
+        return SimpleNamespace(status=200)
+
+    async def content(self) -> str:
+        return f"<html>{self.url}</html>"
+
+
+class FakeContext:
+    def __init__(self, browser) -> None:
+        self.browser = browser
+        self.closed = False
+
+    async def new_page(self) -> FakeAsyncPage:
+        return FakeAsyncPage(self.browser)
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self, dead_urls: set[str] = frozenset(), broken: bool = False) -> None:
+        self.dead_urls = dead_urls
+        self.broken = broken
+        self.contexts: list[FakeContext] = []
+        self.threads: set[int] = set()
+        self.closed = False
+
+    async def new_context(self) -> FakeContext:
+        if self.broken:
+            raise RuntimeError("browser crashed")
+        context = FakeContext(self)
+        self.contexts.append(context)
+        return context
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def browser(monkeypatch):
+    monkeypatch.setattr(rate_limiter, "requests_per_second", 0)
+    monkeypatch.setattr(rate_limiter, "max_backoff_seconds", 0)
+
+    browser = FakeBrowser()
+
+    async def launch(headless: bool) -> FakeBrowser:
+        return browser
+
+    class FakePlaywright:
+        chromium = SimpleNamespace(launch=launch)
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc_info):
+            return False
+
+    monkeypatch.setattr(room_page_pool, "async_playwright", FakePlaywright)
+    return browser
+
+
+def test_fetch_all_keeps_url_order(browser):
+    urls = [f"{DOMAIN}/{i}" for i in range(1, 7)]
+
+    assert RoomPagePool(headless=True, workers=3).fetch_all(urls) == [f"<html>{url}</html>" for url in urls]
+
+    # The event loop runs off the caller's thread, and every page and the browser are closed after
+    assert threading.get_ident() not in browser.threads
+    assert len(browser.contexts) == 3
+    assert all(context.closed for context in browser.contexts)
+    assert browser.closed
+
+
+def test_failed_page_is_none_and_other_pages_still_load(browser):
+    urls = [f"{DOMAIN}/{i}" for i in range(1, 5)]
+    browser.dead_urls = {urls[1]}
+
+    html = RoomPagePool(headless=True, workers=2).fetch_all(urls)
+
+    assert html == [f"<html>{urls[0]}</html>", None, f"<html>{urls[2]}</html>", f"<html>{urls[3]}</html>"]
+    assert browser.closed
+
+
+def test_browser_is_closed_when_a_worker_crashes(browser):
+    browser.broken = True
+
+    with pytest.raises(RuntimeError, match="browser crashed"):
+        RoomPagePool(headless=True, workers=2).fetch_all([f"{DOMAIN}/1"])
+    assert browser.closed
+
+
+def test_processor_loads_only_the_missed_pages_on_its_own_page(monkeypatch):
+    monkeypatch.setattr(rate_limiter, "requests_per_second", 0)
+    monkeypatch.setattr(rate_limiter, "max_backoff_seconds", 0)
+
+    page = FakePage(dead_ids=set())
+    room_urls = [listing("1"), listing("2"), listing("3")]
+
+    class FakePool:
+        def fetch_all(self, urls: list[str]) -> list:
+            return [page.content(), None, page.content()]
+
+    processor = NewRoomProcessor(
+        db_manager=SimpleNamespace(database=[], ignored=[]),
+        domain=DOMAIN,
+        page_pool=FakePool(),
+        parser="lxml",
+        commute_service=SimpleNamespace(API_KEY=None)
+    )
+    processor.process_new_rooms(page=page, room_urls=room_urls)
+
+    assert page.loads == [f"{DOMAIN}/{listing('2')}"]
+    assert len(processor.db_manager.database) == 3
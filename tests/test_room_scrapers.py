@@ -0,0 +1,68 @@
+from pathlib import Path
+import pytest
+from src.scraping.RoomScraper import RoomScraper
+from src.scraping.LxmlRoomScraper import LxmlRoomScraper
+from src.scraping.SpareRoomScraper import SpareRoomScraper
+from src.scraping.ExpiryChecker import parse_sidebar_html
+
+FIXTURES = Path(__file__).parent / "fixtures"
+URL = "https://www.spareroom.co.uk/flatshare/flatshare_detail.pl?flatshare_id=10000001&search_id=1"
+LISTINGS = ["listing_double_room.html", "listing_part_week.html", "listing_expired.html"]
+
+
+def read_fixture(name: str) -> str:
+    return (FIXTURES / name).read_text()
+
+
+@pytest.mark.parametrize("fixture", LISTINGS)
+def test_lxml_scraper_matches_bs4_scraper(fixture):
+    html = read_fixture(fixture)
+    expected = RoomScraper(page=None, url=URL, html=html).scrape_data()
+    actual = LxmlRoomScraper(page=None, url=URL, html=html).scrape_data()
+    assert actual == expected
+
+
+@pytest.mark.parametrize(
+    "fixture, expected",
+    [
+        ("listing_double_room.html", (False, True)),
+        ("listing_part_week.html", (False, True)),
+        ("listing_expired.html", (True, False)),
+    ]
+)
+def test_parse_sidebar(fixture, expected):
+    html = read_fixture(fixture)
+    assert RoomScraper(page=None, url=URL, html=html).parse_sidebar() == expected
+    assert LxmlRoomScraper(page=None, url=URL, html=html).parse_sidebar() == expected
+
+
+def test_lxml_scraper_fields():
+    room_data = LxmlRoomScraper(page=None, url=URL, html=read_fixture("listing_double_room.html")).scrape_data()
+    assert room_data["id"] == "10000001"
+    assert room_data["area"] == "Bethnal Green"
+    assert room_data["nearest_station"] == "Bethnal Green"
+    assert room_data["£700_pcm"] == "(single)(NOW LET)"
+    assert room_data["coordinates"] == (51.527312, -0.055341)
+    assert room_data["poster_type"] == "(Current flatmate)"
+    assert room_data["collective_word_count"] == 4
+
+
+def test_part_week_listing():
+    room_data = LxmlRoomScraper(page=None, url=URL, html=read_fixture("listing_part_week.html")).scrape_data()
+    assert room_data["available_all_week"] is False
+    assert room_data["poster_type"] == "(Live out landlord)"
+
+
+def test_parse_room_urls_keeps_page_order():
+    urls = SpareRoomScraper.parse_room_urls(read_fixture("search_results.html"))
+    ids = [url.split("flatshare_id=")[1].split("&")[0] for url in urls]
+    assert ids == [
+        "10000001", "10000002", "10000004", "10000005", "10000006",
+        "10000007", "10000008", "10000009", "10000010", "10000001",
+    ]
+
+
+@pytest.mark.parametrize("fixture", LISTINGS)
+def test_parse_sidebar_html_matches_parse_sidebar(fixture):
+    html = read_fixture(fixture)
+    assert parse_sidebar_html(html) == RoomScraper(page=None, url=URL, html=html).parse_sidebar()
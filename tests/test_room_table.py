@@ -0,0 +1,62 @@
+from datetime import date, datetime
+
+import pytest
+
+from src.utils.RoomTable import RoomTable
+from src.utils.types import CompactRoom, Room
+
+ROOMS = [
+    Room(
+        status="FAVOURITE",
+        url="flatshare/1",
+        id="1",
+        date_added=date(2024, 5, 1),
+        area="Hackney",
+        location="51.5456, -0.0553",
+        location_1="32 mins",
+        average_price=850,
+        bills_included=True,
+        room_sizes=["double", "single"],
+        score=12.5,
+        poster_type="Live out landlord",
+        last_checked=datetime(2024, 5, 2, 9, 30)
+    ),
+    Room(url="flatshare/2", id="2", date_added=date(2024, 5, 3), area="Hackney", room_sizes=["double"]),
+    # What the normaliser leaves when a value can't be converted
+    Room(
+        url="flatshare/3",
+        id="3",
+        date_added=date(2024, 5, 4),
+        average_deposit=1023.5,
+        furnishings="ask",
+        living_room=True,
+        balcony_or_roof_terrace="No",
+        number_of_flatmates="3+",
+        total_number_of_rooms=4,
+        room_sizes=["single"]
+    ),
+]
+
+
+def test_compact_room_round_trips():
+    for room in ROOMS:
+        assert CompactRoom.from_room(room).to_room() == room
+
+
+def test_room_table_round_trips_and_shares_categories():
+    table = RoomTable.from_rooms(ROOMS)
+    assert len(table) == 3
+    assert table.to_rooms() == ROOMS
+    assert table.column("area") == ["Hackney", "Hackney", None]
+    assert table.column("balcony_or_roof_terrace") == [None, None, "No"]
+    assert list(table.column("average_price"))[0] == 850
+    assert [row.id for row in table.where(lambda row: row.bills_included)] == ["1"]
+
+
+def test_room_table_rejects_non_bools_in_bool_columns():
+    with pytest.raises(TypeError):
+        RoomTable.from_rooms([Room(id="1", direct_line_to_office="Yes")])
+
+
+def test_date_added_defaults_to_today_when_created():
+    assert Room().date_added == date.today()
@@ -0,0 +1,36 @@
+from urllib.parse import parse_qs, urlsplit
+
+from src.scraping.SearchUrlBuilder import SearchUrlBuilder
+from src.utils.types import SearchCriteria
+
+DOMAIN = "https://www.spareroom.co.uk"
+
+
+def test_builds_results_url_from_criteria():
+    url = SearchUrlBuilder(domain=DOMAIN).build(SearchCriteria(location="London", min_rent=200, max_rent=1000))
+    parts = urlsplit(url)
+    params = parse_qs(parts.query)
+
+    assert f"{parts.scheme}://{parts.netloc}{parts.path}" == f"{DOMAIN}/flatshare/search.pl"
+    assert params["search"] == ["London"]
+    assert params["min_rent"] == ["200"]
+    assert params["max_rent"] == ["1000"]
+    assert params["room_types"] == ["double"]
+    assert params["days_of_wk_available"] == ["7 days"]
+    assert params["min_term"] == ["6"]
+
+
+def test_disabled_filters_are_left_out():
+    criteria = SearchCriteria(
+        location="Hackney, London",
+        min_rent=0,
+        max_rent=900,
+        double_room_only=False,
+        whole_week_only=False,
+        photos_only=False,
+        private_landlords_only=False,
+        min_term_months=0
+    )
+    params = parse_qs(urlsplit(SearchUrlBuilder(domain=DOMAIN).build(criteria)).query)
+    assert params["search"] == ["Hackney, London"]
+    assert not {"room_types", "days_of_wk_available", "photoads_only", "landlord", "min_term"} & params.keys()
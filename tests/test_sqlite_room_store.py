@@ -0,0 +1,105 @@
+import pickle
+import sqlite3
+from datetime import date, datetime
+
+import pytest
+
+from src.persistence.SqliteRoomStore import SqliteRoomStore
+from src.utils.types import Room
+
+
+def make_room(room_id: str, **overrides) -> Room:
+    room = Room(
+        url=f"flatshare/{room_id}",
+        id=room_id,
+        date_added=date(2024, 5, 1),
+        available_all_week=True,
+        bills_included=False,
+        average_price=850,
+        room_sizes=["double", "single"],
+        score=12.5,
+        last_checked=datetime(2024, 5, 2, 9, 30)
+    )
+    for name, value in overrides.items():
+        setattr(room, name, value)
+    return room
+
+
+def test_round_trips_rooms_and_migrates_the_pickle(tmp_path):
+    pickle_path = tmp_path / "rooms.pkl"
+    rooms = [
+        make_room("1", nearby_stations=["Bank", "Monument"]),
+        make_room("2", status="FAVOURITE", bills_included=None)
+    ]
+    pickle_path.write_bytes(pickle.dumps(rooms))
+
+    store = SqliteRoomStore(path=str(tmp_path / "rooms.sqlite3"), migrate_from=str(pickle_path))
+    assert store.load() == rooms
+
+
+def test_save_writes_only_changed_rooms(tmp_path):
+    path = str(tmp_path / "rooms.sqlite3")
+    store = SqliteRoomStore(path=path)
+    store.load()
+    store.save([make_room("1"), make_room("2"), make_room("3")])
+
+    store = SqliteRoomStore(path=path)
+    rooms = store.load()
+    rooms[1].status = "MESSAGED"
+    del rooms[2]
+    rooms.append(make_room("4"))
+
+    # Count the rows each statement touches
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE writes (room_id TEXT);
+        CREATE TRIGGER on_insert AFTER INSERT ON rooms BEGIN INSERT INTO writes VALUES (new.id); END;
+        CREATE TRIGGER on_update AFTER UPDATE ON rooms BEGIN INSERT INTO writes VALUES (new.id); END;
+        CREATE TRIGGER on_delete AFTER DELETE ON rooms BEGIN INSERT INTO writes VALUES (old.id); END;
+    """)
+    conn.close()
+
+    store.save(rooms)
+
+    conn = sqlite3.connect(path)
+    assert sorted(row[0] for row in conn.execute("SELECT room_id FROM writes")) == ["2", "3", "4"]
+    conn.close()
+    assert [room.status for room in SqliteRoomStore(path=path).load()] == ["", "MESSAGED", ""]
+
+
+def test_keeps_strings_in_bool_fields(tmp_path):
+    pickle_path = tmp_path / "rooms.pkl"
+    rooms = [make_room("1", balcony_or_roof_terrace="No", furnishings="ask", living_room=True)]
+    pickle_path.write_bytes(pickle.dumps(rooms))
+
+    store = SqliteRoomStore(path=str(tmp_path / "rooms.sqlite3"), migrate_from=str(pickle_path))
+    loaded = store.load()
+    assert loaded == rooms
+    assert loaded[0].balcony_or_roof_terrace == "No"
+    assert loaded[0].living_room is True
+
+
+def test_read_only_store_never_writes(tmp_path):
+    pickle_path = tmp_path / "rooms.pkl"
+    path = tmp_path / "rooms.sqlite3"
+    rooms = [make_room("1"), make_room("2")]
+    pickle_path.write_bytes(pickle.dumps(rooms))
+
+    # Before the migration, the pickle is read and no database is created
+    assert SqliteRoomStore(path=str(path), migrate_from=str(pickle_path), read_only=True).load() == rooms
+    assert not path.exists()
+
+    SqliteRoomStore(path=str(path), migrate_from=str(pickle_path)).load()
+    conn = sqlite3.connect(path)
+    conn.execute("ALTER TABLE rooms DROP COLUMN image_url")
+    conn.close()
+    before = path.read_bytes()
+
+    # A table from before a field was added is read as it is, not upgraded
+    store = SqliteRoomStore(path=str(path), read_only=True)
+    loaded = store.load()
+    assert [room.id for room in loaded] == ["1", "2"]
+    assert loaded[0].image_url is None
+    with pytest.raises(RuntimeError):
+        store.save(loaded)
+    assert path.read_bytes() == before
@@ -0,0 +1,55 @@
+from src.processing.RoomEnricher import RoomEnricher
+from src.processing.StationIndex import StationIndex, normalise_name
+
+LINES = {
+    "jubilee": ["St. John's Wood", "Baker Street", "Canary Wharf", "Stratford"],
+    "central": ["Bethnal Green", "Stratford", "Tottenham Court Road"],
+    "elizabeth": ["Canary Wharf", "Tottenham Court Road", "Woolwich"],
+}
+ALIASES = {"Kings Cross": "Baker Street"}
+
+
+def test_normalise_name():
+    assert normalise_name("St. John's Wood") == normalise_name("Saint Johns Wood") == "st johns wood"
+    assert normalise_name("Canning Town Underground Station") == "canning town"
+    assert normalise_name("Elephant & Castle") == "elephant and castle"
+
+
+def test_lookup():
+    index = StationIndex(lines=LINES, aliases=ALIASES)
+
+    assert index.lookup("St John's Wood").name == "St. John's Wood"
+    assert index.lookup("Baker St").lines == {"jubilee"}
+    assert index.lookup("Stratford").lines == {"jubilee", "central"}
+    assert index.lookup("kings cross").name == "Baker Street"
+    assert index.lookup("Totenham Court Rd").name == "Tottenham Court Road"
+    assert index.lookup("Woolwich Arsenal") is None
+    assert index.lookup(None) is None
+
+    assert index.stats == {"exact": 3, "alias": 1, "fuzzy": 1, "missed": 1}
+    assert index.miss_rate == 1 / 6
+    assert index.missed == {"Woolwich Arsenal": 1}
+
+
+def test_direct_line_uses_target_lines_per_destination():
+    index = StationIndex(lines=LINES, aliases=ALIASES)
+    enricher = RoomEnricher(
+        commute_service=None,
+        stations=index,
+        target_lines={"location_1": ["jubilee"], "location_2": ["elizabeth"]}
+    )
+
+    assert enricher._is_direct(index.lookup("St Johns Wood"))
+    assert enricher._is_direct(index.lookup("Woolwich"))
+    assert not enricher._is_direct(index.lookup("Bethnal Green"))
+    assert not enricher._is_direct(index.lookup(""))
+    assert not enricher._is_direct(None)
+
+
+def test_fuzzy_lookup_rejects_other_places_containing_a_station_name():
+    index = StationIndex(lines={"elizabeth": ["Reading"], "northern": ["Kentish Town", "Hampstead"]}, aliases={})
+
+    assert index.lookup("Reading West") is None
+    assert index.lookup("Kentish Town West") is None
+    assert index.lookup("Hampstead Heath") is None
+    assert index.lookup("Kentsh Town").name == "Kentish Town"
@@ -0,0 +1,73 @@
+import math
+import random
+
+from src.processing.RoomEnricher import RoomEnricher
+from src.processing.StationIndex import StationIndex
+from src.processing.StationLocator import StationLocator, _project, walk_minutes
+from src.utils.types import Room, coordinates
+
+STATIONS = {
+    "Baker Street": [51.5226, -0.1571],
+    "Bond Street": [51.5142, -0.1494],
+    "Oxford Circus": [51.5152, -0.1419],
+    "Canary Wharf": [51.5035, -0.0195],
+    "Stratford": [51.5416, -0.0033],
+    "Wimbledon": [51.4214, -0.2064],
+}
+
+
+def test_nearest_matches_brute_force():
+    locator = StationLocator(STATIONS)
+    rng = random.Random(0)
+    for _ in range(200):
+        latitude, longitude = rng.uniform(51.3, 51.7), rng.uniform(-0.4, 0.2)
+        point = _project(latitude, longitude)
+        expected = sorted(STATIONS, key=lambda name: math.dist(point, _project(*STATIONS[name])))[:3]
+        assert [name for name, _ in locator.nearest(latitude, longitude, k=3)] == expected
+
+
+def test_locate():
+    locator = StationLocator(STATIONS, destinations={"location_1": coordinates(51.5054, -0.0235)}, nearby_count=2)
+    fields = locator.locate(51.5150, -0.1480)
+
+    assert fields["closest_station"] == "Bond Street"
+    assert fields["nearby_stations"] == ["Bond Street", "Oxford Circus"]
+    assert fields["station_walk_minutes"] == walk_minutes(locator.nearest(51.5150, -0.1480)[0][1])
+    assert 8.5 < fields["location_1_distance_km"] < 9.0
+    assert "location_2_distance_km" not in fields
+    assert walk_minutes(1.0) == 16
+
+
+def test_enrich_rooms_fills_only_missing_rooms():
+    locator = StationLocator(STATIONS)
+    rooms = [
+        Room(id="1", url="1", location="51.5420, -0.0040"),
+        Room(id="2", url="2", location="51.5420, -0.0040", closest_station="Baker Street"),
+        Room(id="3", url="3"),
+    ]
+
+    assert locator.enrich_rooms(rooms) == 1
+    assert rooms[0].closest_station == "Stratford"
+    assert rooms[1].closest_station == "Baker Street"
+    assert rooms[2].closest_station is None
+
+
+def test_direct_line_falls_back_to_closest_station():
+    stations = StationIndex(lines={"jubilee": ["Canary Wharf"]}, aliases={})
+    enricher = RoomEnricher(
+        commute_service=type("NoCommutes", (), {"API_KEY": None})(),
+        stations=stations,
+        target_lines={"location_1": ["jubilee"]},
+        locator=StationLocator(STATIONS),
+        max_walk_minutes=15
+    )
+
+    def room_data(station, latitude, longitude):
+        return {"nearest_station": station, "coordinates": coordinates(latitude, longitude)}
+
+    assert enricher.enrich(room_data("Somewhere Unknown", 51.5040, -0.0200))["direct_line_to_office"]
+    assert not enricher.enrich(room_data("Somewhere Unknown", 51.5400, -0.0100))["direct_line_to_office"]
+
+    # Only the scraped names count as lookups, so the miss rate isn't diluted by the fallback
+    assert stations.stats == {"missed": 2}
+    assert stations.miss_rate == 1.0
@@ -0,0 +1,47 @@
+import json
+
+from src.persistence.DatabaseManager import DatabaseManager
+from src.persistence.ExportState import ExportState
+from src.utils.types import Room
+
+
+def make_manager(tmp_path) -> DatabaseManager:
+    manager = DatabaseManager(
+        check_for_expired_rooms=False,
+        database_path=str(tmp_path / "rooms.pkl"),
+        output_path=str(tmp_path / "database.xlsx"),
+        ignored_ids_path=str(tmp_path / "ignored_ids.json"),
+        favourite_ids_path=str(tmp_path / "favourite_ids.json"),
+        messaged_ids_path=str(tmp_path / "messaged_ids.json"),
+        export_state=ExportState(path=str(tmp_path / "export_state.json"))
+    )
+    manager.load()
+    return manager
+
+
+def test_status_keywords_update_id_lists(tmp_path):
+    manager = make_manager(tmp_path)
+    manager.database = [Room(id=room_id) for room_id in "1234"]
+
+    manager._update_id_lists([("1", "IGNORE"), ("2", "f"), ("3", "Messaged"), ("4", None), ("2", "keep")])
+    manager._apply_statuses_to_database()
+
+    assert manager.ignored == {"1"}
+    assert json.loads((tmp_path / "favourite_ids.json").read_text()) == ["2"]
+    assert [(room.id, room.status) for room in manager.database] == [("2", "FAVOURITE"), ("3", "MESSAGED"), ("4", "")]
+
+
+def test_skips_reading_an_unchanged_spreadsheet(tmp_path):
+    manager = make_manager(tmp_path)
+    output = tmp_path / "database.xlsx"
+    output.write_bytes(b"exported")
+    assert manager._output_changed_since_sync()
+
+    manager.export_state.record(str(output), fingerprint="rows")
+    assert not manager._output_changed_since_sync()
+
+    # A fresh run reads the same record the exporter left
+    assert not make_manager(tmp_path)._output_changed_since_sync()
+
+    output.write_bytes(b"edited!!")
+    assert manager._output_changed_since_sync()